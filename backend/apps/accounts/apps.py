@@ -5,3 +5,7 @@ class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.accounts'
     verbose_name = 'حساب‌های کاربری'
+    
+    def ready(self):
+        """Import signals when app is ready"""
+        import apps.accounts.signals
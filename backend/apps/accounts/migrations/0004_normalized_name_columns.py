@@ -0,0 +1,59 @@
+# Generated by Django 5.0 on 2026-10-18 00:17
+
+from django.db import migrations, models
+
+from apps.core.text import normalize_persian
+
+
+def fill_normalized_columns(apps, schema_editor):
+    """پر کردن ستون‌های یکسان‌سازی‌شده برای رکوردهای موجود"""
+    User = apps.get_model('accounts', 'User')
+    user_rows = list(User.objects.all())
+    for row in user_rows:
+        row.first_name_normalized = normalize_persian(row.first_name)
+        row.last_name_normalized = normalize_persian(row.last_name)
+    User.objects.bulk_update(user_rows, ['first_name_normalized', 'last_name_normalized'], batch_size=500)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """ایندکس trigram برای جستجوی زیررشته (فقط PostgreSQL)"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS user_first_name_normalized_trgm_idx '
+        'ON accounts_user USING gin (first_name_normalized gin_trgm_ops)'
+    )
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS user_last_name_normalized_trgm_idx '
+        'ON accounts_user USING gin (last_name_normalized gin_trgm_ops)'
+    )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS user_first_name_normalized_trgm_idx')
+    schema_editor.execute('DROP INDEX IF EXISTS user_last_name_normalized_trgm_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_alter_user_managers'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='first_name_normalized',
+            field=models.CharField(blank=True, editable=False, max_length=100, verbose_name='نام (یکسان\u200cسازی\u200cشده)'),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='last_name_normalized',
+            field=models.CharField(blank=True, editable=False, max_length=100, verbose_name='نام خانوادگی (یکسان\u200cسازی\u200cشده)'),
+        ),
+        migrations.RunPython(fill_normalized_columns, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -1,5 +1,9 @@
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.db import models
+from django.utils.functional import cached_property
+
+from apps.core.text import NormalizedFieldsMixin
+from apps.accounts.permission_scope import get_permission_scope
 
 
 class UserManager(BaseUserManager):
@@ -29,7 +33,7 @@ class UserManager(BaseUserManager):
         return self.create_user(national_id, email, password, **extra_fields)
 
 
-class User(AbstractUser):
+class User(NormalizedFieldsMixin, AbstractUser):
     """
     مدل سفارشی کاربر با استفاده از کد ملی به جای username
     """
@@ -51,6 +55,18 @@ class User(AbstractUser):
     )
     first_name = models.CharField(max_length=100, verbose_name="نام")
     last_name = models.CharField(max_length=100, verbose_name="نام خانوادگی")
+    first_name_normalized = models.CharField(
+        max_length=100,
+        blank=True,
+        editable=False,
+        verbose_name="نام (یکسان‌سازی‌شده)"
+    )
+    last_name_normalized = models.CharField(
+        max_length=100,
+        blank=True,
+        editable=False,
+        verbose_name="نام خانوادگی (یکسان‌سازی‌شده)"
+    )
     father_name = models.CharField(
         max_length=100,
         blank=True,
@@ -125,6 +141,11 @@ class User(AbstractUser):
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="تاریخ ایجاد")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="تاریخ بروزرسانی")
     
+    NORMALIZED_FIELDS = {
+        'first_name_normalized': 'first_name',
+        'last_name_normalized': 'last_name',
+    }
+    
     USERNAME_FIELD = 'national_id'
     REQUIRED_FIELDS = ['first_name', 'last_name', 'mobile', 'email']
     
@@ -211,6 +232,16 @@ class AdminPermission(models.Model):
     def __str__(self):
         return f"دسترسی‌های {self.user.get_full_name()}"
     
+    @cached_property
+    def scope(self):
+        """
+        محدوده دسترسی حل‌شده (apps.accounts.permission_scope)
+
+        یک بار برای هر شیء (یعنی هر درخواست) از cache خوانده می‌شود؛ بررسی‌های زیر
+        پس از آن کوئری جدیدی اجرا نمی‌کنند.
+        """
+        return get_permission_scope(self)
+    
     def is_university_admin(self):
         """آیا مسئول دانشگاه است؟"""
         return self.user.role == 'UNIVERSITY_ADMIN' or self.has_full_access
@@ -221,52 +252,33 @@ class AdminPermission(models.Model):
     
     def has_access_to_round_type(self, round_type):
         """بررسی دسترسی به نوع فراخوان"""
-        if self.has_full_access:
-            return True
-        
-        access_map = {
-            'MA_TALENT': self.has_ma_talent_access,
-            'PHD_TALENT': self.has_phd_talent_access,
-            'PHD_EXAM': self.has_phd_exam_access,
-            'OLYMPIAD': self.has_olympiad_access,
-        }
-        
-        return access_map.get(round_type, False)
+        return self.scope.has_access_to_round_type(round_type)
     
     def has_access_to_faculty(self, faculty):
-        """بررسی دسترسی به دانشکده (برای مسئول دانشکده)"""
-        if self.has_full_access:
-            return True
-        
-        # مسئول دانشگاه به همه دانشکده‌ها دسترسی دارد
-        if self.is_university_admin():
-            return True
-        
-        # مسئول دانشکده فقط به دانشکده‌های خودش دسترسی دارد
-        if self.is_faculty_admin():
-            # اگر هیچ دانشکده‌ای انتخاب نشده = دسترسی به همه
-            if not self.faculties.exists():
-                return True
-            return self.faculties.filter(id=faculty.id).exists()
-        
-        return False
+        """بررسی دسترسی به دانشکده (faculty: شیء Faculty یا شناسه آن)"""
+        return self.scope.has_access_to_faculty(faculty)
 
     def can_review_application(self, application):
         """بررسی دسترسی برای مشاهده/بررسی یک پرونده"""
-        if self.has_full_access:
+        scope = self.scope
+        if scope.has_full_access:
             return True
 
-        if not self.has_access_to_round_type(application.round.type):
+        if not scope.has_access_to_round_type(application.round.type):
             return False
 
-        if self.is_university_admin():
+        if scope.is_university_admin():
             return True
 
-        if self.is_faculty_admin():
-            allowed_faculties = self.faculties.all()
-            if not allowed_faculties.exists():
+        if scope.is_faculty_admin():
+            if scope.faculty_restriction is None:
                 return True
-            return application.choices.filter(program__faculty__in=allowed_faculties).exists()
+            # از انتخاب‌های prefetch شده (در صورت وجود) بدون کوئری جدید
+            if 'choices' in getattr(application, '_prefetched_objects_cache', {}):
+                faculty_ids = {choice.program.faculty_id for choice in application.choices.all()}
+            else:
+                faculty_ids = set(application.choices.values_list('program__faculty_id', flat=True))
+            return scope.allows_any_faculty(faculty_ids)
 
         return False
     
@@ -274,13 +286,14 @@ class AdminPermission(models.Model):
         """دریافت لیست دانشکده‌های مجاز"""
         from apps.core.models import Faculty
         
-        if self.has_full_access or self.is_university_admin():
+        scope = self.scope
+        if scope.has_full_access or scope.is_university_admin():
             return Faculty.objects.filter(is_active=True)
         
-        if self.is_faculty_admin():
-            if not self.faculties.exists():
+        if scope.is_faculty_admin():
+            if not scope.faculty_ids:
                 return Faculty.objects.filter(is_active=True)
-            return self.faculties.filter(is_active=True)
+            return Faculty.objects.filter(id__in=scope.faculty_ids, is_active=True)
         
         return Faculty.objects.none()
 
@@ -0,0 +1,113 @@
+"""
+محدوده دسترسی ادمین (PermissionScope)
+
+نوع فراخوان‌ها و دانشکده‌های مجاز هر ادمین یک بار از AdminPermission خوانده و به
+صورت یک شیء تغییرناپذیر در فضای نام permissions از apps.core.cache نگه‌داری می‌شود؛
+تمام بررسی‌های دسترسی پس از آن فقط جستجو در مجموعه‌های حافظه هستند.
+
+با تغییر AdminPermission، دانشکده‌های آن (m2m) یا نقش کاربر، محدوده پس از commit
+باطل می‌شود (apps.accounts.signals).
+
+محدوده فقط در cache مشترک (Redis؛ در production الزامی است) نگه‌داری می‌شود و L1
+محلی پروسه برای این فضای نام غیرفعال است (CACHE_NAMESPACES['permissions'])؛ پس لغو
+دسترسی بلافاصله پس از commit در همه workerها اعمال می‌شود.
+"""
+from dataclasses import dataclass
+
+from apps.core.cache import namespace
+
+
+# نوع فراخوان -> فیلد دسترسی در AdminPermission (به ترتیب نمایش)
+ROUND_TYPE_ACCESS_FIELDS = {
+    'MA_TALENT': 'has_ma_talent_access',
+    'PHD_TALENT': 'has_phd_talent_access',
+    'PHD_EXAM': 'has_phd_exam_access',
+    'OLYMPIAD': 'has_olympiad_access',
+}
+
+
+def _to_id(value):
+    try:
+        return int(getattr(value, 'pk', value))
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
+class PermissionScope:
+    """
+    محدوده دسترسی حل‌شده یک ادمین
+
+    faculty_ids خالی یعنی محدودیت دانشکده تعریف نشده (دسترسی به همه دانشکده‌ها).
+    """
+    user_id: int
+    role: str
+    has_full_access: bool
+    round_types: frozenset
+    faculty_ids: frozenset
+
+    def is_university_admin(self):
+        return self.role == 'UNIVERSITY_ADMIN' or self.has_full_access
+
+    def is_faculty_admin(self):
+        return self.role == 'FACULTY_ADMIN' or self.has_full_access
+
+    @property
+    def allowed_round_types(self):
+        """انواع فراخوان مجاز به ترتیب ROUND_TYPE_ACCESS_FIELDS"""
+        return [round_type for round_type in ROUND_TYPE_ACCESS_FIELDS if round_type in self.round_types]
+
+    @property
+    def faculty_restriction(self):
+        """شناسه دانشکده‌های مجاز، یا None در صورت دسترسی به همه دانشکده‌ها"""
+        if self.has_full_access or not self.faculty_ids:
+            return None
+        return self.faculty_ids
+
+    def has_access_to_round_type(self, round_type):
+        return self.has_full_access or round_type in self.round_types
+
+    def has_access_to_faculty(self, faculty):
+        """faculty می‌تواند شیء Faculty یا شناسه آن باشد"""
+        if self.has_full_access or self.is_university_admin():
+            return True
+        if self.is_faculty_admin():
+            return not self.faculty_ids or _to_id(faculty) in self.faculty_ids
+        return False
+
+    def allows_any_faculty(self, faculty_ids):
+        """آیا حداقل یکی از دانشکده‌ها (مثلاً دانشکده‌های انتخاب‌های یک پرونده) مجاز است؟"""
+        restriction = self.faculty_restriction
+        return restriction is None or not restriction.isdisjoint(faculty_ids)
+
+
+def resolve_permission_scope(admin_permission):
+    """ساخت محدوده دسترسی از AdminPermission (یک کوئری برای دانشکده‌ها)"""
+    return PermissionScope(
+        user_id=admin_permission.user_id,
+        role=admin_permission.user.role,
+        has_full_access=admin_permission.has_full_access,
+        round_types=frozenset(
+            round_type
+            for round_type, field in ROUND_TYPE_ACCESS_FIELDS.items()
+            if admin_permission.has_full_access or getattr(admin_permission, field)
+        ),
+        faculty_ids=frozenset(admin_permission.faculties.values_list('id', flat=True)),
+    )
+
+
+def _scope_key(user_id):
+    return ('scope', user_id)
+
+
+def get_permission_scope(admin_permission):
+    """محدوده دسترسی ادمین از cache (یا ساخت و ذخیره آن)"""
+    return namespace('permissions').get_or_compute(
+        _scope_key(admin_permission.user_id),
+        lambda: resolve_permission_scope(admin_permission),
+    )
+
+
+def invalidate_permission_scope(user_id):
+    """باطل کردن محدوده cache شده یک کاربر"""
+    namespace('permissions').delete(_scope_key(user_id))
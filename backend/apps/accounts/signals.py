@@ -0,0 +1,49 @@
+"""
+Signal handlers for accounts app
+"""
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from apps.accounts.models import User, AdminPermission
+from apps.accounts.permission_scope import invalidate_permission_scope
+
+
+def _invalidate_after_commit(user_id):
+    transaction.on_commit(lambda: invalidate_permission_scope(user_id))
+
+
+@receiver(post_save, sender=AdminPermission)
+@receiver(post_delete, sender=AdminPermission)
+def invalidate_scope_on_permission_change(sender, instance, **kwargs):
+    """تغییر دسترسی‌های ادمین"""
+    _invalidate_after_commit(instance.user_id)
+
+
+@receiver(m2m_changed, sender=AdminPermission.faculties.through)
+def invalidate_scope_on_faculties_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """تغییر دانشکده‌های مجاز (از هر دو سمت رابطه)"""
+    if action not in ('post_add', 'post_remove', 'post_clear', 'pre_clear'):
+        return
+    if not reverse:
+        _invalidate_after_commit(instance.user_id)
+        return
+    # تغییر از سمت دانشکده: instance یک Faculty است
+    if action == 'pre_clear':
+        user_ids = instance.admin_users.values_list('user_id', flat=True)
+    elif action == 'post_clear':
+        return
+    else:
+        user_ids = AdminPermission.objects.filter(pk__in=pk_set or ()).values_list('user_id', flat=True)
+    for user_id in list(user_ids):
+        _invalidate_after_commit(user_id)
+
+
+@receiver(post_save, sender=User)
+def invalidate_scope_on_role_change(sender, instance, created, update_fields=None, **kwargs):
+    """تغییر نقش کاربر (is_university_admin / is_faculty_admin به نقش وابسته است)"""
+    if created:
+        return
+    if update_fields is not None and 'role' not in update_fields:
+        return
+    _invalidate_after_commit(instance.pk)
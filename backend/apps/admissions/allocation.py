@@ -0,0 +1,305 @@
+"""
+موتور تخصیص ظرفیت پذیرش (مجموعه‌محور)
+
+به جای یک کوئری برای هر برنامه و ذخیره تک‌تک رکوردها، تمام انتخاب‌های واجد شرایط
+یک فراخوان در یک کوئری خوانده می‌شوند، رتبه‌بندی در حافظه انجام می‌شود و نتیجه
+به صورت تکه‌ای (bulk_update / update) نوشته می‌شود.
+
+دو روش تخصیص وجود دارد:
+- AllocationEngine: رتبه‌بندی مستقل هر برنامه (یک داوطلب ممکن است در چند برنامه پذیرفته شود)
+- DeferredAcceptanceSolver: تطابق پایدار با پیشنهاد داوطلب بر اساس اولویت انتخاب‌ها
+  (هر داوطلب حداکثر در یک برنامه پذیرفته می‌شود)
+
+زمان هر مرحله (load / rank / write) بر حسب میلی‌ثانیه در خلاصه خروجی برگردانده می‌شود.
+"""
+import heapq
+import time
+from collections import defaultdict, namedtuple
+from contextlib import contextmanager
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.admissions.models import Program
+from apps.applications.models import Application, ApplicationChoice
+from apps.applications.dashboard import schedule_summary_refresh
+from apps.applications.rankings import invalidate_rankings
+
+
+# وضعیت‌هایی از پرونده که در تخصیص ظرفیت شرکت داده می‌شوند
+ELIGIBLE_APPLICATION_STATUSES = [
+    Application.Status.NEW,
+    Application.Status.SUBMITTED,
+    Application.Status.UNDER_UNIVERSITY_REVIEW,
+    Application.Status.APPROVED_BY_UNIVERSITY,
+    Application.Status.UNDER_FACULTY_REVIEW,
+    Application.Status.FACULTY_REVIEW_COMPLETED,
+    Application.Status.COMPLETED,
+]
+
+WRITE_CHUNK_SIZE = 1000
+
+
+Candidate = namedtuple(
+    'Candidate',
+    ['choice_id', 'application_id', 'program_id', 'priority', 'total_score', 'education_score'],
+)
+
+
+def candidate_sort_key(candidate):
+    """ترتیب رتبه‌بندی: امتیاز نهایی نزولی، امتیاز تحصیلی نزولی، اولویت صعودی"""
+    return (-candidate.total_score, -candidate.education_score, candidate.priority)
+
+
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class AllocationEngine:
+    """
+    تخصیص ظرفیت برنامه‌های یک فراخوان
+
+    هر برنامه به صورت مستقل رتبه‌بندی می‌شود: N نفر اول (N = ظرفیت) پذیرفته و بقیه ذخیره می‌شوند.
+    """
+
+    def __init__(self, round_obj, degree_level=Program.DEGREE_MA, chunk_size=WRITE_CHUNK_SIZE):
+        self.round = round_obj
+        self.degree_level = degree_level
+        self.chunk_size = chunk_size
+        self.timings = {}
+
+        self.capacities = {}
+        self.candidates = []
+        # choice_id -> (admission_status, admission_priority_result)
+        self.decisions = {}
+        # application_id -> admission_overall_status
+        self.application_statuses = {}
+
+    @contextmanager
+    def _phase(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = round((time.perf_counter() - started) * 1000, 2)
+
+    def load(self):
+        """خواندن ظرفیت برنامه‌ها و تمام انتخاب‌های واجد شرایط در دو کوئری"""
+        self.capacities = dict(
+            Program.objects.filter(
+                round=self.round,
+                degree_level=self.degree_level,
+                is_active=True,
+            ).values_list('id', 'capacity')
+        )
+
+        rows = ApplicationChoice.objects.filter(
+            program__round=self.round,
+            program__degree_level=self.degree_level,
+            program__is_active=True,
+            application__status__in=ELIGIBLE_APPLICATION_STATUSES,
+        ).values_list(
+            'id',
+            'application_id',
+            'program_id',
+            'priority',
+            'application__total_score',
+            'application__education_scoring__total_score',
+        )
+
+        self.candidates = [
+            Candidate(choice_id, app_id, program_id, priority, total or 0, edu or 0)
+            for choice_id, app_id, program_id, priority, total, edu in rows.iterator(chunk_size=self.chunk_size)
+        ]
+
+    def rank(self):
+        """رتبه‌بندی داخل هر برنامه و تعیین پذیرفته‌شدگان و ذخیره‌ها"""
+        by_program = defaultdict(list)
+        for candidate in self.candidates:
+            by_program[candidate.program_id].append(candidate)
+
+        self.decisions = {}
+        self.application_statuses = {}
+        for program_id, program_candidates in by_program.items():
+            program_candidates.sort(key=candidate_sort_key)
+            capacity = self.capacities.get(program_id) or 0
+
+            for idx, candidate in enumerate(program_candidates[:capacity], start=1):
+                self.decisions[candidate.choice_id] = ('ACCEPTED', idx)
+                self.application_statuses[candidate.application_id] = 'ADMITTED'
+
+            for candidate in program_candidates[capacity:]:
+                self.decisions[candidate.choice_id] = ('WAITING', None)
+
+    def write(self):
+        """
+        نوشتن نتیجه به صورت تکه‌ای
+
+        انتخاب‌هایی که اولویت در نتیجه دارند با bulk_update نوشته می‌شوند؛
+        بقیه انتخاب‌ها و پرونده‌ها بر اساس مقدار یکسان گروه‌بندی و با update روی id__in نوشته می‌شوند.
+        """
+        ranked = []
+        grouped_choices = defaultdict(list)
+        for choice_id, (choice_status, result) in self.decisions.items():
+            if result is None:
+                grouped_choices[choice_status].append(choice_id)
+            else:
+                ranked.append(ApplicationChoice(
+                    id=choice_id,
+                    admission_status=choice_status,
+                    admission_priority_result=result,
+                ))
+
+        grouped_applications = defaultdict(list)
+        for application_id, overall_status in self.application_statuses.items():
+            grouped_applications[overall_status].append(application_id)
+
+        published_at = timezone.now()
+
+        with transaction.atomic():
+            ApplicationChoice.objects.bulk_update(
+                ranked,
+                ['admission_status', 'admission_priority_result'],
+                batch_size=self.chunk_size,
+            )
+            for choice_status, choice_ids in grouped_choices.items():
+                for chunk in _chunks(choice_ids, self.chunk_size):
+                    ApplicationChoice.objects.filter(id__in=chunk).update(
+                        admission_status=choice_status,
+                        admission_priority_result=None,
+                    )
+            for overall_status, application_ids in grouped_applications.items():
+                for chunk in _chunks(sorted(application_ids), self.chunk_size):
+                    Application.objects.filter(id__in=chunk).update(
+                        admission_overall_status=overall_status,
+                        admission_result_published_at=published_at,
+                    )
+            # update/bulk_update سیگنال ندارند؛ وضعیت انتخاب‌ها در گزارش پذیرش cache شده است
+            transaction.on_commit(invalidate_rankings)
+            schedule_summary_refresh(self.application_statuses)
+
+    def run(self, dry_run=False):
+        """
+        اجرای کامل تخصیص
+
+        در حالت dry_run چیزی در پایگاه داده نوشته نمی‌شود و تخصیص کامل در خروجی برگردانده می‌شود.
+        """
+        with self._phase('load'):
+            self.load()
+        with self._phase('rank'):
+            self.rank()
+        if not dry_run:
+            with self._phase('write'):
+                self.write()
+
+        result = self.summary()
+        result['dry_run'] = dry_run
+        if dry_run:
+            result['assignments'] = self.assignments()
+        return result
+
+    def assignments(self):
+        """تخصیص کامل به تفکیک انتخاب (برای حالت dry_run)"""
+        return [
+            {
+                'application_id': candidate.application_id,
+                'choice_id': candidate.choice_id,
+                'program_id': candidate.program_id,
+                'priority': candidate.priority,
+                'admission_status': self.decisions[candidate.choice_id][0],
+                'admission_priority_result': self.decisions[candidate.choice_id][1],
+                'admission_overall_status': self.application_statuses.get(candidate.application_id, ''),
+            }
+            for candidate in self.candidates
+            if candidate.choice_id in self.decisions
+        ]
+
+    def summary(self):
+        accepted_total = sum(1 for status, _ in self.decisions.values() if status == 'ACCEPTED')
+        return {
+            'programs_processed': len(self.capacities),
+            'choices_loaded': len(self.candidates),
+            'accepted_total': accepted_total,
+            'waiting_total': sum(1 for status, _ in self.decisions.values() if status == 'WAITING'),
+            'rejected_total': sum(1 for status, _ in self.decisions.values() if status == 'REJECTED'),
+            'admitted_applications': sum(1 for status in self.application_statuses.values() if status == 'ADMITTED'),
+            'timings_ms': dict(self.timings),
+        }
+
+
+def program_preference_key(candidate):
+    """کلید برتری داوطلب از دید برنامه (بزرگ‌تر = بهتر)؛ شناسه پرونده برای قطعی بودن نتیجه"""
+    return (candidate.total_score, candidate.education_score, -candidate.application_id)
+
+
+class DeferredAcceptanceSolver(AllocationEngine):
+    """
+    تطابق پایدار (Deferred Acceptance با پیشنهاد داوطلب)
+
+    هر داوطلب به ترتیب ApplicationChoice.priority به برنامه‌ها پیشنهاد می‌دهد؛ هر برنامه
+    بهترین داوطلبان را تا سقف ظرفیت (Program.capacity) نگه می‌دارد و بر اساس total_score
+    و سپس EducationScoring.total_score مقایسه می‌کند. هر انتخاب حداکثر یک بار پیشنهاد
+    می‌شود و هر برنامه یک heap به اندازه ظرفیت دارد، پس هزینه کل O(C·log(capacity)) است.
+
+    نتیجه:
+    - انتخاب پذیرفته شده: ACCEPTED و admission_priority_result برابر اولویت همان انتخاب
+    - انتخاب‌های با اولویت بالاتر (که داوطلب را نپذیرفتند): WAITING
+    - انتخاب‌های با اولویت پایین‌تر: REJECTED
+    - پرونده: ADMITTED در صورت پذیرش، در غیر این صورت WAITING
+    """
+
+    def rank(self):
+        preferences = defaultdict(list)
+        for candidate in self.candidates:
+            preferences[candidate.application_id].append(candidate)
+        for application_choices in preferences.values():
+            application_choices.sort(key=lambda c: c.priority)
+
+        # program_id -> min-heap of (preference_key, candidate); بدترین داوطلب نگه‌داشته‌شده در رأس
+        held = defaultdict(list)
+        next_proposal = dict.fromkeys(preferences, 0)
+        free = list(preferences)
+
+        while free:
+            application_id = free.pop()
+            application_choices = preferences[application_id]
+            index = next_proposal[application_id]
+            if index >= len(application_choices):
+                continue
+
+            candidate = application_choices[index]
+            next_proposal[application_id] = index + 1
+            capacity = self.capacities.get(candidate.program_id) or 0
+            if capacity <= 0:
+                free.append(application_id)
+                continue
+
+            heap = held[candidate.program_id]
+            entry = (program_preference_key(candidate), candidate)
+            if len(heap) < capacity:
+                heapq.heappush(heap, entry)
+            elif entry[0] > heap[0][0]:
+                _, rejected = heapq.heapreplace(heap, entry)
+                free.append(rejected.application_id)
+            else:
+                free.append(application_id)
+
+        matched = {
+            candidate.application_id: candidate
+            for heap in held.values()
+            for _, candidate in heap
+        }
+
+        self.decisions = {}
+        self.application_statuses = {}
+        for application_id, application_choices in preferences.items():
+            match = matched.get(application_id)
+            for candidate in application_choices:
+                if match is None or candidate.priority < match.priority:
+                    self.decisions[candidate.choice_id] = ('WAITING', None)
+                elif candidate.choice_id == match.choice_id:
+                    self.decisions[candidate.choice_id] = ('ACCEPTED', candidate.priority)
+                else:
+                    self.decisions[candidate.choice_id] = ('REJECTED', None)
+            self.application_statuses[application_id] = 'ADMITTED' if match else 'WAITING'
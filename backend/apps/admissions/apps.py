@@ -5,3 +5,7 @@ class AdmissionsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.admissions'
     verbose_name = 'فراخوان‌ها و پذیرش'
+    
+    def ready(self):
+        """Import signals when app is ready"""
+        import apps.admissions.signals
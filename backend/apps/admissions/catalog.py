@@ -0,0 +1,45 @@
+"""
+cache کاتالوگ عمومی رشته‌ها (انتخاب رشته توسط متقاضیان)
+
+برای هر ترکیب (نوع فراخوان، مقطع، دانشکده، گروه) متن JSON آماده پاسخ به همراه
+ETag قوی (sha256 همان متن) نگه‌داری می‌شود؛ پاسخ از cache بدون هیچ کوئری پایگاه
+داده ساخته می‌شود.
+
+کلیدها در فضای نام catalog از apps.core.cache هستند و با ذخیره/حذف Program، Faculty،
+Department یا AdmissionRound (apps.admissions.signals) پس از commit باطل می‌شوند. تغییرات
+با queryset.update() سیگنال ندارند؛ پس از آن‌ها invalidate_catalog را صدا بزنید.
+"""
+import hashlib
+
+from apps.core.cache import namespace
+
+
+# پارامترهای query که کاتالوگ بر اساس آن‌ها تفکیک می‌شود
+CATALOG_PARAMS = ('round_type', 'degree_level', 'faculty_id', 'department_id')
+
+
+def invalidate_catalog():
+    """باطل کردن تمام کاتالوگ‌های cache شده"""
+    namespace('catalog').invalidate()
+
+
+def catalog_filters(query_params):
+    """مقادیر پارامترهای کاتالوگ از query string (پارامتر خالی = بدون فیلتر)"""
+    return {name: query_params.get(name) or None for name in CATALOG_PARAMS}
+
+
+def make_etag(body):
+    return '"{}"'.format(hashlib.sha256(body).hexdigest())
+
+
+def get_catalog(filters, render):
+    """
+    متن و ETag کاتالوگ برای فیلترهای داده‌شده
+
+    render(filters) فقط در صورت نبود در cache صدا زده می‌شود و باید bytes پاسخ را برگرداند.
+    """
+    def build():
+        body = render(filters)
+        return body, make_etag(body)
+
+    return namespace('catalog').get_or_compute([filters[name] for name in CATALOG_PARAMS], build)
@@ -0,0 +1,59 @@
+# Generated by Django 5.0 on 2026-10-18 00:17
+
+from django.db import migrations, models
+
+from apps.core.text import normalize_persian
+
+
+def fill_normalized_columns(apps, schema_editor):
+    """پر کردن ستون‌های یکسان‌سازی‌شده برای رکوردهای موجود"""
+    Program = apps.get_model('admissions', 'Program')
+    program_rows = list(Program.objects.all())
+    for row in program_rows:
+        row.name_normalized = normalize_persian(row.name)
+        row.orientation_normalized = normalize_persian(row.orientation)
+    Program.objects.bulk_update(program_rows, ['name_normalized', 'orientation_normalized'], batch_size=500)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """ایندکس trigram برای جستجوی زیررشته (فقط PostgreSQL)"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS program_name_normalized_trgm_idx '
+        'ON admissions_program USING gin (name_normalized gin_trgm_ops)'
+    )
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS program_orientation_normalized_trgm_idx '
+        'ON admissions_program USING gin (orientation_normalized gin_trgm_ops)'
+    )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS program_name_normalized_trgm_idx')
+    schema_editor.execute('DROP INDEX IF EXISTS program_orientation_normalized_trgm_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admissions', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='program',
+            name='name_normalized',
+            field=models.CharField(blank=True, editable=False, max_length=255, verbose_name='نام رشته (یکسان\u200cسازی\u200cشده)'),
+        ),
+        migrations.AddField(
+            model_name='program',
+            name='orientation_normalized',
+            field=models.CharField(blank=True, editable=False, max_length=255, verbose_name='گرایش (یکسان\u200cسازی\u200cشده)'),
+        ),
+        migrations.RunPython(fill_normalized_columns, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
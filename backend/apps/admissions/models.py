@@ -1,5 +1,6 @@
 from django.db import models
 from apps.core.models import TimeStampedModel, Faculty, Department
+from apps.core.text import NormalizedFieldsMixin
 
 
 class AdmissionRound(TimeStampedModel):
@@ -46,7 +47,7 @@ class AdmissionRound(TimeStampedModel):
         return f"{self.title} - {self.year}"
 
 
-class Program(TimeStampedModel):
+class Program(NormalizedFieldsMixin, TimeStampedModel):
     """
     رشته‌ها و گرایش‌های قابل انتخاب در هر فراخوان
     """
@@ -89,6 +90,18 @@ class Program(TimeStampedModel):
         blank=True,
         verbose_name="گرایش"
     )
+    name_normalized = models.CharField(
+        max_length=255,
+        blank=True,
+        editable=False,
+        verbose_name="نام رشته (یکسان‌سازی‌شده)"
+    )
+    orientation_normalized = models.CharField(
+        max_length=255,
+        blank=True,
+        editable=False,
+        verbose_name="گرایش (یکسان‌سازی‌شده)"
+    )
     bachelor_related_field = models.CharField(
         max_length=255,
         blank=True,
@@ -97,6 +110,11 @@ class Program(TimeStampedModel):
     capacity = models.PositiveIntegerField(default=0, verbose_name="ظرفیت")
     is_active = models.BooleanField(default=True, verbose_name="فعال")
     
+    NORMALIZED_FIELDS = {
+        'name_normalized': 'name',
+        'orientation_normalized': 'orientation',
+    }
+    
     class Meta:
         verbose_name = "برنامه تحصیلی"
         verbose_name_plural = "برنامه‌های تحصیلی"
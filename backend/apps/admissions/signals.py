@@ -0,0 +1,23 @@
+"""
+Signal handlers for admissions app
+"""
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.core.models import Faculty, Department
+from apps.admissions.models import AdmissionRound, Program
+from apps.admissions.catalog import invalidate_catalog
+
+
+@receiver(post_save, sender=Program)
+@receiver(post_delete, sender=Program)
+@receiver(post_save, sender=Faculty)
+@receiver(post_delete, sender=Faculty)
+@receiver(post_save, sender=Department)
+@receiver(post_delete, sender=Department)
+@receiver(post_save, sender=AdmissionRound)
+@receiver(post_delete, sender=AdmissionRound)
+def invalidate_program_catalog(sender, instance, **kwargs):
+    """باطل کردن کاتالوگ رشته‌ها پس از commit تغییر رشته، دانشکده، گروه یا فراخوان"""
+    transaction.on_commit(invalidate_catalog)
@@ -6,6 +6,7 @@ from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from django_filters.rest_framework import DjangoFilterBackend
+from apps.api.filters import NormalizedSearchFilter
 from apps.accounts.models import User, ApplicantProfile, AdminPermission
 from apps.api.accounts_serializers import (
     UserSerializer,
@@ -93,9 +94,9 @@ class AdminPermissionViewSet(viewsets.ModelViewSet):
     """
     queryset = AdminPermission.objects.select_related('user').prefetch_related('faculties', 'departments')
     permission_classes = [IsAuthenticated, IsAdminUser]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, NormalizedSearchFilter, filters.OrderingFilter]
     filterset_fields = ['has_full_access', 'has_ma_talent_access', 'has_phd_talent_access', 'has_phd_exam_access', 'has_olympiad_access']
-    search_fields = ['user__first_name', 'user__last_name', 'user__national_id']
+    search_fields = ['user__first_name_normalized', 'user__last_name_normalized', 'user__national_id']
     ordering_fields = ['created_at', 'updated_at']
     ordering = ['-created_at']
     
@@ -216,9 +217,9 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated, IsAdminUser]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, NormalizedSearchFilter, filters.OrderingFilter]
     filterset_fields = ['role']
-    search_fields = ['first_name', 'last_name', 'national_id', 'email']
+    search_fields = ['first_name_normalized', 'last_name_normalized', 'national_id', 'email']
     ordering_fields = ['created_at', 'last_login']
     ordering = ['-created_at']
     
@@ -249,8 +250,8 @@ class ApplicantProfileViewSet(viewsets.ModelViewSet):
     queryset = ApplicantProfile.objects.select_related('user')
     serializer_class = ApplicantProfileSerializer
     permission_classes = [IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter]
-    search_fields = ['user__first_name', 'user__last_name', 'user__national_id']
+    filter_backends = [DjangoFilterBackend, NormalizedSearchFilter]
+    search_fields = ['user__first_name_normalized', 'user__last_name_normalized', 'user__national_id']
     
     def get_queryset(self):
         """کاربران عادی فقط پروفایل خود را می‌بینند"""
@@ -11,9 +11,17 @@ urlpatterns = [
     
     # University Admin endpoints
     path('university/applications/', admin_views.university_admin_applications_list, name='university-applications-list'),
+    path('university/applications/export/', admin_views.university_applications_export, name='university-applications-export'),
+    path('university/applications/export-jobs/', admin_views.university_export_jobs, name='university-export-jobs'),
+    path('export-jobs/<int:job_id>/', admin_views.export_job_status, name='admin-export-job-status'),
+    path('export-jobs/<int:job_id>/resume/', admin_views.resume_export_job, name='admin-export-job-resume'),
+    path('export-jobs/<int:job_id>/download/', admin_views.download_export_job, name='admin-export-job-download'),
+    path('university/applications/incomplete/', admin_views.university_incomplete_applications, name='university-incomplete-applications'),
+    path('university/applications/bulk-review/', admin_views.university_bulk_review, name='university-bulk-review'),
     path('university/applications/<int:application_id>/', admin_views.university_application_detail, name='university-application-detail'),
     path('university/applications/<int:application_id>/review/', admin_views.university_review_application, name='university-review-application'),
     path('university/statistics/', admin_views.get_statistics, name='university-statistics'),
+    path('university/cache-statistics/', admin_views.get_cache_statistics, name='university-cache-statistics'),
     path('ma/program-admissions/', admin_views.ma_program_admissions, name='ma-program-admissions'),
     path('ma/run-admissions/', admin_views.ma_run_admissions, name='ma-run-admissions'),
     path('ma/choice/<int:choice_id>/accept/', admin_views.ma_accept_choice, name='ma-accept-choice'),
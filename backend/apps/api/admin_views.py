@@ -1,30 +1,65 @@
+from collections import defaultdict
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.utils.urls import replace_query_param
 from django.db import transaction
 from django.db.models import Q, Count
+from django.urls import reverse
 from django.utils import timezone
 from apps.applications.models import Application
 from apps.accounts.models import AdminPermission
 from apps.admissions.models import Program
 from apps.core.models import Faculty, Department
-from apps.workflow.models import FormReview
+from apps.workflow.models import ApplicationWorkflowLog, FormReview
+from apps.workflow.logs import log_workflow_step
 from .applications_serializers import (
     AdminApplicationListSerializer,
     AdminApplicationDetailSerializer,
 )
 from .workflow_serializers import FormReviewSerializer, FormReviewCreateUpdateSerializer
 from .permissions import IsUniversityAdmin, IsFacultyAdmin
+from .prefetch import with_prefetch_profile
+from .pagination import get_application_paginator
+from .exports import EXPORT_FORMATS, csv_export_response, csv_rows_response, xlsx_export_response
+from .downloads import ranged_file_response
+from .sorting import application_ordering, resolve_application_sort
 from apps.admissions.models import Program, AdmissionRound
-from apps.applications.models import ApplicationChoice
+from apps.admissions.allocation import (
+    AllocationEngine,
+    DeferredAcceptanceSolver,
+)
+from apps.applications.models import ApplicationChoice, ProgramRanking
+from apps.applications.statistics import get_dashboard_statistics
+from apps.applications.search import search_applications
+from apps.applications.reviews import (
+    BULK_REVIEW_MAX_SIZE,
+    REVIEW_TRANSITIONS,
+    apply_university_review,
+    bulk_university_review,
+    log_university_review,
+)
+from apps.applications.filters import UNIVERSITY_LIST_FILTERS, filter_university_applications
+from apps.applications.incomplete import (
+    INCOMPLETE_REPORT_STATUSES,
+    incomplete_applications,
+    incomplete_applications_queryset,
+    report_header,
+    report_rows,
+)
+from apps.applications.models import ExportJob
+from apps.applications.tasks import enqueue_export_job
+from apps.core.cache import cache_statistics, namespace as cache_namespace
 
 
-class ApplicationPagination(PageNumberPagination):
-    page_size = 20
-    page_size_query_param = 'page_size'
-    max_page_size = 100
+ALLOCATION_ALGORITHMS = {
+    'per_program': AllocationEngine,
+    'deferred_acceptance': DeferredAcceptanceSolver,
+}
+
+INCOMPLETE_REPORT_PAGE_SIZE = 50
+INCOMPLETE_REPORT_MAX_PAGE_SIZE = 200
 
 
 def _check_ma_talent_access(user):
@@ -48,6 +83,27 @@ def _check_ma_talent_access(user):
     return admin_permission, None
 
 
+def _get_visible_application(user, application_id, queryset=None,
+                             not_found_message='پرونده یافت نشد',
+                             forbidden_message='شما دسترسی به این پرونده ندارید'):
+    """
+    دریافت پرونده از میان پرونده‌های قابل مشاهده کاربر (Application.objects.visible_to)
+    
+    بررسی دسترسی در همان کوئری دریافت انجام می‌شود؛ فقط در صورت نبود نتیجه، وجود
+    پرونده برای تفکیک 404 از 403 بررسی می‌شود.
+    خروجی: (application, error_response)
+    """
+    if queryset is None:
+        queryset = Application.objects.all()
+    try:
+        return queryset.visible_to(user).get(id=application_id), None
+    except Application.DoesNotExist:
+        pass
+    if not Application.objects.filter(id=application_id).exists():
+        return None, Response({'error': not_found_message}, status=status.HTTP_404_NOT_FOUND)
+    return None, Response({'error': forbidden_message}, status=status.HTTP_403_FORBIDDEN)
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated, IsUniversityAdmin])
 def university_admin_applications_list(request):
@@ -62,6 +118,10 @@ def university_admin_applications_list(request):
     - status: وضعیت پرونده (SUBMITTED, UNDER_UNIVERSITY_REVIEW, etc.)
     - search: جستجو در کد ملی، نام، نام خانوادگی، کد پیگیری
     - is_corrected: پرونده‌های ویرایش شده (بعد از برگشت)
+    
+    صفحه‌بندی: page / page_size، یا cursor (keyset) با ?pagination=cursor و سپس ?cursor=<next_cursor>
+    
+    sort_by: created_at / -created_at (پیش‌فرض) / total_score / -total_score
     """
     try:
         admin_permission = request.user.admin_permission
@@ -78,132 +138,212 @@ def university_admin_applications_list(request):
             status=status.HTTP_403_FORBIDDEN
         )
     
-    # شروع Query
-    queryset = Application.objects.select_related(
-        'applicant__user',
-        'round',
-        'university_reviewed_by',
-        'faculty_reviewed_by',
-        'university_of_study',
-        'university_weight'
-    ).prefetch_related(
-        'choices__program__faculty',
-        'choices__program__department',
-        # سوابق تحقیقاتی
-        'research_articles',
-        'patents',
-        'festival_awards',
-        'conference_articles',
-        'books',
-        'masters_thesis',
-        # سوابق المپیاد و زبان
-        'olympiad_records',
-        'language_certificates',
-        # مصاحبه
-        'interview'
+    # شروع Query: فقط پرونده‌های قابل مشاهده برای ادمین (نوع فراخوان‌های مجاز)؛
+    # روابط مورد نیاز از پروفایل prefetch خود serializer خوانده می‌شود
+    queryset, error = filter_university_applications(
+        request.GET, request.user,
+        with_prefetch_profile(Application.objects.all(), AdminApplicationListSerializer),
     )
+    if error:
+        return Response({'error': error}, status=status.HTTP_403_FORBIDDEN)
     
-    # فیلتر نوع فراخوان بر اساس دسترسی
-    round_type = request.GET.get('round_type')
-    if round_type:
-        if not admin_permission.has_access_to_round_type(round_type):
-            return Response(
-                {'error': f'شما به فراخوان {round_type} دسترسی ندارید'},
-                status=status.HTTP_403_FORBIDDEN
-            )
-        queryset = queryset.filter(round__type=round_type)
-    else:
-        # اگر نوع مشخص نشده، فقط موارد مجاز نمایش داده شود
-        allowed_types = []
-        if admin_permission.has_ma_talent_access or admin_permission.has_full_access:
-            allowed_types.append('MA_TALENT')
-        if admin_permission.has_phd_talent_access or admin_permission.has_full_access:
-            allowed_types.append('PHD_TALENT')
-        if admin_permission.has_phd_exam_access or admin_permission.has_full_access:
-            allowed_types.append('PHD_EXAM')
-        if admin_permission.has_olympiad_access or admin_permission.has_full_access:
-            allowed_types.append('OLYMPIAD')
-        
-        if not allowed_types:
-            return Response({'results': [], 'count': 0})
-        
-        queryset = queryset.filter(round__type__in=allowed_types)
+    # مرتب‌سازی (فقط کلیدهای مجاز و دارای ایندکس؛ apps.api.sorting)
+    sort_by = resolve_application_sort(request.GET.get('sort_by'))
+    queryset = queryset.order_by(*application_ordering(sort_by))
     
-    # فیلتر وضعیت بررسی مسئول دانشگاه
-    university_review_status = request.GET.get('university_review_status')
-    if university_review_status:
-        queryset = queryset.filter(university_review_status=university_review_status)
+    # Pagination (شماره‌ای یا cursor با ?pagination=cursor)
+    paginator = get_application_paginator(request, sort_by)
+    page = paginator.paginate_queryset(queryset, request)
     
-    # فیلتر پرونده‌های ویرایش شده (بعد از برگشت)
-    is_corrected = request.GET.get('is_corrected')
-    if is_corrected == 'true':
-        # پرونده‌هایی که وضعیت RETURNED_FOR_CORRECTION داشتند و دوباره SUBMITTED شدند
-        queryset = queryset.filter(
-            status=Application.Status.SUBMITTED,
-            university_review_status=Application.UniversityReviewStatus.PENDING
-        ).exclude(
-            university_reviewed_at__isnull=True
+    if page is not None:
+        serializer = AdminApplicationListSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+    
+    serializer = AdminApplicationListSerializer(queryset, many=True)
+    return Response(serializer.data)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated, IsUniversityAdmin])
+def university_applications_export(request):
+    """
+    خروجی CSV / XLSX پرونده‌ها برای مسئول دانشگاه
+    
+    همان فیلترهای لیست پرونده‌ها (university_admin_applications_list) و sort_by را می‌پذیرد.
+    - output: csv (پیش‌فرض) یا xlsx
+    
+    ردیف‌ها به صورت تکه‌ای خوانده و ارسال می‌شوند (apps.api.exports)؛ مصرف حافظه مستقل
+    از تعداد پرونده‌هاست.
+    """
+    try:
+        admin_permission = request.user.admin_permission
+    except AdminPermission.DoesNotExist:
+        return Response(
+            {'error': 'شما دسترسی مسئول دانشگاه ندارید'},
+            status=status.HTTP_403_FORBIDDEN
         )
     
-    # فیلتر وضعیت پرونده
-    app_status = request.GET.get('status')
-    if app_status:
-        queryset = queryset.filter(status=app_status)
-    else:
-        # پیش‌فرض: فقط پرونده‌های ارسال شده و در حال بررسی
-        queryset = queryset.filter(
-            status__in=[
-                Application.Status.SUBMITTED,
-                Application.Status.UNDER_UNIVERSITY_REVIEW,
-                Application.Status.RETURNED_FOR_CORRECTION
-            ]
+    if not admin_permission.is_university_admin():
+        return Response(
+            {'error': 'شما دسترسی مسئول دانشگاه ندارید'},
+            status=status.HTTP_403_FORBIDDEN
         )
     
-    # فیلتر دانشکده
-    faculty_id = request.GET.get('faculty_id')
-    if faculty_id:
-        queryset = queryset.filter(
-            choices__program__faculty_id=faculty_id
-        ).distinct()
+    output = request.GET.get('output', 'csv')
+    if output not in EXPORT_FORMATS:
+        return Response(
+            {'error': f'قالب خروجی نامعتبر است (مجاز: {", ".join(EXPORT_FORMATS)})'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    queryset, error = filter_university_applications(request.GET, request.user)
+    if error:
+        return Response({'error': error}, status=status.HTTP_403_FORBIDDEN)
+    
+    sort_by = resolve_application_sort(request.GET.get('sort_by'))
+    queryset = queryset.order_by(*application_ordering(sort_by))
+    
+    if output == 'xlsx':
+        return xlsx_export_response(queryset)
+    return csv_export_response(queryset)
 
-    # فیلتر دانشگاه محل تحصیل
-    university_id = request.GET.get('university_id')
-    if university_id:
-        queryset = queryset.filter(
-            university_of_study_id=university_id
-        ).distinct()
+
+def _export_job_data(request, job):
+    data = {
+        'id': job.id,
+        'status': job.status,
+        'status_display': job.get_status_display(),
+        'output': job.output,
+        'params': job.params,
+        'sort_by': job.sort_by,
+        'progress': job.progress,
+        'processed_rows': job.processed_rows,
+        'total_rows': job.total_rows,
+        'error': job.error,
+        'created_at': job.created_at,
+        'started_at': job.started_at,
+        'finished_at': job.finished_at,
+        'download_url': None,
+    }
+    if job.status == ExportJob.Status.COMPLETED:
+        data['download_url'] = request.build_absolute_uri(
+            reverse('admin-export-job-download', args=[job.id])
+        )
+    return data
+
+
+def _get_own_export_job(request, job_id):
+    try:
+        return ExportJob.objects.get(id=job_id, created_by=request.user), None
+    except ExportJob.DoesNotExist:
+        return None, Response({'error': 'خروجی یافت نشد'}, status=status.HTTP_404_NOT_FOUND)
+
+
+@api_view(['GET', 'POST'])
+@permission_classes([IsAuthenticated, IsUniversityAdmin])
+def university_export_jobs(request):
+    """
+    خروجی پس‌زمینه پرونده‌ها (برای خروجی‌های بزرگ که از timeout پروکسی بیشتر طول می‌کشند)
     
-    # فیلتر گروه آموزشی
-    department_id = request.GET.get('department_id')
-    if department_id:
-        queryset = queryset.filter(
-            choices__program__department_id=department_id
-        ).distinct()
+    GET: ده خروجی اخیر کاربر
+    POST: ثبت خروجی جدید با همان فیلترهای لیست پرونده‌ها، sort_by و output (csv / xlsx)؛
+          پاسخ 202 شامل شناسه کار است و وضعیت با GET export-jobs/<id>/ پیگیری می‌شود.
+    """
+    if request.method == 'GET':
+        jobs = ExportJob.objects.filter(created_by=request.user)[:10]
+        return Response({'results': [_export_job_data(request, job) for job in jobs]})
     
-    # جستجو
-    search = request.GET.get('search', '').strip()
-    if search:
-        queryset = queryset.filter(
-            Q(applicant__user__national_id__icontains=search) |
-            Q(applicant__user__first_name__icontains=search) |
-            Q(applicant__user__last_name__icontains=search) |
-            Q(tracking_code__icontains=search)
+    params = {}
+    for name in UNIVERSITY_LIST_FILTERS:
+        value = request.data.get(name, request.GET.get(name))
+        if value not in (None, ''):
+            params[name] = str(value)
+    
+    output = request.data.get('output', request.GET.get('output', ExportJob.Output.CSV))
+    if output not in ExportJob.Output.values:
+        return Response(
+            {'error': f'قالب خروجی نامعتبر است (مجاز: {", ".join(ExportJob.Output.values)})'},
+            status=status.HTTP_400_BAD_REQUEST
         )
     
-    # مرتب‌سازی
-    sort_by = request.GET.get('sort_by', '-created_at')
-    queryset = queryset.order_by(sort_by)
+    try:
+        request.user.admin_permission
+    except AdminPermission.DoesNotExist:
+        return Response(
+            {'error': 'شما دسترسی مسئول دانشگاه ندارید'},
+            status=status.HTTP_403_FORBIDDEN
+        )
     
-    # Pagination
-    paginator = ApplicationPagination()
-    page = paginator.paginate_queryset(queryset, request)
+    # بررسی دسترسی به فیلترها پیش از ثبت کار
+    _, error = filter_university_applications(params, request.user)
+    if error:
+        return Response({'error': error}, status=status.HTTP_403_FORBIDDEN)
     
-    if page is not None:
-        serializer = AdminApplicationListSerializer(page, many=True)
-        return paginator.get_paginated_response(serializer.data)
+    job = ExportJob.objects.create(
+        created_by=request.user,
+        output=output,
+        params=params,
+        sort_by=resolve_application_sort(request.data.get('sort_by', request.GET.get('sort_by'))),
+    )
+    transaction.on_commit(lambda: enqueue_export_job(job.id))
+    job.refresh_from_db()
     
-    serializer = AdminApplicationListSerializer(queryset, many=True)
-    return Response(serializer.data)
+    return Response(_export_job_data(request, job), status=status.HTTP_202_ACCEPTED)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated, IsUniversityAdmin])
+def export_job_status(request, job_id):
+    """وضعیت و درصد پیشرفت یک خروجی پس‌زمینه"""
+    job, error = _get_own_export_job(request, job_id)
+    if error:
+        return error
+    return Response(_export_job_data(request, job))
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated, IsUniversityAdmin])
+def resume_export_job(request, job_id):
+    """اجرای مجدد خروجی ناموفق از آخرین تکه نوشته‌شده"""
+    job, error = _get_own_export_job(request, job_id)
+    if error:
+        return error
+    if job.status != ExportJob.Status.FAILED:
+        return Response(
+            {'error': 'فقط خروجی ناموفق قابل اجرای مجدد است'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    job.status = ExportJob.Status.PENDING
+    job.save(update_fields=['status', 'updated_at'])
+    transaction.on_commit(lambda: enqueue_export_job(job.id))
+    job.refresh_from_db()
+    return Response(_export_job_data(request, job), status=status.HTTP_202_ACCEPTED)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated, IsUniversityAdmin])
+def download_export_job(request, job_id):
+    """
+    دریافت فایل خروجی تکمیل‌شده
+    
+    از هدر Range (و If-Range) برای ادامه دانلود قطع‌شده پشتیبانی می‌کند.
+    """
+    job, error = _get_own_export_job(request, job_id)
+    if error:
+        return error
+    if job.status != ExportJob.Status.COMPLETED or not job.file:
+        return Response({'error': 'خروجی هنوز آماده نیست'}, status=status.HTTP_409_CONFLICT)
+    
+    content_type = (
+        'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        if job.output == ExportJob.Output.XLSX else 'text/csv; charset=utf-8'
+    )
+    filename = 'applications-{}.{}'.format(timezone.localtime(job.created_at).strftime('%Y%m%d-%H%M'), job.output)
+    try:
+        return ranged_file_response(request, job.file.path, filename, content_type, etag=f'"{job.token}"')
+    except FileNotFoundError:
+        return Response({'error': 'فایل خروجی یافت نشد'}, status=status.HTTP_404_NOT_FOUND)
 
 
 @api_view(['GET'])
@@ -218,6 +358,10 @@ def faculty_admin_applications_list(request):
     - department_id: گروه آموزشی
     - faculty_review_completed: بررسی دانشکده تکمیل شده یا نه
     - search: جستجو در کد ملی، نام، نام خانوادگی، کد پیگیری
+    
+    صفحه‌بندی: page / page_size، یا cursor (keyset) با ?pagination=cursor و سپس ?cursor=<next_cursor>
+    
+    sort_by: created_at / -created_at (پیش‌فرض) / total_score / -total_score
     """
     try:
         admin_permission = request.user.admin_permission
@@ -234,30 +378,10 @@ def faculty_admin_applications_list(request):
             status=status.HTTP_403_FORBIDDEN
         )
     
-    # شروع Query - فقط پرونده‌های تایید شده توسط مسئول دانشگاه
-    queryset = Application.objects.select_related(
-        'applicant__user',
-        'round',
-        'university_reviewed_by',
-        'faculty_reviewed_by',
-        'university_of_study',
-        'university_weight'
-    ).prefetch_related(
-        'choices__program__faculty',
-        'choices__program__department',
-        'education_records',
-        # سوابق تحقیقاتی
-        'research_articles',
-        'patents',
-        'festival_awards',
-        'conference_articles',
-        'books',
-        'masters_thesis',
-        # سوابق المپیاد و زبان
-        'olympiad_records',
-        'language_certificates',
-        # مصاحبه
-        'interview'
+    # شروع Query - فقط پرونده‌های تایید شده توسط مسئول دانشگاه و قابل مشاهده برای
+    # مسئول (نوع فراخوان و دانشکده مجاز با یک شرط EXISTS؛ visible_to)
+    queryset = with_prefetch_profile(
+        Application.objects.visible_to(request.user), AdminApplicationListSerializer
     ).filter(
         status__in=[
             Application.Status.APPROVED_BY_UNIVERSITY,
@@ -275,47 +399,22 @@ def faculty_admin_applications_list(request):
                 status=status.HTTP_403_FORBIDDEN
             )
         queryset = queryset.filter(round__type=round_type)
-    else:
-        # فیلتر بر اساس دسترسی‌های مسئول
-        allowed_types = []
-        if admin_permission.has_ma_talent_access or admin_permission.has_full_access:
-            allowed_types.append('MA_TALENT')
-        if admin_permission.has_phd_talent_access or admin_permission.has_full_access:
-            allowed_types.append('PHD_TALENT')
-        if admin_permission.has_phd_exam_access or admin_permission.has_full_access:
-            allowed_types.append('PHD_EXAM')
-        if admin_permission.has_olympiad_access or admin_permission.has_full_access:
-            allowed_types.append('OLYMPIAD')
-        
-        if not allowed_types:
-            return Response({'results': [], 'count': 0})
-        
-        queryset = queryset.filter(round__type__in=allowed_types)
+    elif not admin_permission.scope.allowed_round_types:
+        return Response({'results': [], 'count': 0})
     
     # فیلتر دانشکده (بر اساس دسترسی)
     faculty_id = request.GET.get('faculty_id')
     if faculty_id:
-        # بررسی دسترسی به دانشکده
-        if not admin_permission.has_full_access:
-            allowed_faculties = admin_permission.faculties.all()
-            if allowed_faculties.exists():
-                if not allowed_faculties.filter(id=faculty_id).exists():
-                    return Response(
-                        {'error': 'شما به این دانشکده دسترسی ندارید'},
-                        status=status.HTTP_403_FORBIDDEN
-                    )
+        # بررسی دسترسی به دانشکده (از محدوده دسترسی حل‌شده، بدون کوئری)
+        if not faculty_id.isdigit() or not admin_permission.scope.allows_any_faculty({int(faculty_id)}):
+            return Response(
+                {'error': 'شما به این دانشکده دسترسی ندارید'},
+                status=status.HTTP_403_FORBIDDEN
+            )
         
         queryset = queryset.filter(
             choices__program__faculty_id=faculty_id
         ).distinct()
-    else:
-        # اگر دانشکده مشخص نشده، فیلتر بر اساس دسترسی
-        if not admin_permission.has_full_access:
-            allowed_faculties = admin_permission.faculties.all()
-            if allowed_faculties.exists():
-                queryset = queryset.filter(
-                    choices__program__faculty__in=allowed_faculties
-                ).distinct()
     
     # فیلتر گروه آموزشی
     department_id = request.GET.get('department_id')
@@ -334,19 +433,14 @@ def faculty_admin_applications_list(request):
     # جستجو
     search = request.GET.get('search', '').strip()
     if search:
-        queryset = queryset.filter(
-            Q(applicant__user__national_id__icontains=search) |
-            Q(applicant__user__first_name__icontains=search) |
-            Q(applicant__user__last_name__icontains=search) |
-            Q(tracking_code__icontains=search)
-        )
+        queryset = search_applications(queryset, search)
     
-    # مرتب‌سازی
-    sort_by = request.GET.get('sort_by', '-created_at')
-    queryset = queryset.order_by(sort_by)
+    # مرتب‌سازی (فقط کلیدهای مجاز و دارای ایندکس؛ apps.api.sorting)
+    sort_by = resolve_application_sort(request.GET.get('sort_by'))
+    queryset = queryset.order_by(*application_ordering(sort_by))
     
-    # Pagination
-    paginator = ApplicationPagination()
+    # Pagination (شماره‌ای یا cursor با ?pagination=cursor)
+    paginator = get_application_paginator(request, sort_by)
     page = paginator.paginate_queryset(queryset, request)
     
     if page is not None:
@@ -370,50 +464,13 @@ def admin_application_detail(request, application_id):
             status=status.HTTP_403_FORBIDDEN
         )
 
-    try:
-        application = Application.objects.select_related(
-            'applicant__user',
-            'round',
-            'university_reviewed_by',
-            'faculty_reviewed_by'
-        ).prefetch_related(
-            'choices__program__faculty',
-            'choices__program__department',
-            'education_records',
-            'documents',
-            # سوابق تحقیقاتی
-            'research_articles',
-            'patents',
-            'festival_awards',
-            'conference_articles',
-            'books',
-            'masters_thesis',
-            # سوابق المپیاد و زبان
-            'olympiad_records',
-            'language_certificates',
-            # مصاحبه
-            'interview'
-        ).get(id=application_id)
-    except Application.DoesNotExist:
-        return Response(
-            {'error': 'پرونده یافت نشد'},
-            status=status.HTTP_404_NOT_FOUND
-        )
-
-    if user.role not in ['SUPERADMIN', 'ADMIN']:
-        try:
-            admin_permission = user.admin_permission
-        except AdminPermission.DoesNotExist:
-            return Response(
-                {'error': 'شما دسترسی ادمین ندارید'},
-                status=status.HTTP_403_FORBIDDEN
-            )
-
-        if not admin_permission.can_review_application(application):
-            return Response(
-                {'error': 'شما دسترسی به این پرونده ندارید'},
-                status=status.HTTP_403_FORBIDDEN
-            )
+    # دریافت پرونده و بررسی دسترسی در یک کوئری (visible_to)
+    application, error = _get_visible_application(
+        user, application_id,
+        with_prefetch_profile(Application.objects.all(), AdminApplicationDetailSerializer),
+    )
+    if error:
+        return error
 
     try:
         serializer = AdminApplicationDetailSerializer(application, context={'request': request})
@@ -434,6 +491,69 @@ def admin_application_detail(request, application_id):
         )
 
 
+def _ma_program_admissions_payload(round_obj):
+    """لیست برنامه‌ها و متقاضیان پذیرفته/ذخیره اولیه یک فراخوان از جدول ProgramRanking"""
+    programs = Program.objects.filter(round=round_obj, degree_level=Program.DEGREE_MA, is_active=True).select_related('faculty','department')
+
+    # رتبه‌بندی از پیش محاسبه شده (ProgramRanking) - یک کوئری برای تمام برنامه‌ها
+    rankings_by_program = defaultdict(list)
+    rankings = ProgramRanking.objects.filter(
+        round=round_obj,
+        program__in=programs
+    ).select_related('application__applicant__user', 'choice').order_by(
+        'program_id', '-total_score', 'priority', 'application_id'
+    )
+    for ranking in rankings:
+        rankings_by_program[ranking.program_id].append(ranking)
+
+    result = []
+    for program in programs:
+        candidates = []
+        for ranking in rankings_by_program.get(program.id, []):
+            app = ranking.application
+            user = app.applicant.user
+            candidates.append({
+                'application_id': app.id,
+                'tracking_code': app.tracking_code,
+                'applicant': {
+                    'id': app.applicant.id,
+                    'first_name': user.first_name,
+                    'last_name': user.last_name,
+                    'national_id': user.national_id,
+                    'email': user.email,
+                    'mobile': user.mobile,
+                },
+                'bsc_gpa': ranking.bsc_gpa,
+                'education_score': ranking.education_score,
+                'total_score': ranking.total_score,
+                'choice_priority': ranking.priority,
+                'choice_id': ranking.choice_id,
+                'choice_admission_status': ranking.choice.admission_status,
+                'top_three_choices': ranking.top_choices,
+            })
+
+        # already sorted by total_score desc, then by priority asc
+        candidates_sorted = candidates
+
+        capacity = program.capacity or 0
+        prelim_accepted = candidates_sorted[:capacity]
+        prelim_waiting = candidates_sorted[capacity:]
+
+        result.append({
+            'program_id': program.id,
+            'program_name': program.name,
+            'program_code': program.code,
+            'orientation': program.orientation,
+            'faculty': {'id': program.faculty.id, 'name': program.faculty.name},
+            'department': {'id': program.department.id, 'name': program.department.name},
+            'capacity': capacity,
+            'prelim_accepted': prelim_accepted,
+            'prelim_waiting': prelim_waiting,
+            'candidates_count': len(candidates_sorted),
+        })
+    return result
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated, IsUniversityAdmin])
 def ma_program_admissions(request):
@@ -442,6 +562,10 @@ def ma_program_admissions(request):
 
     Query params:
     - round_id (اختیاری): شناسه فراخوان. اگر ارسال نشود، از فراخوان فعال MA_TALENT استفاده می‌کند.
+
+    داده‌ها از جدول از پیش محاسبه‌شده ProgramRanking خوانده می‌شوند
+    (بازسازی دستی: manage.py refresh_program_rankings) و تا بازسازی بعدی
+    رتبه‌بندی (یا حداکثر RANKINGS_CACHE_TTL) در cache می‌مانند.
     """
     try:
         # انتخاب فراخوان
@@ -456,89 +580,11 @@ def ma_program_admissions(request):
             if not round_obj:
                 return Response({'programs': []})
 
-        programs = Program.objects.filter(round=round_obj, degree_level=Program.DEGREE_MA, is_active=True).select_related('faculty','department')
-
-        result = []
-        for program in programs:
-            # جمع آوری انتخاب‌های مرتبط
-            choices_qs = ApplicationChoice.objects.select_related('application__applicant__user', 'application__education_scoring').filter(
-                program=program,
-                application__status__in=[
-                    Application.Status.NEW,
-                    Application.Status.SUBMITTED,
-                    Application.Status.UNDER_UNIVERSITY_REVIEW,
-                    Application.Status.APPROVED_BY_UNIVERSITY,
-                    Application.Status.UNDER_FACULTY_REVIEW,
-                    Application.Status.FACULTY_REVIEW_COMPLETED,
-                    Application.Status.COMPLETED
-                ]
-            )
-
-            candidates = []
-            for ch in choices_qs:
-                app = ch.application
-                user = app.applicant.user
-                # bsc record
-                bsc = app.education_records.filter(degree_level='BSC').first()
-                gpa = None
-                if bsc and bsc.gpa is not None:
-                    gpa = float(bsc.gpa)
-
-                edu_score = None
-                if hasattr(app, 'education_scoring'):
-                    edu_score = app.education_scoring.total_score
-
-                top_choices = ApplicationChoice.objects.filter(
-                    application=app
-                ).order_by('priority').select_related('program')[:3]
-
-                serialized_choices = [
-                    {
-                        'priority': choice.priority,
-                        'program_name': choice.program.name,
-                        'orientation': choice.program.orientation,
-                    } for choice in top_choices
-                ]
-
-                candidates.append({
-                    'application_id': app.id,
-                    'tracking_code': app.tracking_code,
-                    'applicant': {
-                        'id': app.applicant.id,
-                        'first_name': user.first_name,
-                        'last_name': user.last_name,
-                        'national_id': user.national_id,
-                        'email': user.email,
-                        'mobile': user.mobile,
-                    },
-                    'bsc_gpa': gpa,
-                    'education_score': edu_score,
-                    'total_score': app.total_score,
-                    'choice_priority': ch.priority,
-                    'choice_id': ch.id,
-                    'choice_admission_status': ch.admission_status,
-                    'top_three_choices': serialized_choices,
-                })
-
-            # sort by total_score desc, then by priority asc
-            candidates_sorted = sorted(candidates, key=lambda x: (-(x['total_score'] or 0), x['choice_priority'] or 99))
-
-            capacity = program.capacity or 0
-            prelim_accepted = candidates_sorted[:capacity]
-            prelim_waiting = candidates_sorted[capacity:]
-
-            result.append({
-                'program_id': program.id,
-                'program_name': program.name,
-                'program_code': program.code,
-                'orientation': program.orientation,
-                'faculty': {'id': program.faculty.id, 'name': program.faculty.name},
-                'department': {'id': program.department.id, 'name': program.department.name},
-                'capacity': capacity,
-                'prelim_accepted': prelim_accepted,
-                'prelim_waiting': prelim_waiting,
-                'candidates_count': len(candidates_sorted),
-            })
+        # نتیجه در فضای نام rankings از apps.core.cache نگه‌داری و با بازسازی رتبه‌بندی باطل می‌شود
+        result = cache_namespace('rankings').get_or_compute(
+            ('ma_program_admissions', round_obj.id),
+            lambda: _ma_program_admissions_payload(round_obj),
+        )
 
         return Response({'round': {'id': round_obj.id, 'title': round_obj.title}, 'programs': result})
 
@@ -561,11 +607,22 @@ def ma_run_admissions(request):
     """
     Run final admissions allocation for MA programs in a round.
 
-    Body (optional): { "round_id": <id> }
-    This will mark top N candidates per program as ACCEPTED (both on ApplicationChoice.admission_status
-    and Application.admission_overall_status) where N = program.capacity.
+    Body (optional): { "round_id": <id>, "algorithm": "per_program" | "deferred_acceptance", "dry_run": false }
+
+    - per_program (default): mark top N candidates per program as ACCEPTED (both on
+      ApplicationChoice.admission_status and Application.admission_overall_status) where N = program.capacity.
+    - deferred_acceptance: applicant-proposing stable matching over ApplicationChoice.priority,
+      so each applicant is accepted in at most one program.
+
+    With dry_run=true nothing is written and the full assignment is returned.
+    The summary includes per-phase timings (load/rank/write).
     """
     try:
+        algorithm = request.data.get('algorithm', 'per_program')
+        if algorithm not in ALLOCATION_ALGORITHMS:
+            return Response({'error': 'الگوریتم تخصیص نامعتبر است'}, status=status.HTTP_400_BAD_REQUEST)
+        dry_run = str(request.data.get('dry_run', '')).lower() in ['true', '1']
+
         round_id = request.data.get('round_id')
         if round_id:
             try:
@@ -577,66 +634,11 @@ def ma_run_admissions(request):
             if not round_obj:
                 return Response({'error': 'فراخوان فعال یافت نشد'}, status=status.HTTP_400_BAD_REQUEST)
 
-        programs = Program.objects.filter(round=round_obj, degree_level=Program.DEGREE_MA, is_active=True)
+        engine = ALLOCATION_ALGORITHMS[algorithm](round_obj)
+        summary = engine.run(dry_run=dry_run)
+        summary['algorithm'] = algorithm
 
-        updated = {
-            'programs_processed': 0,
-            'accepted_total': 0,
-        }
-
-        with transaction.atomic():
-            for program in programs:
-                # gather candidates who chose this program
-                choices_qs = ApplicationChoice.objects.select_related('application', 'application__education_scoring').filter(
-                    program=program,
-                        application__status__in=[
-                            Application.Status.NEW,
-                            Application.Status.SUBMITTED,
-                            Application.Status.UNDER_UNIVERSITY_REVIEW,
-                            Application.Status.APPROVED_BY_UNIVERSITY,
-                            Application.Status.UNDER_FACULTY_REVIEW,
-                            Application.Status.FACULTY_REVIEW_COMPLETED,
-                            Application.Status.COMPLETED
-                        ]
-                )
-
-                candidates = []
-                for ch in choices_qs:
-                    app = ch.application
-                    edu_score = None
-                    if hasattr(app, 'education_scoring'):
-                        edu_score = app.education_scoring.total_score
-                    candidates.append((ch, app, edu_score or 0, app.total_score or 0))
-
-                # sort by total_score desc, then education_score desc, then priority asc
-                candidates_sorted = sorted(candidates, key=lambda t: (-(t[3] or 0), -(t[2] or 0), t[0].priority))
-
-                capacity = program.capacity or 0
-                accepted = candidates_sorted[:capacity]
-                # reset statuses for all choices of this program
-                choices_qs.update(admission_status='PENDING', admission_priority_result=None)
-
-                # mark accepted
-                for idx, (ch, app, edu_s, total_s) in enumerate(accepted, start=1):
-                    ch.admission_status = 'ACCEPTED'
-                    ch.admission_priority_result = idx
-                    ch.save(update_fields=['admission_status', 'admission_priority_result'])
-                    # also update application overall
-                    app.admission_overall_status = 'ADMITTED'
-                    app.admission_result_published_at = timezone.now()
-                    app.save(update_fields=['admission_overall_status', 'admission_result_published_at'])
-                    updated['accepted_total'] += 1
-
-                # mark remaining as WAITING
-                waiting = candidates_sorted[capacity:]
-                for ch, app, edu_s, total_s in waiting:
-                    ch.admission_status = 'WAITING'
-                    ch.admission_priority_result = None
-                    ch.save(update_fields=['admission_status', 'admission_priority_result'])
-
-                updated['programs_processed'] += 1
-
-        return Response({'message': 'عملیات پذیرش اجرا شد', 'summary': updated})
+        return Response({'message': 'عملیات پذیرش اجرا شد', 'summary': summary})
 
     except Exception as e:
         import traceback, os
@@ -765,29 +767,158 @@ def university_review_application(request, application_id):
             status=status.HTTP_400_BAD_REQUEST
         )
     
-    # ذخیره نتیجه بررسی
-    application.university_review_status = review_status
-    application.university_review_comment = comment
-    application.university_reviewed_by = request.user
-    application.university_reviewed_at = timezone.now()
-    
-    # تغییر وضعیت پرونده
-    if review_status == 'APPROVED':
-        application.status = Application.Status.APPROVED_BY_UNIVERSITY
-    elif review_status == 'APPROVED_WITH_DEFECT':
-        application.status = Application.Status.RETURNED_FOR_CORRECTION
-        # ذخیره نواقص
-        if defects:
-            application.university_review_comment = f"{comment}\n\nنواقص:\n" + "\n".join([f"- {d}" for d in defects])
-    elif review_status == 'REJECTED':
-        application.status = Application.Status.REJECTED_BY_UNIVERSITY
+    # ذخیره نتیجه بررسی و تغییر وضعیت پرونده
+    apply_university_review(application, request.user, review_status, comment, defects)
     
     application.save()
+    log_university_review(application, request.user, review_status)
     
     serializer = AdminApplicationDetailSerializer(application, context={'request': request})
     return Response(serializer.data)
 
 
+@api_view(['POST'])
+@permission_classes([IsAuthenticated, IsUniversityAdmin])
+def university_bulk_review(request):
+    """
+    بررسی گروهی پرونده‌ها توسط مسئول دانشگاه
+    
+    Body:
+    {
+        "application_ids": [1, 2, 3],
+        "review_status": "APPROVED" | "APPROVED_WITH_DEFECT" | "REJECTED",
+        "comment": "نظر مسئول دانشگاه",
+        "defects": ["نقص 1"] // برای حالت APPROVED_WITH_DEFECT
+    }
+    
+    نتیجه هر پرونده جداگانه برگردانده می‌شود؛ پرونده‌های غیرقابل بررسی یا خارج از
+    دسترسی بقیه را متوقف نمی‌کنند.
+    """
+    try:
+        request.user.admin_permission
+    except AdminPermission.DoesNotExist:
+        return Response(
+            {'error': 'شما دسترسی مسئول دانشگاه ندارید'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+    
+    review_status = request.data.get('review_status')
+    if review_status not in REVIEW_TRANSITIONS:
+        return Response(
+            {'error': 'وضعیت بررسی نامعتبر است'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    application_ids = request.data.get('application_ids')
+    if not isinstance(application_ids, list) or not application_ids:
+        return Response(
+            {'error': 'لیست شناسه پرونده‌ها الزامی است'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    if len(application_ids) > BULK_REVIEW_MAX_SIZE:
+        return Response(
+            {'error': f'حداکثر {BULK_REVIEW_MAX_SIZE} پرونده در هر درخواست قابل بررسی است'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    try:
+        application_ids = [int(application_id) for application_id in application_ids]
+    except (TypeError, ValueError):
+        return Response(
+            {'error': 'شناسه پرونده نامعتبر است'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    results = bulk_university_review(
+        request.user,
+        application_ids,
+        review_status,
+        comment=request.data.get('comment', ''),
+        defects=request.data.get('defects', []),
+    )
+    succeeded = sum(1 for result in results if result['success'])
+    return Response({
+        'succeeded': succeeded,
+        'failed': len(results) - succeeded,
+        'results': results,
+    })
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated, IsUniversityAdmin])
+def university_incomplete_applications(request):
+    """
+    گزارش پرونده‌های ناقص یک فراخوان (برای ارسال یادآوری)
+    
+    Query params:
+    - round_id: شناسه فراخوان (الزامی)
+    - status (اختیاری): یکی از وضعیت‌های در حال تکمیل (پیش‌فرض: همه آن‌ها)
+    - missing (اختیاری): فقط پرونده‌هایی که این مورد را کم دارند
+      (choices، personal_info، identity_documents، bsc_record، bsc_documents، msc_record)
+    - output=csv: خروجی CSV کل گزارش (ارسال تدریجی)
+    - page_size / cursor: صفحه‌بندی cursor روی شناسه پرونده (next_cursor پاسخ قبلی)
+    
+    آمادگی پرونده‌ها به صورت تکه‌ای با چند کوئری گروهی محاسبه می‌شود
+    (apps.applications.incomplete).
+    """
+    try:
+        admin_permission = request.user.admin_permission
+    except AdminPermission.DoesNotExist:
+        return Response(
+            {'error': 'شما دسترسی مسئول دانشگاه ندارید'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+    
+    round_id = request.GET.get('round_id')
+    if not round_id:
+        return Response({'error': 'شناسه فراخوان الزامی است'}, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        round_obj = AdmissionRound.objects.get(id=round_id)
+    except (AdmissionRound.DoesNotExist, ValueError):
+        return Response({'error': 'فراخوان یافت نشد'}, status=status.HTTP_404_NOT_FOUND)
+    if not admin_permission.has_access_to_round_type(round_obj.type):
+        return Response(
+            {'error': f'شما به فراخوان {round_obj.type} دسترسی ندارید'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+    
+    statuses = None
+    app_status = request.GET.get('status')
+    if app_status:
+        if app_status not in INCOMPLETE_REPORT_STATUSES:
+            return Response({'error': 'وضعیت پرونده نامعتبر است'}, status=status.HTTP_400_BAD_REQUEST)
+        statuses = [app_status]
+    
+    queryset = incomplete_applications_queryset(round_obj, request.user, statuses)
+    missing_code = request.GET.get('missing') or None
+    
+    if request.GET.get('output') == 'csv':
+        return csv_rows_response(report_header(), report_rows(queryset, missing_code), 'incomplete-applications')
+    
+    try:
+        page_size = int(request.GET.get('page_size', INCOMPLETE_REPORT_PAGE_SIZE))
+        cursor = int(request.GET.get('cursor', 0))
+    except ValueError:
+        return Response({'error': 'پارامتر صفحه‌بندی نامعتبر است'}, status=status.HTTP_400_BAD_REQUEST)
+    page_size = max(1, min(page_size, INCOMPLETE_REPORT_MAX_PAGE_SIZE))
+    
+    # پرونده‌ها به ترتیب id بررسی می‌شوند و خواندن با رسیدن به یک صفحه متوقف می‌شود
+    results = []
+    has_next = False
+    for item in incomplete_applications(queryset.filter(id__gt=cursor), missing_code):
+        if len(results) == page_size:
+            has_next = True
+            break
+        results.append(item)
+    
+    next_cursor = results[-1]['id'] if has_next else None
+    return Response({
+        'round': {'id': round_obj.id, 'title': round_obj.title, 'type': round_obj.type},
+        'next': replace_query_param(request.build_absolute_uri(), 'cursor', next_cursor) if next_cursor else None,
+        'next_cursor': next_cursor,
+        'results': results,
+    })
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated, IsUniversityAdmin])
 def university_application_detail(request, application_id):
@@ -799,33 +930,13 @@ def university_application_detail(request, application_id):
     except AdminPermission.DoesNotExist:
         return Response({'error': 'شما دسترسی مسئول دانشگاه ندارید'}, status=status.HTTP_403_FORBIDDEN)
 
-    try:
-        application = Application.objects.select_related(
-            'applicant__user',
-            'round',
-            'university_reviewed_by',
-            'faculty_reviewed_by'
-        ).prefetch_related(
-            'choices__program__faculty',
-            'choices__program__department',
-            'education_records',
-            'documents',
-            'research_articles',
-            'patents',
-            'festival_awards',
-            'conference_articles',
-            'books',
-            'masters_thesis',
-            'olympiad_records',
-            'language_certificates',
-            'interview'
-        ).get(id=application_id)
-    except Application.DoesNotExist:
-        return Response({'error': 'پرونده یافت نشد'}, status=status.HTTP_404_NOT_FOUND)
-
-    # بررسی دسترسی به نوع فراخوان
-    if not admin_permission.can_review_application(application):
-        return Response({'error': 'شما دسترسی به این پرونده ندارید'}, status=status.HTTP_403_FORBIDDEN)
+    # دریافت پرونده و بررسی دسترسی در یک کوئری (visible_to)
+    application, error = _get_visible_application(
+        request.user, application_id,
+        with_prefetch_profile(Application.objects.all(), AdminApplicationDetailSerializer),
+    )
+    if error:
+        return error
 
     try:
         serializer = AdminApplicationDetailSerializer(application, context={'request': request})
@@ -886,12 +997,11 @@ def faculty_review_application(request, application_id):
         )
     
     # بررسی دسترسی به دانشکده
-    application_faculties = application.choices.values_list(
-        'program__faculty_id', flat=True
-    )
-    if not admin_permission.has_full_access:
-        allowed_faculties = admin_permission.faculties.values_list('id', flat=True)
-        if allowed_faculties and not any(f in allowed_faculties for f in application_faculties):
+    if admin_permission.scope.faculty_restriction is not None:
+        application_faculties = set(application.choices.values_list(
+            'program__faculty_id', flat=True
+        ))
+        if not admin_permission.scope.allows_any_faculty(application_faculties):
             return Response(
                 {'error': 'شما به این دانشکده دسترسی ندارید'},
                 status=status.HTTP_403_FORBIDDEN
@@ -951,6 +1061,12 @@ def faculty_review_application(request, application_id):
     # تغییر وضعیت پرونده
     application.status = Application.Status.COMPLETED
     application.save()
+    log_workflow_step(
+        application,
+        ApplicationWorkflowLog.StepType.FINAL_REVIEW,
+        f"تصمیم نهایی دانشکده: {'پذیرش' if decision == 'APPROVED' else 'رد'}",
+        created_by=request.user
+    )
     
     serializer = AdminApplicationDetailSerializer(application, context={'request': request})
     return Response(serializer.data)
@@ -961,6 +1077,9 @@ def faculty_review_application(request, application_id):
 def get_statistics(request):
     """
     آمار پرونده‌ها برای داشبورد مسئول دانشگاه
+    
+    علاوه بر شمارنده‌های کل، تفکیک بر اساس نوع فراخوان (by_round_type) و
+    دانشکده انتخاب اول (by_faculty) نیز برگردانده می‌شود.
     """
     try:
         admin_permission = request.user.admin_permission
@@ -972,30 +1091,26 @@ def get_statistics(request):
     
     round_type = request.GET.get('round_type')
     
-    # فیلتر بر اساس دسترسی
-    queryset = Application.objects.all()
+    if round_type and not admin_permission.has_access_to_round_type(round_type):
+        return Response({'error': 'شما به این نوع فراخوان دسترسی ندارید'}, status=403)
     
-    if round_type:
-        if not admin_permission.has_access_to_round_type(round_type):
-            return Response({'error': 'شما به این نوع فراخوان دسترسی ندارید'}, status=403)
-        queryset = queryset.filter(round__type=round_type)
-    
-    stats = {
-        'total': queryset.count(),
-        'submitted': queryset.filter(status=Application.Status.SUBMITTED).count(),
-        'under_review': queryset.filter(status=Application.Status.UNDER_UNIVERSITY_REVIEW).count(),
-        'approved': queryset.filter(university_review_status=Application.UniversityReviewStatus.APPROVED).count(),
-        'returned_for_correction': queryset.filter(status=Application.Status.RETURNED_FOR_CORRECTION).count(),
-        'rejected': queryset.filter(university_review_status=Application.UniversityReviewStatus.REJECTED).count(),
-        'corrected_and_resubmitted': queryset.filter(
-            status=Application.Status.SUBMITTED,
-            university_reviewed_at__isnull=False
-        ).count(),
-    }
+    # یک کوئری تجمیعی + cache کوتاه‌مدت (apps.applications.statistics)
+    stats = get_dashboard_statistics(admin_permission, round_type=round_type)
     
     return Response(stats)
 
 
+@api_view(['GET'])
+@permission_classes([IsAuthenticated, IsUniversityAdmin])
+def get_cache_statistics(request):
+    """
+    شمارنده‌های hit/miss هر فضای نام cache (apps.core.cache) برای پایش
+    
+    مقادیر مجموع تمام پروسه‌ها هستند و حداکثر با چند ثانیه تأخیر به‌روز می‌شوند.
+    """
+    return Response(cache_statistics())
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def get_admin_profile(request):
@@ -1054,14 +1169,7 @@ def get_admin_profile(request):
     if user.role in ['ADMIN', 'SUPERADMIN'] or admin_permission.has_full_access:
         data['accessible_round_types'] = ['MA_TALENT', 'PHD_TALENT', 'PHD_EXAM', 'OLYMPIAD']
     else:
-        if admin_permission.has_ma_talent_access:
-            data['accessible_round_types'].append('MA_TALENT')
-        if admin_permission.has_phd_talent_access:
-            data['accessible_round_types'].append('PHD_TALENT')
-        if admin_permission.has_phd_exam_access:
-            data['accessible_round_types'].append('PHD_EXAM')
-        if admin_permission.has_olympiad_access:
-            data['accessible_round_types'].append('OLYMPIAD')
+        data['accessible_round_types'] = admin_permission.scope.allowed_round_types
     
     # Faculty access (for faculty admin)
     if user.role in ['FACULTY_ADMIN', 'SUPERADMIN', 'ADMIN']:
@@ -1183,24 +1291,15 @@ def manage_document_review(request, application_id):
     GET: دریافت لیست بررسی‌های مدارک یک درخواست
     POST: ایجاد یا به‌روزرسانی بررسی مدارک
     """
-    try:
-        application = Application.objects.select_related(
-            'applicant__user',
-            'round'
-        ).get(id=application_id)
-    except Application.DoesNotExist:
-        return Response(
-            {'error': 'درخواست یافت نشد'},
-            status=status.HTTP_404_NOT_FOUND
-        )
-    
-    # بررسی دسترسی
-    admin_permission = request.user.admin_permission
-    if not admin_permission.can_review_application(application):
-        return Response(
-            {'error': 'شما دسترسی بررسی این درخواست را ندارید'},
-            status=status.HTTP_403_FORBIDDEN
-        )
+    # دریافت پرونده و بررسی دسترسی در یک کوئری (visible_to)
+    application, error = _get_visible_application(
+        request.user, application_id,
+        Application.objects.select_related('applicant__user', 'round'),
+        not_found_message='درخواست یافت نشد',
+        forbidden_message='شما دسترسی بررسی این درخواست را ندارید',
+    )
+    if error:
+        return error
     
     if request.method == 'GET':
         # دریافت لیست بررسی‌های موجود
@@ -1248,11 +1347,10 @@ def manage_document_review(request, application_id):
             review = serializer.save()
             
             # ثبت لاگ در workflow
-            from apps.workflow.models import ApplicationWorkflowLog
-            ApplicationWorkflowLog.objects.create(
-                application=application,
-                step_type='DOCUMENT_REVIEW',
-                description=f"بررسی مدارک {review.get_document_type_display()}: {review.get_status_display()}",
+            log_workflow_step(
+                application,
+                'DOCUMENT_REVIEW',
+                f"بررسی مدارک {review.get_document_type_display()}: {review.get_status_display()}",
                 created_by=request.user
             )
             
@@ -1270,37 +1368,14 @@ def get_application_document_reviews(request, application_id):
     """
     دریافت وضعیت بررسی مدارک یک درخواست (برای داوطلب یا ادمین)
     """
-    try:
-        application = Application.objects.get(id=application_id)
-    except Application.DoesNotExist:
-        return Response(
-            {'error': 'درخواست یافت نشد'},
-            status=status.HTTP_404_NOT_FOUND
-        )
-    
-    # بررسی دسترسی
-    user = request.user
-    if user.role == 'APPLICANT':
-        # داوطلب فقط به پرونده خودش دسترسی دارد
-        if application.applicant.user != user:
-            return Response(
-                {'error': 'شما دسترسی به این درخواست ندارید'},
-                status=status.HTTP_403_FORBIDDEN
-            )
-    elif user.role in ['UNIVERSITY_ADMIN', 'FACULTY_ADMIN', 'SUPERADMIN']:
-        # ادمین‌ها باید دسترسی لازم داشته باشند
-        try:
-            admin_permission = user.admin_permission
-            if not admin_permission.can_review_application(application):
-                return Response(
-                    {'error': 'شما دسترسی به این درخواست ندارید'},
-                    status=status.HTTP_403_FORBIDDEN
-                )
-        except AdminPermission.DoesNotExist:
-            return Response(
-                {'error': 'شما دسترسی ادمین ندارید'},
-                status=status.HTTP_403_FORBIDDEN
-            )
+    # داوطلب فقط پرونده خودش، ادمین‌ها پرونده‌های محدوده دسترسی خود (visible_to)
+    application, error = _get_visible_application(
+        request.user, application_id,
+        not_found_message='درخواست یافت نشد',
+        forbidden_message='شما دسترسی به این درخواست ندارید',
+    )
+    if error:
+        return error
     
     # دریافت بررسی‌ها
     reviews = FormReview.objects.filter(
@@ -4,6 +4,7 @@ Serializers for applications app
 from django.core.exceptions import ObjectDoesNotExist
 from rest_framework import serializers
 from apps.applications.models import (
+    FIRST_CHOICE_FIELDS,
     Application,
     ApplicationChoice,
     ApplicationEducationRecord,
@@ -18,6 +19,7 @@ from apps.applications.models import (
     OlympiadRecord,
     LanguageCertificate,
     Interview,
+    ApplicationSummary,
 )
 from apps.api.admissions_serializers import ProgramListSerializer
 from apps.api.core_serializers import UniversitySerializer
@@ -233,6 +235,9 @@ class AdminApplicationListSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Application
+        # پروفایل prefetch (apps.api.prefetch): فقط روابطی که در جدول نمایش داده می‌شوند
+        select_related = ['applicant__user', 'round', 'university_of_study', 'university_weight']
+        queryset_methods = ['with_first_choice']
         fields = [
             'id',
             'tracking_code',
@@ -262,13 +267,23 @@ class AdminApplicationListSerializer(serializers.ModelSerializer):
             'last_name': obj.applicant.user.last_name,
         }
     
-    def get_faculty_department(self, obj):
-        """دانشکده/گروه آموزشی از اولین انتخاب"""
+    def _first_choice(self, obj):
+        """
+        مشخصات انتخاب اول
+
+        اگر queryset با Application.objects.with_first_choice() ساخته شده باشد از ستون‌های
+        annotate شده خوانده می‌شود (بدون کوئری اضافه)؛ در غیر این صورت یک کوئری اجرا می‌شود.
+        """
+        if hasattr(obj, 'first_choice_program_id'):
+            if obj.first_choice_program_id is None:
+                return None
+            return {name: getattr(obj, name) for name in FIRST_CHOICE_FIELDS}
+
         first_choice = obj.choices.select_related(
             'program__faculty',
             'program__department'
         ).order_by('priority').first()
-        
+
         if not first_choice:
             return None
 
@@ -279,40 +294,49 @@ class AdminApplicationListSerializer(serializers.ModelSerializer):
         except ObjectDoesNotExist:
             return None
 
-        if not program or not faculty or not department:
+        return {
+            'first_choice_priority': first_choice.priority,
+            'first_choice_program_id': program.id,
+            'first_choice_program_name': program.name,
+            'first_choice_program_code': program.code,
+            'first_choice_orientation': program.orientation,
+            'first_choice_faculty_id': faculty.id if faculty else None,
+            'first_choice_faculty_name': faculty.name if faculty else None,
+            'first_choice_department_id': department.id if department else None,
+            'first_choice_department_name': department.name if department else None,
+        }
+
+    def get_faculty_department(self, obj):
+        """دانشکده/گروه آموزشی از اولین انتخاب"""
+        first_choice = self._first_choice(obj)
+
+        if not first_choice:
+            return None
+
+        if first_choice['first_choice_faculty_id'] is None or first_choice['first_choice_department_id'] is None:
             return None
 
         return {
-            'faculty_id': faculty.id,
-            'faculty_name': faculty.name,
-            'department_id': department.id,
-            'department_name': department.name,
+            'faculty_id': first_choice['first_choice_faculty_id'],
+            'faculty_name': first_choice['first_choice_faculty_name'],
+            'department_id': first_choice['first_choice_department_id'],
+            'department_name': first_choice['first_choice_department_name'],
         }
-        return None
     
     def get_selected_program(self, obj):
         """رشته انتخابی با اولویت اول"""
-        first_choice = obj.choices.select_related('program').order_by('priority').first()
+        first_choice = self._first_choice(obj)
         
         if not first_choice:
             return None
 
-        try:
-            program = first_choice.program
-        except ObjectDoesNotExist:
-            return None
-
-        if not program:
-            return None
-
         return {
-            'program_id': program.id,
-            'program_name': program.name,
-            'program_code': program.code,
-            'orientation': program.orientation,
-            'priority': first_choice.priority,
+            'program_id': first_choice['first_choice_program_id'],
+            'program_name': first_choice['first_choice_program_name'],
+            'program_code': first_choice['first_choice_program_code'],
+            'orientation': first_choice['first_choice_orientation'],
+            'priority': first_choice['first_choice_priority'],
         }
-        return None
     
     def get_university_info(self, obj):
         """دانشگاه محل تحصیل + ضریب"""
@@ -417,6 +441,25 @@ class ApplicationDetailSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Application
+        # پروفایل prefetch (apps.api.prefetch): گراف کامل صفحه جزئیات
+        select_related = ['applicant__user', 'round']
+        prefetch_related = [
+            'choices__program__faculty',
+            'choices__program__department',
+            'education_records',
+            # سوابق تحقیقاتی
+            'research_articles',
+            'patents',
+            'festival_awards',
+            'conference_articles',
+            'books',
+            'masters_thesis',
+            # سوابق المپیاد و زبان
+            'olympiad_records',
+            'language_certificates',
+            # مصاحبه
+            'interview',
+        ]
         fields = [
             'id', 'applicant', 'applicant_name', 'applicant_national_id',
             'round', 'round_title', 'round_type', 'tracking_code',
@@ -471,6 +514,8 @@ class AdminApplicationDetailSerializer(ApplicationDetailSerializer):
     education_scoring = serializers.SerializerMethodField()
 
     class Meta(ApplicationDetailSerializer.Meta):
+        select_related = ApplicationDetailSerializer.Meta.select_related + ['education_scoring']
+        prefetch_related = ApplicationDetailSerializer.Meta.prefetch_related + ['documents']
         fields = ApplicationDetailSerializer.Meta.fields + [
             'documents',
             'education_scoring',
@@ -492,11 +537,37 @@ class ApplicantApplicationDetailSerializer(ApplicationDetailSerializer):
     documents = ApplicationDocumentSimpleSerializer(many=True, read_only=True)
 
     class Meta(ApplicationDetailSerializer.Meta):
+        prefetch_related = ApplicationDetailSerializer.Meta.prefetch_related + ['documents']
         fields = ApplicationDetailSerializer.Meta.fields + [
             'documents',
         ]
 
 
+class ApplicantApplicationSummarySerializer(serializers.ModelSerializer):
+    """
+    خلاصه پرونده برای لیست پرونده‌های داوطلب (ApplicationSummary)
+
+    گراف کامل پرونده (انتخاب‌ها، سوابق، مدارک) فقط در endpoint جزئیات برگردانده می‌شود.
+    """
+    id = serializers.IntegerField(source='application_id', read_only=True)
+    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    steps = serializers.DictField(child=serializers.BooleanField(), read_only=True)
+    created_at = serializers.DateTimeField(source='application_created_at', read_only=True)
+    updated_at = serializers.DateTimeField(source='application_updated_at', read_only=True)
+
+    class Meta:
+        model = ApplicationSummary
+        fields = [
+            'id', 'tracking_code', 'round_type', 'round_title',
+            'status', 'status_display', 'steps',
+            'university_review_status', 'admission_overall_status', 'total_score',
+            'choices_count', 'education_records_count',
+            'documents_count', 'approved_documents_count', 'rejected_documents_count',
+            'research_summary', 'created_at', 'updated_at',
+        ]
+        read_only_fields = fields
+
+
 class ProgramApplicantSerializer(serializers.Serializer):
     """رکورد داوطلبان واجد شرایط برای تخصیص نهایی"""
     application_id = serializers.IntegerField()
@@ -16,6 +16,7 @@ urlpatterns = [
     path('applications/<int:application_id>/update/', applications_views.update_application, name='update-application'),
     
     # Submit application for review
+    path('applications/<int:application_id>/readiness/', applications_views.application_readiness, name='application-readiness'),
     path('applications/<int:application_id>/submit/', applications_views.submit_application, name='submit-application'),
     
     # Application choices (program selection)
@@ -38,4 +39,15 @@ urlpatterns = [
     # Applicant documents
     path('applications/<int:application_id>/documents/', documents_views.applicant_documents, name='applicant-documents'),
     path('applications/<int:application_id>/documents/<int:document_id>/', documents_views.applicant_document_delete, name='applicant-document-delete'),
+    path('applications/<int:application_id>/documents/uploads/', documents_views.document_upload_sessions, name='document-upload-sessions'),
+    path(
+        'applications/<int:application_id>/documents/uploads/<uuid:token>/',
+        documents_views.document_upload_session,
+        name='document-upload-session'
+    ),
+    path(
+        'applications/<int:application_id>/documents/uploads/<uuid:token>/complete/',
+        documents_views.complete_document_upload,
+        name='document-upload-complete'
+    ),
 ]
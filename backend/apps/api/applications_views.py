@@ -7,16 +7,19 @@ from rest_framework.response import Response
 from rest_framework import status
 from django.shortcuts import get_object_or_404
 from django.db import transaction
-from django.utils import timezone
 
 from apps.applications.models import Application, ApplicationChoice, ApplicationEducationRecord
 from apps.accounts.models import ApplicantProfile
+from apps.applications.dashboard import get_applicant_dashboard
+from apps.applications.readiness import get_application_readiness
 from .applications_serializers import (
     ApplicantApplicationDetailSerializer,
+    ApplicantApplicationSummarySerializer,
     ApplicationDetailSerializer,
     ApplicationChoiceSerializer,
     ApplicationEducationRecordSerializer
 )
+from .prefetch import with_prefetch_profile
 
 
 @api_view(['GET'])
@@ -24,44 +27,24 @@ from .applications_serializers import (
 def my_applications_list(request):
     """
     لیست درخواست‌های کاربر فعلی
+    
+    خلاصه هر پرونده (وضعیت، مراحل تکمیل‌شده، تعداد مدارک و خلاصه سوابق پژوهشی)
+    از cache یا جدول ApplicationSummary خوانده می‌شود؛ جزئیات کامل پرونده از
+    applications/<id>/ دریافت می‌شود.
     """
-    try:
-        # Get applicant profile
-        applicant = ApplicantProfile.objects.get(user=request.user)
-        
-        # Get all applications for this applicant
-        applications = Application.objects.filter(
-            applicant=applicant
-        ).select_related(
-            'round',
-            'university_of_study'
-        ).prefetch_related(
-            'choices__program__faculty',
-            'choices__program__department',
-            'education_records',
-            'documents',
-            # Research records
-            'research_articles',
-            'patents',
-            'festival_awards',
-            'conference_articles',
-            'books',
-            'masters_thesis',
-            # Olympiad & language
-            'olympiad_records',
-            'language_certificates',
-            # Interview
-            'interview'
-        ).order_by('-created_at')
-        
-        serializer = ApplicantApplicationDetailSerializer(applications, many=True, context={'request': request})
-        return Response(serializer.data)
-        
-    except ApplicantProfile.DoesNotExist:
+    applications = get_applicant_dashboard(
+        request.user,
+        lambda summaries: [dict(row) for row in ApplicantApplicationSummarySerializer(summaries, many=True).data],
+    )
+    if applications:
+        return Response(applications)
+    
+    if not ApplicantProfile.objects.filter(user=request.user).exists():
         return Response(
             {'error': 'پروفایل متقاضی یافت نشد'},
             status=status.HTTP_404_NOT_FOUND
         )
+    return Response(applications)
 
 
 @api_view(['GET'])
@@ -74,24 +57,7 @@ def application_detail(request, application_id):
         applicant = ApplicantProfile.objects.get(user=request.user)
         
         application = get_object_or_404(
-            Application.objects.select_related(
-                'round',
-                'university_of_study'
-            ).prefetch_related(
-                'choices__program__faculty',
-                'choices__program__department',
-                'education_records',
-                'documents',
-                'research_articles',
-                'patents',
-                'festival_awards',
-                'conference_articles',
-                'books',
-                'masters_thesis',
-                'olympiad_records',
-                'language_certificates',
-                'interview'
-            ),
+            with_prefetch_profile(Application.objects.all(), ApplicantApplicationDetailSerializer),
             id=application_id,
             applicant=applicant
         )
@@ -141,6 +107,19 @@ def update_application(request, application_id):
         )
 
 
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def application_readiness(request, application_id):
+    """
+    آمادگی پرونده برای ارسال نهایی
+    
+    همان بررسی‌های ارسال نهایی بدون تغییر پرونده؛ خروجی شامل ready و لیست
+    موارد ناقص (code، message) است.
+    """
+    application = get_object_or_404(Application, id=application_id, applicant__user=request.user)
+    return Response(get_application_readiness(application).as_dict())
+
+
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def submit_application(request, application_id):
@@ -151,66 +130,21 @@ def submit_application(request, application_id):
         applicant = ApplicantProfile.objects.get(user=request.user)
         application = get_object_or_404(Application, id=application_id, applicant=applicant)
         
-        # Validation checks
-        errors = []
-        
-        # Check program choices
-        if not application.choices.exists():
-            errors.append('حداقل یک رشته باید انتخاب شود')
-        
-        # Check personal info
-        user = request.user
-        if not all([user.first_name, user.last_name, user.father_name, user.gender]):
-            errors.append('اطلاعات شخصی کامل نیست')
-        
-        # Check identity documents
-        identity_docs = application.documents.filter(
-            type__in=['PERSONAL_PHOTO', 'NATIONAL_CARD', 'ID_CARD']
-        )
-        if identity_docs.count() < 3:
-            errors.append('مدارک شناسایی کامل نیست')
-        
-        # Check education records
-        if not application.education_records.filter(degree_level='BSC').exists():
-            errors.append('اطلاعات تحصیلی کارشناسی الزامی است')
-        
-        # For PhD, check MSC record
-        if application.round.type == 'PHD_TALENT':
-            if not application.education_records.filter(degree_level='MSC').exists():
-                errors.append('اطلاعات تحصیلی کارشناسی ارشد الزامی است')
-        
-        # Check education documents - بسته به وضعیت تحصیلی
-        bsc_record = application.education_records.filter(degree_level='BSC').first()
-        if bsc_record:
-            if bsc_record.status == 'GRADUATED':
-                # فارغ‌التحصیل: باید مدرک + ریزنمرات داشته باشد
-                required_docs = ['BSC_CERT', 'BSC_TRANSCRIPT']
-                required_count = 2
-            else:
-                # درحال تحصیل: فقط ریزنمرات کافیست
-                required_docs = ['BSC_TRANSCRIPT', 'ENROLLMENT_CERT']
-                required_count = 1
-            
-            edu_docs = application.documents.filter(type__in=required_docs)
-            if edu_docs.count() < required_count:
-                if bsc_record.status == 'GRADUATED':
-                    errors.append('مدارک تحصیلی کارشناسی کامل نیست (مدرک فراغت + ریزنمرات)')
-                else:
-                    errors.append('مدارک تحصیلی کارشناسی کامل نیست (ریزنمرات)')
-        else:
-            errors.append('اطلاعات تحصیلی کارشناسی الزامی است')
-        
-        if errors:
+        # بررسی آمادگی پرونده (یک کوئری؛ همه موارد ناقص یک‌جا)
+        readiness = get_application_readiness(application)
+        if not readiness.ready:
             return Response(
-                {'errors': errors},
+                {'errors': readiness.errors, 'missing': readiness.missing},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
         # Update application status
-        application.status = 'SUBMITTED'
-        application.submitted_at = timezone.now()
-        application.save()
+        application.status = Application.Status.SUBMITTED
+        application.save(update_fields=['status', 'updated_at'])
         
+        application = with_prefetch_profile(
+            Application.objects.all(), ApplicationDetailSerializer
+        ).get(pk=application.pk)
         serializer = ApplicationDetailSerializer(application)
         return Response({
             'message': 'درخواست با موفقیت ارسال شد',
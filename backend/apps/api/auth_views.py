@@ -15,6 +15,7 @@ from apps.accounts.models import ApplicantProfile
 from apps.admissions.models import AdmissionRound
 from apps.applications.models import Application
 from apps.workflow.models import ApplicationWorkflowLog
+from apps.workflow.logs import log_workflow_step
 from apps.api.accounts_serializers import UserLoginSerializer, UserRegistrationSerializer
 
 User = get_user_model()
@@ -90,10 +91,10 @@ def register_initial(request):
             
             # Create workflow log if new
             if app_created:
-                ApplicationWorkflowLog.objects.create(
-                    application=application,
-                    step_type='APPLICANT_SUBMITTED',
-                    description='ثبت‌نام اولیه انجام شد',
+                log_workflow_step(
+                    application,
+                    ApplicationWorkflowLog.StepType.APPLICANT_SUBMITTED,
+                    'ثبت‌نام اولیه انجام شد',
                     created_by=user
                 )
             
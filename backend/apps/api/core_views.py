@@ -11,6 +11,7 @@ from rest_framework import filters
 from apps.core.models import Faculty, Department
 from apps.api.core_serializers import FacultySerializer, DepartmentSerializer
 from apps.api.permissions import IsAdmin
+from apps.api.filters import NormalizedSearchFilter
 
 
 class FacultyViewSet(viewsets.ModelViewSet):
@@ -27,9 +28,9 @@ class FacultyViewSet(viewsets.ModelViewSet):
     queryset = Faculty.objects.all()
     serializer_class = FacultySerializer
     permission_classes = [IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, NormalizedSearchFilter, filters.OrderingFilter]
     filterset_fields = ['is_active']
-    search_fields = ['name', 'code']
+    search_fields = ['name_normalized', 'code']
     ordering_fields = ['name', 'created_at']
     ordering = ['name']
     
@@ -71,9 +72,9 @@ class DepartmentViewSet(viewsets.ModelViewSet):
     queryset = Department.objects.select_related('faculty').all()
     serializer_class = DepartmentSerializer
     permission_classes = [IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, NormalizedSearchFilter, filters.OrderingFilter]
     filterset_fields = ['is_active', 'faculty']
-    search_fields = ['name', 'code', 'faculty__name']
+    search_fields = ['name_normalized', 'code', 'faculty__name_normalized']
     ordering_fields = ['name', 'created_at']
     ordering = ['faculty__name', 'name']
     
@@ -1,8 +1,12 @@
 """
 Serializers for documents app
 """
+import os
+import re
+
 from rest_framework import serializers
-from apps.documents.models import ApplicationDocument
+from apps.documents.models import ApplicationDocument, DocumentUploadSession
+from apps.documents.uploads import ALLOWED_EXTENSIONS, max_chunk_size, max_upload_size
 
 
 class ApplicationDocumentSerializer(serializers.ModelSerializer):
@@ -28,3 +32,52 @@ class DocumentReviewSerializer(serializers.Serializer):
     """Serializer for document review"""
     status = serializers.ChoiceField(choices=ApplicationDocument.Status.choices)
     review_comment = serializers.CharField(required=False, allow_blank=True)
+
+
+class DocumentUploadSessionSerializer(serializers.ModelSerializer):
+    """Serializer for chunked upload sessions (status / resume point)"""
+    chunk_size = serializers.SerializerMethodField()
+    document = ApplicationDocumentSerializer(read_only=True)
+    
+    class Meta:
+        model = DocumentUploadSession
+        fields = [
+            'token', 'type', 'filename', 'total_size', 'checksum',
+            'received_size', 'chunk_size', 'status', 'document', 'created_at'
+        ]
+        read_only_fields = fields
+    
+    def get_chunk_size(self, obj):
+        return max_chunk_size()
+
+
+class DocumentUploadSessionCreateSerializer(serializers.ModelSerializer):
+    """Serializer for starting a chunked upload"""
+    
+    class Meta:
+        model = DocumentUploadSession
+        fields = ['type', 'filename', 'total_size', 'checksum']
+    
+    def validate_filename(self, value):
+        value = os.path.basename(value.replace('\\', '/')).strip()
+        extension = os.path.splitext(value)[1].lower().lstrip('.')
+        if not value or extension not in ALLOWED_EXTENSIONS:
+            raise serializers.ValidationError(
+                f'فرمت فایل مجاز نیست (مجاز: {", ".join(ALLOWED_EXTENSIONS)})'
+            )
+        return value
+    
+    def validate_total_size(self, value):
+        if value <= 0:
+            raise serializers.ValidationError('حجم فایل نامعتبر است')
+        if value > max_upload_size():
+            raise serializers.ValidationError(
+                f'حجم فایل نباید بیشتر از {max_upload_size() // (1024 * 1024)} مگابایت باشد'
+            )
+        return value
+    
+    def validate_checksum(self, value):
+        value = value.strip().lower()
+        if not re.fullmatch(r'[0-9a-f]{64}', value):
+            raise serializers.ValidationError('checksum باید SHA-256 (۶۴ کاراکتر hex) باشد')
+        return value
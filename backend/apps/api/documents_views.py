@@ -1,5 +1,8 @@
 """
 Applicant document upload/delete endpoints.
+
+Large files can be uploaded in chunks through upload sessions
+(apps.documents.uploads): init, PUT chunk at offset, complete.
 """
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
@@ -8,8 +11,19 @@ from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
 
 from apps.applications.models import Application
-from apps.documents.models import ApplicationDocument
-from .documents_serializers import ApplicationDocumentSerializer
+from apps.documents.models import ApplicationDocument, DocumentUploadSession
+from apps.documents.uploads import (
+    OFFSET_MISMATCH,
+    append_chunk,
+    cancel_upload,
+    complete_upload,
+    max_chunk_size,
+)
+from .documents_serializers import (
+    ApplicationDocumentSerializer,
+    DocumentUploadSessionCreateSerializer,
+    DocumentUploadSessionSerializer,
+)
 
 
 @api_view(['GET', 'POST'])
@@ -38,6 +52,101 @@ def applicant_documents(request, application_id):
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+@api_view(['GET', 'POST'])
+@permission_classes([IsAuthenticated])
+def document_upload_sessions(request, application_id):
+    """
+    آپلود تکه‌ای مدرک
+    
+    GET: نشست‌های ناتمام پرونده (برای ادامه آپلود پس از قطع اتصال)
+    POST: شروع آپلود با type، filename، total_size و checksum (SHA-256 کل فایل)؛
+          سپس تکه‌ها با PUT uploads/<token>/ و هدر Upload-Offset (یا ?offset=)
+          و در پایان POST uploads/<token>/complete/
+    """
+    application = get_object_or_404(
+        Application,
+        id=application_id,
+        applicant__user=request.user
+    )
+
+    if request.method == 'GET':
+        sessions = DocumentUploadSession.objects.filter(
+            application=application,
+            status=DocumentUploadSession.Status.UPLOADING
+        )
+        return Response(DocumentUploadSessionSerializer(sessions, many=True).data)
+
+    serializer = DocumentUploadSessionCreateSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    session = serializer.save(application=application)
+    return Response(DocumentUploadSessionSerializer(session).data, status=status.HTTP_201_CREATED)
+
+
+def _get_own_upload_session(request, application_id, token):
+    return get_object_or_404(
+        DocumentUploadSession.objects.select_related('application', 'document'),
+        token=token,
+        application_id=application_id,
+        application__applicant__user=request.user
+    )
+
+
+@api_view(['GET', 'PUT', 'DELETE'])
+@permission_classes([IsAuthenticated])
+def document_upload_session(request, application_id, token):
+    """
+    GET: وضعیت آپلود (received_size نقطه ادامه است)
+    PUT: بدنه خام درخواست یک تکه از فایل است که از offset نوشته می‌شود
+    DELETE: لغو آپلود
+    """
+    session = _get_own_upload_session(request, application_id, token)
+
+    if request.method == 'GET':
+        return Response(DocumentUploadSessionSerializer(session).data)
+
+    if request.method == 'DELETE':
+        cancel_upload(session)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    try:
+        offset = int(request.headers.get('Upload-Offset', request.GET.get('offset', '')))
+        length = int(request.META.get('CONTENT_LENGTH') or 0)
+    except ValueError:
+        return Response({'error': 'offset نامعتبر است'}, status=status.HTTP_400_BAD_REQUEST)
+    if length <= 0:
+        return Response({'error': 'تکه فایل ارسال نشده است'}, status=status.HTTP_400_BAD_REQUEST)
+    if length > max_chunk_size():
+        return Response(
+            {'error': f'حجم هر تکه نباید بیشتر از {max_chunk_size()} بایت باشد'},
+            status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        )
+
+    # بدنه مستقیماً از stream خوانده می‌شود (request.data استفاده نمی‌شود)
+    session, error = append_chunk(session, offset, request.stream, length)
+    if error:
+        code = status.HTTP_409_CONFLICT if error == OFFSET_MISMATCH else status.HTTP_400_BAD_REQUEST
+        return Response(
+            {'error': error, 'received_size': session.received_size},
+            status=code
+        )
+    return Response(DocumentUploadSessionSerializer(session).data)
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def complete_document_upload(request, application_id, token):
+    """بررسی checksum و ثبت مدرک آپلودشده"""
+    session = _get_own_upload_session(request, application_id, token)
+    session, error = complete_upload(session)
+    if error:
+        return Response(
+            {'error': error, 'received_size': session.received_size},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    return Response(ApplicationDocumentSerializer(session.document).data, status=status.HTTP_201_CREATED)
+
+
 @api_view(['DELETE'])
 @permission_classes([IsAuthenticated])
 def applicant_document_delete(request, application_id, document_id):
@@ -0,0 +1,66 @@
+"""
+خروجی CSV / XLSX لیست پرونده‌ها برای کمیته‌ها
+
+ستون‌ها و خواندن تکه‌ای ردیف‌ها در apps.applications.exports تعریف شده‌اند.
+
+- CSV: با StreamingHttpResponse ردیف به ردیف ارسال می‌شود (ارسال بلافاصله شروع می‌شود)
+- XLSX: با openpyxl در حالت write-only (حافظه ثابت) در فایل موقت نوشته و سپس ارسال می‌شود
+"""
+import csv
+import io
+import tempfile
+
+from django.http import FileResponse, StreamingHttpResponse
+from django.utils import timezone
+
+from apps.applications.exports import export_header, export_rows, write_xlsx
+
+
+# تعداد ردیف‌های CSV در هر تکه ارسالی
+CSV_ROWS_PER_CHUNK = 200
+
+EXPORT_FORMATS = ('csv', 'xlsx')
+
+
+def _csv_chunks(header, rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # BOM برای نمایش درست متن فارسی در Excel
+    buffer.write('\ufeff')
+    writer.writerow(header)
+
+    for index, row in enumerate(rows, start=1):
+        writer.writerow(row)
+        if index % CSV_ROWS_PER_CHUNK == 0:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode('utf-8')
+
+
+def _filename(extension, prefix='applications'):
+    return '{}-{}.{}'.format(prefix, timezone.localtime().strftime('%Y%m%d-%H%M'), extension)
+
+
+def csv_rows_response(header, rows, prefix):
+    """ارسال تدریجی ردیف‌های دلخواه (iterator از لیست مقادیر) به صورت CSV"""
+    response = StreamingHttpResponse(_csv_chunks(header, rows), content_type='text/csv; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="{_filename("csv", prefix)}"'
+    return response
+
+
+def csv_export_response(queryset):
+    return csv_rows_response(export_header(), export_rows(queryset), 'applications')
+
+
+def xlsx_export_response(queryset):
+    # فایل zip (XLSX) قبل از بسته شدن قابل ارسال نیست؛ در فایل موقت روی دیسک نوشته می‌شود
+    target = tempfile.TemporaryFile(suffix='.xlsx')
+    write_xlsx(export_rows(queryset), target)
+    target.seek(0)
+    return FileResponse(
+        target,
+        as_attachment=True,
+        filename=_filename('xlsx'),
+        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    )
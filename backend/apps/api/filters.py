@@ -0,0 +1,27 @@
+"""
+فیلترهای مشترک API
+"""
+from django.db.models.constants import LOOKUP_SEP
+from rest_framework import filters
+
+from apps.core.text import normalize_persian
+
+
+class NormalizedSearchFilter(filters.SearchFilter):
+    """
+    SearchFilter با یکسان‌سازی عبارت جستجو (ی/ک عربی، ارقام فارسی، نیم‌فاصله)
+
+    برای استفاده روی ستون‌های سایه *_normalized که هنگام ذخیره با همین تابع پر می‌شوند.
+    هر دو طرف از قبل با normalize_persian کوچک شده‌اند؛ روی این ستون‌ها contains
+    (LIKE بدون UPPER) به کار می‌رود تا ایندکس trigram در PostgreSQL استفاده شود.
+    بقیه فیلدها (کد ملی، ایمیل، کد) مانند SearchFilter با icontains جستجو می‌شوند.
+    """
+
+    def get_search_terms(self, request):
+        terms = (normalize_persian(term) for term in super().get_search_terms(request))
+        return [term for term in terms if term]
+
+    def construct_search(self, field_name, *args):
+        if field_name.endswith('_normalized'):
+            return LOOKUP_SEP.join([field_name, 'contains'])
+        return super().construct_search(field_name, *args)
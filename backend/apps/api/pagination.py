@@ -0,0 +1,162 @@
+"""
+صفحه‌بندی لیست پرونده‌ها
+
+- ApplicationPagination: صفحه‌بندی شماره‌ای (page / page_size) برای کلاینت‌های قدیمی
+- ApplicationKeysetPagination: صفحه‌بندی cursor (keyset) روی (created_at, id) یا (total_score, id)
+  بدون OFFSET؛ با ?pagination=cursor یا ?cursor=... فعال می‌شود (کلیدهای apps.api.sorting)
+
+در هر دو حالت تعداد کل (count) برای مدت کوتاهی cache می‌شود تا COUNT(*) روی
+کوئری‌های دارای distinct در هر صفحه تکرار نشود.
+"""
+import base64
+import hashlib
+import json
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db.models import Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .sorting import APPLICATION_SORTS, DEFAULT_APPLICATION_SORT, application_ordering
+
+
+def _count_cache_ttl():
+    return getattr(settings, 'PAGINATION_COUNT_CACHE_TTL', 60)
+
+
+def cached_count(queryset):
+    """
+    تعداد ردیف‌های queryset با cache کوتاه‌مدت
+
+    کلید از متن SQL (بدون مرتب‌سازی) ساخته می‌شود؛ در صورت عدم امکان ساخت SQL
+    تعداد دقیق محاسبه می‌شود.
+    """
+    try:
+        sql = str(queryset.order_by().query)
+    except Exception:
+        return queryset.count()
+
+    key = 'pagination_count:' + hashlib.md5(sql.encode('utf-8')).hexdigest()
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, timeout=_count_cache_ttl())
+    return count
+
+
+class CachedCountPaginator(Paginator):
+    @cached_property
+    def count(self):
+        return cached_count(self.object_list)
+
+
+class ApplicationPagination(PageNumberPagination):
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    django_paginator_class = CachedCountPaginator
+
+
+class ApplicationKeysetPagination(BasePagination):
+    """
+    صفحه‌بندی keyset
+
+    cursor شامل مقدار فیلد مرتب‌سازی و id آخرین ردیف صفحه قبل است و صفحه بعد با
+    شرط (field, id) < (value, last_id) خوانده می‌شود؛ هزینه هر صفحه مستقل از عمق آن است.
+    پاسخ: count (cache شده)، next، next_cursor و results.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+
+    def __init__(self, sort_by=DEFAULT_APPLICATION_SORT):
+        self.sort_by = sort_by
+        self.field, self.descending = APPLICATION_SORTS[sort_by]
+
+    @classmethod
+    def is_requested(cls, request):
+        return (
+            request.query_params.get('pagination') == 'cursor'
+            or cls.cursor_query_param in request.query_params
+        )
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def encode_cursor(self, obj):
+        value = getattr(obj, self.field)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        payload = json.dumps([value, obj.pk]).encode('utf-8')
+        return base64.urlsafe_b64encode(payload).decode('ascii')
+
+    def decode_cursor(self, cursor):
+        try:
+            value, pk = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+            if self.field == 'created_at':
+                value = datetime.fromisoformat(value)
+            return value, int(pk)
+        except (TypeError, ValueError):
+            raise NotFound('cursor نامعتبر است')
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size_value = self.get_page_size(request)
+        self.count = cached_count(queryset)
+
+        queryset = queryset.order_by(*application_ordering(self.sort_by))
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            value, pk = self.decode_cursor(cursor)
+            if self.descending:
+                queryset = queryset.filter(
+                    Q(**{f'{self.field}__lt': value}) | Q(**{self.field: value, 'id__lt': pk})
+                )
+            else:
+                queryset = queryset.filter(
+                    Q(**{f'{self.field}__gt': value}) | Q(**{self.field: value, 'id__gt': pk})
+                )
+
+        rows = list(queryset[:self.page_size_value + 1])
+        self.has_next = len(rows) > self.page_size_value
+        self.page = rows[:self.page_size_value]
+        return self.page
+
+    def get_next_cursor(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1])
+
+    def get_next_link(self):
+        cursor = self.get_next_cursor()
+        if cursor is None:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), 'pagination')
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'count': self.count,
+            'next': self.get_next_link(),
+            'next_cursor': self.get_next_cursor(),
+            'results': data,
+        })
+
+
+def get_application_paginator(request, sort_by):
+    """انتخاب صفحه‌بندی: cursor در صورت درخواست، در غیر این صورت شماره‌ای"""
+    if ApplicationKeysetPagination.is_requested(request) and sort_by in APPLICATION_SORTS:
+        return ApplicationKeysetPagination(sort_by)
+    return ApplicationPagination()
@@ -0,0 +1,37 @@
+"""
+پروفایل prefetch برای serializer ها
+
+هر serializer در Meta خود روابطی را که واقعاً نمایش می‌دهد اعلام می‌کند و view ها
+queryset را از همین اعلام می‌سازند؛ به این ترتیب لیست‌ها فقط همان چیزی را که
+نمایش می‌دهند می‌خوانند و صفحه جزئیات گراف کامل را نگه می‌دارد.
+
+    class Meta:
+        model = Application
+        select_related = ['applicant__user', 'round']
+        prefetch_related = ['choices__program__faculty']
+        queryset_methods = ['with_first_choice']   # متدهای QuerySet مدل
+
+    queryset = with_prefetch_profile(Application.objects.all(), AdminApplicationListSerializer)
+"""
+
+
+def get_prefetch_profile(serializer_class):
+    """خواندن پروفایل اعلام شده در Meta (در صورت ارث‌بری، Meta والد نیز خوانده می‌شود)"""
+    meta = getattr(serializer_class, 'Meta', None)
+    return {
+        'select_related': list(getattr(meta, 'select_related', [])),
+        'prefetch_related': list(getattr(meta, 'prefetch_related', [])),
+        'queryset_methods': list(getattr(meta, 'queryset_methods', [])),
+    }
+
+
+def with_prefetch_profile(queryset, serializer_class):
+    """اعمال select_related / prefetch_related / متدهای QuerySet اعلام شده در serializer"""
+    profile = get_prefetch_profile(serializer_class)
+    if profile['select_related']:
+        queryset = queryset.select_related(*profile['select_related'])
+    if profile['prefetch_related']:
+        queryset = queryset.prefetch_related(*profile['prefetch_related'])
+    for method in profile['queryset_methods']:
+        queryset = getattr(queryset, method)()
+    return queryset
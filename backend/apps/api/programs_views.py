@@ -1,27 +1,20 @@
 """
 Program API Views - برای انتخاب رشته توسط متقاضیان
 """
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from django.db.models import Q
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
 from apps.admissions.models import Program, AdmissionRound
+from apps.admissions.catalog import catalog_filters, get_catalog
 from apps.api.admissions_serializers import ProgramListSerializer
+from apps.core.text import normalize_persian
 
 
-@api_view(['GET'])
-@permission_classes([AllowAny])
-def available_programs(request):
-    """
-    لیست رشته‌های فعال و قابل انتخاب
-    
-    Query Parameters:
-    - round_type: نوع فراخوان (MA_TALENT, PHD_TALENT, PHD_EXAM, OLYMPIAD)
-    - degree_level: مقطع (MA, PHD)
-    - faculty_id: شناسه دانشکده
-    - department_id: شناسه گروه آموزشی
-    - search: جستجو در نام رشته
-    """
+def _available_programs_queryset(filters):
     # فیلتر پایه: فقط رشته‌های فعال
     queryset = Program.objects.filter(
         is_active=True,
@@ -29,39 +22,69 @@ def available_programs(request):
     ).select_related('faculty', 'department', 'round')
     
     # فیلتر بر اساس نوع فراخوان
-    round_type = request.query_params.get('round_type')
-    if round_type:
-        queryset = queryset.filter(round__type=round_type)
+    if filters['round_type']:
+        queryset = queryset.filter(round__type=filters['round_type'])
     
     # فیلتر بر اساس مقطع
-    degree_level = request.query_params.get('degree_level')
-    if degree_level:
-        queryset = queryset.filter(degree_level=degree_level)
+    if filters['degree_level']:
+        queryset = queryset.filter(degree_level=filters['degree_level'])
     
     # فیلتر بر اساس دانشکده
-    faculty_id = request.query_params.get('faculty_id')
-    if faculty_id:
-        queryset = queryset.filter(faculty_id=faculty_id)
+    if filters['faculty_id']:
+        queryset = queryset.filter(faculty_id=filters['faculty_id'])
     
     # فیلتر بر اساس گروه آموزشی
-    department_id = request.query_params.get('department_id')
-    if department_id:
-        queryset = queryset.filter(department_id=department_id)
+    if filters['department_id']:
+        queryset = queryset.filter(department_id=filters['department_id'])
     
-    # جستجو در نام رشته
-    search = request.query_params.get('search')
-    if search:
-        queryset = queryset.filter(
-            Q(name__icontains=search) |
-            Q(orientation__icontains=search) |
-            Q(code__icontains=search)
-        )
+    return queryset
+
+
+def _render_catalog(filters):
+    queryset = _available_programs_queryset(filters).order_by(
+        'faculty__name', 'department__name', 'name'
+    )
+    return JSONRenderer().render(ProgramListSerializer(queryset, many=True).data)
+
+
+@api_view(['GET'])
+@authentication_classes([])
+@permission_classes([AllowAny])
+def available_programs(request):
+    """
+    لیست رشته‌های فعال و قابل انتخاب
     
-    # مرتب‌سازی
-    queryset = queryset.order_by('faculty__name', 'department__name', 'name')
+    Query Parameters:
+    - round_type: نوع فراخوان (MA_TALENT, PHD_TALENT, PHD_EXAM, OLYMPIAD)
+    - degree_level: مقطع (MA, PHD)
+    - faculty_id: شناسه دانشکده
+    - department_id: شناسه گروه آموزشی
+    - search: جستجو در نام رشته
+    
+    بدون search پاسخ از کاتالوگ cache شده (apps.admissions.catalog) با ETag
+    ساخته می‌شود و If-None-Match معتبر پاسخ 304 می‌گیرد.
+    """
+    filters = catalog_filters(request.query_params)
+    
+    # جستجو در نام رشته (روی ستون‌های یکسان‌سازی‌شده؛ «علوم اقتصادي» = «علوم اقتصادی»)
+    search = normalize_persian(request.query_params.get('search'))
+    if search:
+        queryset = _available_programs_queryset(filters).filter(
+            Q(name_normalized__contains=search) |
+            Q(orientation_normalized__contains=search) |
+            Q(code__istartswith=search)
+        ).order_by('faculty__name', 'department__name', 'name')
+        serializer = ProgramListSerializer(queryset, many=True)
+        return Response(serializer.data)
     
-    serializer = ProgramListSerializer(queryset, many=True)
-    return Response(serializer.data)
+    body, etag = get_catalog(filters, _render_catalog)
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match and (if_none_match.strip() == '*' or etag in parse_etags(if_none_match)):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(body, content_type='application/json')
+    response['ETag'] = etag
+    return response
 
 
 @api_view(['GET'])
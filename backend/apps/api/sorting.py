@@ -0,0 +1,33 @@
+"""
+مرتب‌سازی مجاز لیست پرونده‌های ادمین
+
+فقط کلیدهای این جدول در sort_by پذیرفته می‌شوند؛ هر کلید با یکی از ایندکس‌های
+ترکیبی Application (round, status, created_at) / (round, status, total_score) /
+(round, university_review_status, created_at) پشتیبانی می‌شود. کلید ناشناخته به
+مرتب‌سازی پیش‌فرض برمی‌گردد.
+"""
+
+DEFAULT_APPLICATION_SORT = '-created_at'
+
+# sort_by -> (فیلد، نزولی؟)؛ id همیشه برای قطعی بودن ترتیب اضافه می‌شود
+APPLICATION_SORTS = {
+    '-created_at': ('created_at', True),
+    'created_at': ('created_at', False),
+    '-total_score': ('total_score', True),
+    'total_score': ('total_score', False),
+}
+
+
+def resolve_application_sort(sort_by):
+    """کلید مرتب‌سازی معتبر (یا پیش‌فرض)"""
+    if sort_by in APPLICATION_SORTS:
+        return sort_by
+    return DEFAULT_APPLICATION_SORT
+
+
+def application_ordering(sort_by):
+    """آرگومان‌های order_by برای یک کلید مرتب‌سازی"""
+    field, descending = APPLICATION_SORTS[resolve_application_sort(sort_by)]
+    if descending:
+        return (f'-{field}', '-id')
+    return (field, 'id')
@@ -9,3 +9,5 @@ class ApplicationsConfig(AppConfig):
     def ready(self):
         """Import signals when app is ready"""
         import apps.applications.signals
+        from apps.applications.requirements import requirements_table
+        requirements_table()
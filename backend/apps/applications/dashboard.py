@@ -0,0 +1,160 @@
+"""
+داشبورد داوطلب: لیست فشرده پرونده‌های هر داوطلب
+
+برای هر پرونده یک ردیف ApplicationSummary (وضعیت، تعداد انتخاب‌ها، سوابق و
+مدارک و خلاصه سوابق پژوهشی) نگه‌داری می‌شود و با signal ها پس از commit
+بازسازی می‌شود؛ هر بازسازی ردیف‌ها را با یک کوئری (شمارش‌ها به صورت زیرکوئری)
+می‌خواند.
+
+لیست هر داوطلب در فضای نام dashboard از apps.core.cache نگه‌داری می‌شود؛ در
+صورت نبود در cache با یک کوئری روی ایندکس (applicant, application_created_at)
+خوانده می‌شود. جزئیات کامل پرونده فقط در endpoint جزئیات ساخته می‌شود.
+"""
+from django.db import transaction
+from django.db.models import Count, Exists, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from apps.core.batching import defer_until_commit
+from apps.core.cache import namespace
+from apps.documents.models import ApplicationDocument
+from apps.applications.models import (
+    Application,
+    ApplicationChoice,
+    ApplicationEducationRecord,
+    ApplicationSummary,
+    Book,
+    ConferenceArticle,
+    FestivalAward,
+    LanguageCertificate,
+    MastersThesis,
+    OlympiadRecord,
+    Patent,
+    ResearchArticle,
+)
+
+
+SUMMARY_REFRESH_CHUNK_SIZE = 500
+
+# کلید خلاصه سوابق پژوهشی -> مدل
+RESEARCH_MODELS = {
+    'research_articles': ResearchArticle,
+    'patents': Patent,
+    'festival_awards': FestivalAward,
+    'conference_articles': ConferenceArticle,
+    'books': Book,
+    'olympiad_records': OlympiadRecord,
+    'language_certificates': LanguageCertificate,
+}
+
+
+def _count(model, condition=None):
+    rows = model.objects.filter(application=OuterRef('pk'))
+    if condition is not None:
+        rows = rows.filter(condition)
+    rows = rows.order_by().values('application').annotate(count=Count('id')).values('count')
+    return Coalesce(Subquery(rows, output_field=IntegerField()), Value(0))
+
+
+def _cache_key(user_id):
+    return ('applicant', user_id)
+
+
+def _invalidate_users(user_ids):
+    for user_id in set(user_ids):
+        invalidate_applicant_dashboard(user_id)
+
+
+def _refresh_chunk(application_ids):
+    rows = Application.objects.filter(id__in=application_ids).annotate(
+        choices_count=_count(ApplicationChoice),
+        education_records_count=_count(ApplicationEducationRecord),
+        documents_count=_count(ApplicationDocument),
+        approved_documents_count=_count(ApplicationDocument, Q(status=ApplicationDocument.Status.APPROVED)),
+        rejected_documents_count=_count(ApplicationDocument, Q(status=ApplicationDocument.Status.REJECTED)),
+        has_masters_thesis=Exists(MastersThesis.objects.filter(application=OuterRef('pk'))),
+        **{f'research_{key}': _count(model) for key, model in RESEARCH_MODELS.items()},
+    ).values(
+        'id', 'applicant_id', 'applicant__user_id', 'tracking_code', 'round__type', 'round__title',
+        'status', 'university_review_status', 'admission_overall_status', 'total_score',
+        'created_at', 'updated_at', 'choices_count', 'education_records_count', 'documents_count',
+        'approved_documents_count', 'rejected_documents_count', 'has_masters_thesis',
+        *(f'research_{key}' for key in RESEARCH_MODELS),
+    )
+
+    summaries = []
+    user_ids = []
+    for row in rows:
+        research = {key: row[f'research_{key}'] for key in RESEARCH_MODELS}
+        research['has_masters_thesis'] = row['has_masters_thesis']
+        research['total'] = sum(row[f'research_{key}'] for key in RESEARCH_MODELS)
+        summaries.append(ApplicationSummary(
+            application_id=row['id'],
+            applicant_id=row['applicant_id'],
+            tracking_code=row['tracking_code'],
+            round_type=row['round__type'],
+            round_title=row['round__title'],
+            status=row['status'],
+            university_review_status=row['university_review_status'] or '',
+            admission_overall_status=row['admission_overall_status'] or '',
+            total_score=row['total_score'] or 0,
+            choices_count=row['choices_count'],
+            education_records_count=row['education_records_count'],
+            documents_count=row['documents_count'],
+            approved_documents_count=row['approved_documents_count'],
+            rejected_documents_count=row['rejected_documents_count'],
+            research_summary=research,
+            application_created_at=row['created_at'],
+            application_updated_at=row['updated_at'],
+        ))
+        user_ids.append(row['applicant__user_id'])
+
+    with transaction.atomic():
+        # کاربران پرونده‌های حذف‌شده هم باید cache شان باطل شود
+        user_ids.extend(ApplicationSummary.objects.filter(
+            application_id__in=application_ids
+        ).values_list('applicant__user_id', flat=True))
+        ApplicationSummary.objects.filter(application_id__in=application_ids).delete()
+        ApplicationSummary.objects.bulk_create(summaries)
+
+    transaction.on_commit(lambda: _invalidate_users(user_ids))
+    return len(summaries)
+
+
+def refresh_application_summaries(application_ids):
+    """بازسازی خلاصه مجموعه‌ای از پرونده‌ها"""
+    application_ids = sorted({pk for pk in application_ids if pk is not None})
+    refreshed = 0
+    for start in range(0, len(application_ids), SUMMARY_REFRESH_CHUNK_SIZE):
+        refreshed += _refresh_chunk(application_ids[start:start + SUMMARY_REFRESH_CHUNK_SIZE])
+    return refreshed
+
+
+def schedule_summary_refresh(application_ids):
+    """ثبت پرونده‌ها برای بازسازی خلاصه پس از commit تراکنش جاری"""
+    defer_until_commit(refresh_application_summaries, application_ids)
+
+
+def invalidate_applicant_dashboard(user_id):
+    """باطل کردن لیست cache شده یک داوطلب"""
+    namespace('dashboard').delete(_cache_key(user_id))
+
+
+def invalidate_applicant_dashboards():
+    """باطل کردن لیست cache شده همه داوطلبان (مثلاً پس از تغییر عنوان فراخوان)"""
+    namespace('dashboard').invalidate()
+
+
+def _applicant_summaries(user):
+    return ApplicationSummary.objects.filter(applicant__user=user).order_by('-application_created_at')
+
+
+def get_applicant_dashboard(user, render):
+    """
+    لیست خلاصه پرونده‌های داوطلب از cache
+
+    render: تابعی که queryset خلاصه‌ها را به داده قابل ارسال تبدیل می‌کند
+    """
+    return namespace('dashboard').get_or_compute(
+        _cache_key(user.pk),
+        lambda: render(_applicant_summaries(user)),
+    )
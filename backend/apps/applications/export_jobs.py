@@ -0,0 +1,219 @@
+"""
+اجرای کارهای خروجی پس‌زمینه (ExportJob)
+
+ردیف‌ها با صفحه‌بندی keyset روی (فیلد مرتب‌سازی، id) به صورت تکه‌ای خوانده و به
+انتهای یک فایل CSV موقت (EXPORT_JOB_ROOT/<token>.csv.part) اضافه می‌شوند. پس از
+نوشتن هر تکه (flush + fsync) پیشرفت، cursor آخرین ردیف و حجم فایل ذخیره می‌شود؛
+اجرای مجدد پس از قطع شدن worker فایل را به آخرین حجم ذخیره‌شده کوتاه می‌کند و از
+همان cursor ادامه می‌دهد.
+
+در پایان، CSV به نام نهایی منتقل می‌شود یا برای XLSX در حالت write-only به فایل
+Excel تبدیل می‌شود. فایل‌ها خارج از MEDIA_ROOT نگه داشته و پس از
+EXPORT_JOB_RETENTION_HOURS با cleanup_export_jobs حذف می‌شوند.
+"""
+import csv
+import io
+import os
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.accounts.models import AdminPermission
+from apps.applications.exports import (
+    EXPORT_FIELDS,
+    export_header,
+    export_values,
+    format_export_row,
+    write_xlsx,
+)
+from apps.applications.filters import filter_university_applications
+from apps.applications.models import ExportJob
+
+
+# ستون‌هایی که هنگام تبدیل CSV به XLSX عددی نوشته می‌شوند
+NUMERIC_FIELDS = {'id': int, 'total_score': float}
+
+_PROGRESS_FIELDS = ['total_rows', 'processed_rows', 'cursor', 'bytes_written', 'updated_at']
+
+
+def _chunk_size():
+    return getattr(settings, 'EXPORT_JOB_CHUNK_SIZE', 2000)
+
+
+def _part_path(job):
+    return job.file.storage.path(f'{job.token}.csv.part')
+
+
+def _final_name(job):
+    return f'{job.token}.{job.output}'
+
+
+def _sort_field(job):
+    sort_by = job.sort_by or '-created_at'
+    return sort_by.lstrip('-'), sort_by.startswith('-')
+
+
+def _after_cursor(queryset, field, descending, cursor):
+    value, pk = cursor
+    lookup = 'lt' if descending else 'gt'
+    return queryset.filter(
+        Q(**{f'{field}__{lookup}': value}) | Q(**{field: value, f'id__{lookup}': pk})
+    )
+
+
+def _cursor_value(value):
+    # مقدار در JSONField ذخیره می‌شود؛ DateTimeField رشته ISO را در فیلتر می‌پذیرد
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
+
+
+def _csv_bytes(rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(row)
+    return buffer.getvalue().encode('utf-8')
+
+
+def mark_export_job_failed(job_id, message):
+    ExportJob.objects.filter(pk=job_id).exclude(status=ExportJob.Status.COMPLETED).update(
+        status=ExportJob.Status.FAILED,
+        error=message,
+        finished_at=timezone.now(),
+        updated_at=timezone.now(),
+    )
+
+
+def _write_rows(job, queryset, part_path):
+    field, descending = _sort_field(job)
+    field_index = EXPORT_FIELDS.index(field)
+    id_index = EXPORT_FIELDS.index('id')
+    ordering = (f'-{field}', '-id') if descending else (field, 'id')
+    chunk_size = _chunk_size()
+
+    os.makedirs(os.path.dirname(part_path), exist_ok=True)
+    resume = job.bytes_written and os.path.exists(part_path)
+    if not resume:
+        job.processed_rows = 0
+        job.cursor = None
+        job.bytes_written = 0
+
+    with open(part_path, 'r+b' if resume else 'wb') as part:
+        # حذف تکه نیمه‌کاره‌ای که پس از آخرین ذخیره پیشرفت نوشته شده است
+        part.truncate(job.bytes_written)
+        part.seek(job.bytes_written)
+        if not resume:
+            # BOM برای نمایش درست متن فارسی در Excel
+            part.write(b'\xef\xbb\xbf' + _csv_bytes([export_header()]))
+
+        while True:
+            chunk = queryset.order_by(*ordering)
+            if job.cursor:
+                chunk = _after_cursor(chunk, field, descending, job.cursor)
+            rows = list(export_values(chunk)[:chunk_size])
+            if not rows:
+                break
+
+            part.write(_csv_bytes(format_export_row(row) for row in rows))
+            part.flush()
+            os.fsync(part.fileno())
+
+            last = rows[-1]
+            job.cursor = [_cursor_value(last[field_index]), last[id_index]]
+            job.processed_rows += len(rows)
+            job.bytes_written = part.tell()
+            job.save(update_fields=_PROGRESS_FIELDS)
+
+            if len(rows) < chunk_size:
+                break
+
+
+def _typed_rows(reader):
+    indexes = {EXPORT_FIELDS.index(name): cast for name, cast in NUMERIC_FIELDS.items()}
+    for row in reader:
+        for index, cast in indexes.items():
+            try:
+                row[index] = cast(row[index])
+            except (IndexError, ValueError):
+                pass
+        yield row
+
+
+def _finalize(job, part_path):
+    final_path = job.file.storage.path(_final_name(job))
+    if job.output == ExportJob.Output.XLSX:
+        with open(part_path, newline='', encoding='utf-8-sig') as part:
+            reader = csv.reader(part)
+            next(reader, None)  # سطر عنوان
+            write_xlsx(_typed_rows(reader), final_path)
+        os.remove(part_path)
+    else:
+        os.replace(part_path, final_path)
+
+    job.file.name = _final_name(job)
+    job.status = ExportJob.Status.COMPLETED
+    job.finished_at = timezone.now()
+    job.save(update_fields=['file', 'status', 'finished_at', 'updated_at'])
+
+
+def run_export_job(job_id):
+    """اجرا (یا ادامه) یک کار خروجی؛ کار تکمیل‌شده دوباره اجرا نمی‌شود"""
+    job = ExportJob.objects.select_related('created_by').get(pk=job_id)
+    if job.status == ExportJob.Status.COMPLETED:
+        return job
+
+    job.status = ExportJob.Status.RUNNING
+    job.attempts += 1
+    job.started_at = job.started_at or timezone.now()
+    job.error = ''
+    job.save(update_fields=['status', 'attempts', 'started_at', 'error', 'updated_at'])
+
+    # دسترسی درخواست‌دهنده ممکن است پس از ثبت کار حذف شده باشد
+    if not AdminPermission.objects.filter(user_id=job.created_by_id).exists():
+        mark_export_job_failed(job.pk, 'درخواست‌دهنده دیگر دسترسی مسئول دانشگاه ندارد')
+        job.refresh_from_db()
+        return job
+
+    queryset, error = filter_university_applications(job.params, job.created_by)
+    if error:
+        mark_export_job_failed(job.pk, error)
+        job.refresh_from_db()
+        return job
+
+    if job.total_rows is None:
+        job.total_rows = queryset.count()
+        job.save(update_fields=['total_rows', 'updated_at'])
+
+    part_path = _part_path(job)
+    _write_rows(job, queryset, part_path)
+    _finalize(job, part_path)
+    return job
+
+
+def _remove_files(job):
+    paths = [_part_path(job)]
+    if job.file:
+        paths.append(job.file.path)
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def cleanup_export_jobs(max_age_hours):
+    """حذف کارهای خروجی پایان‌یافته (تکمیل‌شده یا ناموفق) قدیمی‌تر از max_age_hours ساعت و فایل‌های آن‌ها"""
+    cutoff = timezone.now() - timedelta(hours=max_age_hours)
+    jobs = ExportJob.objects.filter(
+        status__in=[ExportJob.Status.COMPLETED, ExportJob.Status.FAILED],
+        updated_at__lt=cutoff,
+    )
+    count = 0
+    for job in jobs.iterator():
+        _remove_files(job)
+        job.delete()
+        count += 1
+    return count
@@ -0,0 +1,96 @@
+"""
+ستون‌ها و ردیف‌های خروجی لیست پرونده‌ها (CSV / XLSX)
+
+ردیف‌ها با values_list() (فقط ستون‌های لازم، بدون ساخت شیء مدل) و iterator(chunk_size)
+خوانده می‌شوند؛ مصرف حافظه مستقل از تعداد پرونده‌هاست. استفاده در خروجی مستقیم
+(apps.api.exports) و کارهای خروجی پس‌زمینه (apps.applications.export_jobs).
+
+مقادیر متنی که با = + - @ یا tab/CR شروع می‌شوند با ' آغاز می‌شوند تا Excel و
+LibreOffice آن‌ها را فرمول تفسیر نکنند (CSV/formula injection).
+"""
+from django.utils import timezone
+
+from apps.admissions.models import AdmissionRound
+from apps.applications.models import Application
+
+
+EXPORT_CHUNK_SIZE = 2000
+
+# (ستون values()، عنوان ستون در فایل)
+EXPORT_COLUMNS = [
+    ('id', 'شناسه'),
+    ('tracking_code', 'کد پیگیری'),
+    ('applicant__user__national_id', 'کد ملی'),
+    ('applicant__user__first_name', 'نام'),
+    ('applicant__user__last_name', 'نام خانوادگی'),
+    ('round__type', 'نوع فراخوان'),
+    ('first_choice_program_code', 'کد رشته (اولویت اول)'),
+    ('first_choice_program_name', 'رشته (اولویت اول)'),
+    ('first_choice_orientation', 'گرایش'),
+    ('first_choice_faculty_name', 'دانشکده'),
+    ('first_choice_department_name', 'گروه آموزشی'),
+    ('university_of_study__name', 'دانشگاه محل تحصیل'),
+    ('status', 'وضعیت پرونده'),
+    ('university_review_status', 'وضعیت بررسی دانشگاه'),
+    ('total_score', 'امتیاز کل'),
+    ('created_at', 'تاریخ ثبت'),
+]
+
+# ستون‌هایی که به جای مقدار، عنوان فارسی آن‌ها نوشته می‌شود
+DISPLAY_CHOICES = {
+    'round__type': dict(AdmissionRound.RoundType.choices),
+    'status': dict(Application.Status.choices),
+    'university_review_status': dict(Application.UniversityReviewStatus.choices),
+}
+
+EXPORT_FIELDS = [field for field, _ in EXPORT_COLUMNS]
+
+
+def export_header():
+    return [title for _, title in EXPORT_COLUMNS]
+
+
+def export_values(queryset):
+    """queryset آماده خواندن مقادیر خام ستون‌های خروجی (به ترتیب EXPORT_FIELDS)"""
+    return queryset.with_first_choice().values_list(*EXPORT_FIELDS)
+
+
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def escape_formula(value):
+    """جلوگیری از اجرای مقدار متنی واردشده توسط داوطلب به عنوان فرمول در صفحه‌گسترده"""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def format_export_row(row):
+    """تبدیل مقادیر خام یک ردیف به مقادیر قابل نوشتن در فایل"""
+    values = []
+    for field, value in zip(EXPORT_FIELDS, row):
+        if field in DISPLAY_CHOICES:
+            value = DISPLAY_CHOICES[field].get(value, value)
+        elif hasattr(value, 'tzinfo'):
+            value = timezone.localtime(value).strftime('%Y-%m-%d %H:%M')
+        values.append('' if value is None else escape_formula(value))
+    return values
+
+
+def export_rows(queryset):
+    """ردیف‌های خروجی (لیست مقادیر به ترتیب EXPORT_COLUMNS) به صورت تکه‌ای"""
+    for row in export_values(queryset).iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield format_export_row(row)
+
+
+def write_xlsx(rows, target):
+    """نوشتن ردیف‌ها (بدون سطر عنوان) در target (مسیر یا فایل باز) با workbook در حالت write-only"""
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('پرونده‌ها')
+    sheet.sheet_view.rightToLeft = True
+    sheet.append(export_header())
+    for row in rows:
+        sheet.append(row)
+    workbook.save(target)
@@ -0,0 +1,99 @@
+"""
+فیلترهای لیست پرونده‌ها برای پنل ادمین
+"""
+from apps.applications.models import Application
+from apps.applications.search import search_applications
+
+
+# پارامترهای query قابل استفاده در filter_university_applications
+UNIVERSITY_LIST_FILTERS = (
+    'round_type',
+    'university_review_status',
+    'is_corrected',
+    'status',
+    'faculty_id',
+    'university_id',
+    'department_id',
+    'search',
+)
+
+def filter_university_applications(params, user, queryset=None):
+    """
+    فیلترهای لیست پرونده‌های مسئول دانشگاه
+    
+    مشترک بین لیست، خروجی CSV/XLSX و کارهای خروجی پس‌زمینه (ExportJob)؛ params
+    می‌تواند request.GET یا dict ذخیره‌شده فیلترها باشد.
+    خروجی: (queryset, error_message)
+    """
+    if queryset is None:
+        queryset = Application.objects.all()
+    admin_permission = user.admin_permission
+    queryset = queryset.visible_to(user)
+    
+    # فیلتر نوع فراخوان بر اساس دسترسی
+    round_type = params.get('round_type')
+    if round_type:
+        if not admin_permission.has_access_to_round_type(round_type):
+            return None, f'شما به فراخوان {round_type} دسترسی ندارید'
+        queryset = queryset.filter(round__type=round_type)
+    elif not admin_permission.scope.allowed_round_types:
+        # اگر نوع مشخص نشده، فقط موارد مجاز نمایش داده می‌شوند (visible_to)
+        return queryset.none(), None
+    
+    # فیلتر وضعیت بررسی مسئول دانشگاه
+    university_review_status = params.get('university_review_status')
+    if university_review_status:
+        queryset = queryset.filter(university_review_status=university_review_status)
+    
+    # فیلتر پرونده‌های ویرایش شده (بعد از برگشت)
+    is_corrected = params.get('is_corrected')
+    if is_corrected == 'true':
+        # پرونده‌هایی که وضعیت RETURNED_FOR_CORRECTION داشتند و دوباره SUBMITTED شدند
+        queryset = queryset.filter(
+            status=Application.Status.SUBMITTED,
+            university_review_status=Application.UniversityReviewStatus.PENDING
+        ).exclude(
+            university_reviewed_at__isnull=True
+        )
+    
+    # فیلتر وضعیت پرونده
+    app_status = params.get('status')
+    if app_status:
+        queryset = queryset.filter(status=app_status)
+    else:
+        # پیش‌فرض: فقط پرونده‌های ارسال شده و در حال بررسی
+        queryset = queryset.filter(
+            status__in=[
+                Application.Status.SUBMITTED,
+                Application.Status.UNDER_UNIVERSITY_REVIEW,
+                Application.Status.RETURNED_FOR_CORRECTION
+            ]
+        )
+    
+    # فیلتر دانشکده
+    faculty_id = params.get('faculty_id')
+    if faculty_id:
+        queryset = queryset.filter(
+            choices__program__faculty_id=faculty_id
+        ).distinct()
+
+    # فیلتر دانشگاه محل تحصیل
+    university_id = params.get('university_id')
+    if university_id:
+        queryset = queryset.filter(
+            university_of_study_id=university_id
+        ).distinct()
+    
+    # فیلتر گروه آموزشی
+    department_id = params.get('department_id')
+    if department_id:
+        queryset = queryset.filter(
+            choices__program__department_id=department_id
+        ).distinct()
+    
+    # جستجو
+    search = params.get('search', '').strip()
+    if search:
+        queryset = search_applications(queryset, search)
+    
+    return queryset, None
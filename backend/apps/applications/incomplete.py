@@ -0,0 +1,128 @@
+"""
+گزارش پرونده‌های ناقص یک فراخوان (برای ارسال یادآوری به داوطلبان)
+
+پرونده‌های در حال تکمیل فراخوان به ترتیب id و به صورت تکه‌ای (keyset روی id) خوانده
+می‌شوند؛ برای هر تکه آمادگی با grouped_readiness_counters (سه کوئری گروهی) و
+الزامات نوع فراخوان (apps.applications.requirements) در حافظه ارزیابی می‌شود. تعداد
+کوئری‌ها برای هر REPORT_CHUNK_SIZE پرونده ثابت است (۴ کوئری).
+
+استفاده در لیست صفحه‌بندی‌شده و خروجی CSV گزارش (apps.api.admin_views).
+"""
+from django.utils import timezone
+
+from apps.admissions.models import AdmissionRound
+from apps.applications.exports import escape_formula
+from apps.applications.models import Application
+from apps.applications.readiness import counter_fields, evaluate_readiness, grouped_readiness_counters
+
+
+REPORT_CHUNK_SIZE = 1000
+
+# پرونده‌هایی که هنوز ارسال نشده‌اند یا برای اصلاح برگشت خورده‌اند
+INCOMPLETE_REPORT_STATUSES = (
+    Application.Status.NEW,
+    Application.Status.PROGRAM_SELECTED,
+    Application.Status.PERSONAL_INFO_COMPLETED,
+    Application.Status.IDENTITY_DOCS_UPLOADED,
+    Application.Status.EDU_INFO_COMPLETED,
+    Application.Status.EDU_DOCS_UPLOADED,
+    Application.Status.RETURNED_FOR_CORRECTION,
+)
+
+# (کلید ردیف گزارش، عنوان ستون در CSV)
+REPORT_COLUMNS = [
+    ('id', 'شناسه'),
+    ('tracking_code', 'کد پیگیری'),
+    ('national_id', 'کد ملی'),
+    ('first_name', 'نام'),
+    ('last_name', 'نام خانوادگی'),
+    ('mobile', 'موبایل'),
+    ('email', 'ایمیل'),
+    ('round_type', 'نوع فراخوان'),
+    ('status', 'وضعیت پرونده'),
+    ('updated_at', 'آخرین تغییر'),
+    ('missing', 'موارد ناقص'),
+]
+
+_CONTACT_FIELDS = {
+    'tracking_code': 'tracking_code',
+    'national_id': 'applicant__user__national_id',
+    'first_name': 'applicant__user__first_name',
+    'last_name': 'applicant__user__last_name',
+    'mobile': 'applicant__user__mobile',
+    'email': 'applicant__user__email',
+    'status': 'status',
+    'updated_at': 'updated_at',
+}
+
+
+def incomplete_applications_queryset(round_obj, user, statuses=None):
+    """پرونده‌های در حال تکمیل فراخوان که برای کاربر قابل مشاهده‌اند"""
+    return Application.objects.visible_to(user).filter(
+        round=round_obj,
+        status__in=statuses or INCOMPLETE_REPORT_STATUSES,
+    )
+
+
+def _chunks(queryset, fields):
+    last_id = 0
+    while True:
+        rows = list(queryset.filter(id__gt=last_id).order_by('id').values(*fields)[:REPORT_CHUNK_SIZE])
+        if rows:
+            yield rows
+        if len(rows) < REPORT_CHUNK_SIZE:
+            return
+        last_id = rows[-1]['id']
+
+
+def incomplete_applications(queryset, missing_code=None):
+    """
+    ردیف‌های گزارش برای پرونده‌های ناقص queryset (به ترتیب id)
+
+    missing_code: فقط پرونده‌هایی که این مورد را کم دارند (مثلاً identity_documents)
+    هر ردیف: کلیدهای REPORT_COLUMNS؛ missing لیست {'code', 'message'} است.
+    """
+    fields = list(dict.fromkeys([*counter_fields(), *_CONTACT_FIELDS.values()]))
+    for rows in _chunks(queryset, fields):
+        for row, counters in zip(rows, grouped_readiness_counters(rows)):
+            readiness = evaluate_readiness(counters)
+            if readiness.ready:
+                continue
+            if missing_code and missing_code not in {item['code'] for item in readiness.missing}:
+                continue
+            yield {
+                'id': row['id'],
+                'round_type': row['round__type'],
+                **{key: row[field] for key, field in _CONTACT_FIELDS.items()},
+                'missing': readiness.missing,
+            }
+
+
+_DISPLAY_CHOICES = {
+    'round_type': dict(AdmissionRound.RoundType.choices),
+    'status': dict(Application.Status.choices),
+}
+
+
+def report_header():
+    return [title for _, title in REPORT_COLUMNS]
+
+
+def format_report_row(item):
+    """تبدیل یک ردیف گزارش به مقادیر قابل نوشتن در CSV"""
+    values = []
+    for key, _ in REPORT_COLUMNS:
+        value = item[key]
+        if key == 'missing':
+            value = '؛ '.join(entry['message'] for entry in value)
+        elif key in _DISPLAY_CHOICES:
+            value = _DISPLAY_CHOICES[key].get(value, value)
+        elif hasattr(value, 'tzinfo'):
+            value = timezone.localtime(value).strftime('%Y-%m-%d %H:%M')
+        values.append('' if value is None else escape_formula(value))
+    return values
+
+
+def report_rows(queryset, missing_code=None):
+    for item in incomplete_applications(queryset, missing_code):
+        yield format_report_row(item)
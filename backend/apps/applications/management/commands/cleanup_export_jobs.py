@@ -0,0 +1,25 @@
+"""
+حذف کارهای خروجی پس‌زمینه (ExportJob) قدیمی و فایل‌های آن‌ها
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.applications.export_jobs import cleanup_export_jobs
+
+
+class Command(BaseCommand):
+    help = 'Remove finished background export jobs and their files after the retention period'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--hours',
+            type=int,
+            default=getattr(settings, 'EXPORT_JOB_RETENTION_HOURS', 72),
+            help='Age in hours after which a finished export is removed (default: EXPORT_JOB_RETENTION_HOURS)',
+        )
+
+    def handle(self, *args, **options):
+        count = cleanup_export_jobs(options['hours'])
+        self.stdout.write(
+            self.style.SUCCESS(f'✓ {count} خروجی قدیمی حذف شد')
+        )
@@ -0,0 +1,27 @@
+"""
+بازسازی خلاصه پرونده‌ها برای داشبورد داوطلب (ApplicationSummary)
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.admissions.models import AdmissionRound
+from apps.applications.dashboard import refresh_application_summaries
+from apps.applications.models import Application
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the applicant dashboard summaries for one round or for every application'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--round', type=int, dest='round_id', help='AdmissionRound id (default: all rounds)')
+
+    def handle(self, *args, **options):
+        applications = Application.objects.all()
+        if options['round_id']:
+            if not AdmissionRound.objects.filter(id=options['round_id']).exists():
+                raise CommandError(f"AdmissionRound {options['round_id']} not found")
+            applications = applications.filter(round_id=options['round_id'])
+
+        count = refresh_application_summaries(applications.values_list('id', flat=True))
+        self.stdout.write(
+            self.style.SUCCESS(f'✓ خلاصه {count} پرونده بازسازی شد')
+        )
@@ -0,0 +1,27 @@
+"""
+بازسازی جدول رتبه‌بندی برنامه‌ها (ProgramRanking)
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.admissions.models import AdmissionRound
+from apps.applications.rankings import refresh_round_rankings
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the precomputed ProgramRanking rows for one round or for every round'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--round', type=int, dest='round_id', help='AdmissionRound id (default: all rounds)')
+
+    def handle(self, *args, **options):
+        rounds = AdmissionRound.objects.all()
+        if options['round_id']:
+            rounds = rounds.filter(id=options['round_id'])
+            if not rounds.exists():
+                raise CommandError(f"AdmissionRound {options['round_id']} not found")
+
+        for round_obj in rounds:
+            count = refresh_round_rankings(round_obj.id)
+            self.stdout.write(
+                self.style.SUCCESS(f'✓ {round_obj}: {count} ردیف رتبه‌بندی بازسازی شد')
+            )
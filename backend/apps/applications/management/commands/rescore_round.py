@@ -0,0 +1,99 @@
+"""
+محاسبه مجدد امتیاز نهایی تمام پرونده‌های یک فراخوان
+
+مثال:
+    python manage.py rescore_round 3
+    python manage.py rescore_round 3 --workers 4 --batch-size 5000
+"""
+import multiprocessing
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from apps.admissions.models import AdmissionRound
+from apps.applications.models import Application
+from apps.applications.scoring import RECOMPUTE_CHUNK_SIZE, rescore_id_range
+
+
+def _rescore_range(args):
+    # اجرا در پردازه فرزند؛ اتصال‌های به ارث رسیده از پردازه والد استفاده نمی‌شوند
+    round_id, first_id, last_id, chunk_size = args
+    try:
+        return rescore_id_range(round_id, first_id, last_id, chunk_size=chunk_size)
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = 'Recompute Application.total_score for every application in a round'
+
+    def add_arguments(self, parser):
+        parser.add_argument('round_id', type=int, help='AdmissionRound id')
+        parser.add_argument('--workers', type=int, default=1, help='Number of worker processes (default: 1)')
+        parser.add_argument(
+            '--batch-size', type=int, default=5000,
+            help='Applications per id range; each range runs one aggregate query per score table',
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, default=RECOMPUTE_CHUNK_SIZE,
+            help='Rows per bulk_update statement',
+        )
+
+    def handle(self, *args, **options):
+        round_id = options['round_id']
+        workers = max(options['workers'], 1)
+        batch_size = max(options['batch_size'], 1)
+        chunk_size = max(options['chunk_size'], 1)
+
+        try:
+            round_obj = AdmissionRound.objects.get(id=round_id)
+        except AdmissionRound.DoesNotExist:
+            raise CommandError(f'AdmissionRound {round_id} not found')
+
+        application_ids = list(
+            Application.objects.filter(round_id=round_id).order_by('id').values_list('id', flat=True)
+        )
+        total = len(application_ids)
+        if not total:
+            self.stdout.write(self.style.WARNING(f'{round_obj}: پرونده‌ای برای محاسبه وجود ندارد'))
+            return
+
+        ranges = [
+            (round_id, batch[0], batch[-1], chunk_size)
+            for batch in (
+                application_ids[start:start + batch_size]
+                for start in range(0, total, batch_size)
+            )
+        ]
+        self.stdout.write(
+            f'{round_obj}: {total} پرونده در {len(ranges)} بازه با {workers} پردازه'
+        )
+
+        started = time.perf_counter()
+        done = 0
+
+        if workers == 1:
+            results = (rescore_id_range(*args) for args in ranges)
+            done = self._report(results, done, total, started)
+        else:
+            # اتصال‌های باز نباید بین پردازه‌ها به اشتراک گذاشته شوند
+            connections.close_all()
+            with multiprocessing.get_context('fork').Pool(workers) as pool:
+                done = self._report(pool.imap_unordered(_rescore_range, ranges), done, total, started)
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'✓ امتیاز {done} پرونده در {elapsed:.1f} ثانیه محاسبه شد '
+                f'({done / elapsed if elapsed else done:.0f} پرونده در ثانیه)'
+            )
+        )
+
+    def _report(self, results, done, total, started):
+        for count in results:
+            done += count
+            elapsed = time.perf_counter() - started
+            rate = done / elapsed if elapsed else done
+            self.stdout.write(f'  {done}/{total} ({rate:.0f} rows/s)')
+        return done
@@ -0,0 +1,107 @@
+# Generated by Django 5.0 on 2026-10-17 23:50
+
+from collections import defaultdict
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# apps.admissions.allocation.ELIGIBLE_APPLICATION_STATUSES هنگام ساخت این migration
+ELIGIBLE_STATUSES = [
+    'NEW',
+    'SUBMITTED',
+    'UNDER_UNIVERSITY_REVIEW',
+    'APPROVED_BY_UNIVERSITY',
+    'UNDER_FACULTY_REVIEW',
+    'FACULTY_REVIEW_COMPLETED',
+    'COMPLETED',
+]
+TOP_CHOICES_COUNT = 3
+
+
+def fill_program_rankings(apps, schema_editor):
+    """ساخت ردیف‌های رتبه‌بندی برای پرونده‌های موجود (همان منطق apps.applications.rankings)"""
+    Application = apps.get_model('applications', 'Application')
+    ApplicationChoice = apps.get_model('applications', 'ApplicationChoice')
+    ApplicationEducationRecord = apps.get_model('applications', 'ApplicationEducationRecord')
+    ProgramRanking = apps.get_model('applications', 'ProgramRanking')
+
+    applications = {
+        row['id']: row
+        for row in Application.objects.filter(status__in=ELIGIBLE_STATUSES).values(
+            'id', 'round_id', 'total_score', 'education_scoring__total_score'
+        )
+    }
+
+    choices = defaultdict(list)
+    for row in ApplicationChoice.objects.filter(
+        application__status__in=ELIGIBLE_STATUSES,
+    ).values(
+        'id', 'application_id', 'program_id', 'priority', 'program__name', 'program__orientation'
+    ).order_by('application_id', 'priority'):
+        choices[row['application_id']].append(row)
+
+    bsc_gpas = {}
+    for application_id, gpa in ApplicationEducationRecord.objects.filter(
+        degree_level='BSC',
+    ).order_by('application_id', '-id').values_list('application_id', 'gpa'):
+        bsc_gpas.setdefault(application_id, float(gpa) if gpa is not None else None)
+
+    rows = []
+    for application_id, app in applications.items():
+        application_choices = choices.get(application_id, [])
+        top_choices = [
+            {
+                'priority': choice['priority'],
+                'program_name': choice['program__name'],
+                'orientation': choice['program__orientation'],
+            }
+            for choice in application_choices[:TOP_CHOICES_COUNT]
+        ]
+        for choice in application_choices:
+            rows.append(ProgramRanking(
+                round_id=app['round_id'],
+                program_id=choice['program_id'],
+                choice_id=choice['id'],
+                application_id=application_id,
+                total_score=app['total_score'] or 0,
+                priority=choice['priority'],
+                education_score=app['education_scoring__total_score'],
+                bsc_gpa=bsc_gpas.get(application_id),
+                top_choices=top_choices,
+            ))
+    ProgramRanking.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admissions', '0002_initial'),
+        ('applications', '0002_application_exam_rank_alter_application_status_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProgramRanking',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_score', models.FloatField(default=0, verbose_name='امتیاز نهایی')),
+                ('priority', models.PositiveIntegerField(verbose_name='اولویت انتخاب')),
+                ('education_score', models.FloatField(blank=True, null=True, verbose_name='امتیاز سوابق تحصیلی')),
+                ('bsc_gpa', models.FloatField(blank=True, null=True, verbose_name='معدل کارشناسی')),
+                ('top_choices', models.JSONField(blank=True, default=list, verbose_name='سه انتخاب اول داوطلب')),
+                ('refreshed_at', models.DateTimeField(auto_now=True, verbose_name='تاریخ بروزرسانی')),
+                ('application', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='program_rankings', to='applications.application', verbose_name='درخواست')),
+                ('choice', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='ranking', to='applications.applicationchoice', verbose_name='انتخاب رشته')),
+                ('program', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rankings', to='admissions.program', verbose_name='برنامه تحصیلی')),
+                ('round', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='program_rankings', to='admissions.admissionround', verbose_name='فراخوان')),
+            ],
+            options={
+                'verbose_name': 'رتبه\u200cبندی برنامه',
+                'verbose_name_plural': 'رتبه\u200cبندی برنامه\u200cها',
+                'ordering': ['program', '-total_score', 'priority', 'application'],
+                'indexes': [models.Index(fields=['round', 'program', '-total_score', 'priority'], name='ranking_program_order_idx')],
+            },
+        ),
+        migrations.RunPython(fill_program_rankings, migrations.RunPython.noop),
+    ]
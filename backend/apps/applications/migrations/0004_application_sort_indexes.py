@@ -0,0 +1,30 @@
+# Generated by Django 5.0 on 2026-10-18 00:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_alter_user_managers'),
+        ('admissions', '0002_initial'),
+        ('applications', '0003_program_ranking'),
+        ('core', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['round', 'status', 'created_at'], name='app_round_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['round', 'status', 'total_score'], name='app_round_status_score_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['round', 'university_review_status', 'created_at'], name='app_round_review_created_idx'),
+        ),
+    ]
@@ -0,0 +1,93 @@
+# Generated by Django 5.0 on 2026-10-18 00:14
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.utils import OperationalError
+
+from apps.core.text import normalize_persian
+
+
+def create_search_index(apps, schema_editor):
+    """ایندکس trigram روی PostgreSQL و جدول FTS5 روی SQLite"""
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        schema_editor.execute(
+            'CREATE INDEX IF NOT EXISTS application_search_trgm_idx '
+            'ON applications_applicationsearchdocument USING gin (document gin_trgm_ops)'
+        )
+    elif vendor == 'sqlite':
+        # بدون FTS5 (نسخه‌های قدیمی SQLite) جستجو روی ستون document انجام می‌شود
+        try:
+            schema_editor.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS applications_search_fts "
+                "USING fts5(document, tokenize='trigram')"
+            )
+        except OperationalError:
+            pass
+
+
+def fill_search_documents(apps, schema_editor):
+    """ساخت سند جستجو (و ردیف FTS روی SQLite) برای پرونده‌های موجود"""
+    Application = apps.get_model('applications', 'Application')
+    ApplicationSearchDocument = apps.get_model('applications', 'ApplicationSearchDocument')
+    connection = schema_editor.connection
+    use_fts = (
+        connection.vendor == 'sqlite'
+        and 'applications_search_fts' in connection.introspection.table_names()
+    )
+
+    rows = Application.objects.order_by('id').values_list(
+        'id',
+        'applicant__user__first_name',
+        'applicant__user__last_name',
+        'applicant__user__national_id',
+        'tracking_code',
+    )
+    # همان build_document در apps.applications.search
+    documents = [
+        ApplicationSearchDocument(
+            application_id=row[0],
+            document=normalize_persian(' '.join(filter(None, row[1:]))),
+        )
+        for row in rows.iterator()
+    ]
+    ApplicationSearchDocument.objects.bulk_create(documents, batch_size=500)
+    if use_fts:
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                'INSERT INTO applications_search_fts (rowid, document) VALUES (%s, %s)',
+                [(doc.application_id, doc.document) for doc in documents],
+            )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS application_search_trgm_idx')
+    elif vendor == 'sqlite':
+        schema_editor.execute('DROP TABLE IF EXISTS applications_search_fts')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0004_application_sort_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationSearchDocument',
+            fields=[
+                ('application', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='applications.application', verbose_name='درخواست')),
+                ('document', models.TextField(verbose_name='متن جستجو')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='تاریخ بروزرسانی')),
+            ],
+            options={
+                'verbose_name': 'سند جستجوی پرونده',
+                'verbose_name_plural': 'اسناد جستجوی پرونده\u200cها',
+            },
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+        migrations.RunPython(fill_search_documents, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.0 on 2026-10-18 00:35
+
+import apps.applications.models
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0005_application_search_document'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExportJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='تاریخ ایجاد')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='تاریخ بروزرسانی')),
+                ('token', models.UUIDField(default=uuid.uuid4, editable=False, unique=True, verbose_name='شناسه فایل')),
+                ('output', models.CharField(choices=[('csv', 'CSV'), ('xlsx', 'Excel (XLSX)')], default='csv', max_length=10, verbose_name='قالب خروجی')),
+                ('params', models.JSONField(blank=True, default=dict, verbose_name='فیلترها')),
+                ('sort_by', models.CharField(blank=True, max_length=30, verbose_name='مرتب\u200cسازی')),
+                ('status', models.CharField(choices=[('PENDING', 'در صف'), ('RUNNING', 'در حال اجرا'), ('COMPLETED', 'تکمیل شده'), ('FAILED', 'ناموفق')], db_index=True, default='PENDING', max_length=20, verbose_name='وضعیت')),
+                ('total_rows', models.PositiveIntegerField(blank=True, null=True, verbose_name='تعداد کل ردیف\u200cها')),
+                ('processed_rows', models.PositiveIntegerField(default=0, verbose_name='ردیف\u200cهای نوشته\u200cشده')),
+                ('cursor', models.JSONField(blank=True, null=True, verbose_name='آخرین ردیف نوشته\u200cشده')),
+                ('bytes_written', models.PositiveBigIntegerField(default=0, verbose_name='حجم نوشته\u200cشده')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='تعداد اجرا')),
+                ('file', models.FileField(blank=True, storage=apps.applications.models.export_job_storage, upload_to='', verbose_name='فایل')),
+                ('error', models.TextField(blank=True, verbose_name='خطا')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='زمان شروع')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='زمان پایان')),
+                ('created_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='export_jobs', to=settings.AUTH_USER_MODEL, verbose_name='درخواست\u200cدهنده')),
+            ],
+            options={
+                'verbose_name': 'خروجی پرونده\u200cها',
+                'verbose_name_plural': 'خروجی\u200cهای پرونده\u200cها',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
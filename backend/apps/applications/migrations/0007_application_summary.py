@@ -0,0 +1,121 @@
+# Generated by Django 5.0 on 2026-10-18 00:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Exists, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+# کلید خلاصه سوابق پژوهشی -> مدل (همان RESEARCH_MODELS در apps.applications.dashboard)
+RESEARCH_MODELS = {
+    'research_articles': 'ResearchArticle',
+    'patents': 'Patent',
+    'festival_awards': 'FestivalAward',
+    'conference_articles': 'ConferenceArticle',
+    'books': 'Book',
+    'olympiad_records': 'OlympiadRecord',
+    'language_certificates': 'LanguageCertificate',
+}
+
+
+def _count(model, condition=None):
+    rows = model.objects.filter(application=OuterRef('pk'))
+    if condition is not None:
+        rows = rows.filter(condition)
+    rows = rows.order_by().values('application').annotate(count=Count('id')).values('count')
+    return Coalesce(Subquery(rows, output_field=IntegerField()), Value(0))
+
+
+def fill_application_summaries(apps, schema_editor):
+    """ساخت خلاصه پرونده‌های موجود (همان منطق apps.applications.dashboard)"""
+    Application = apps.get_model('applications', 'Application')
+    ApplicationSummary = apps.get_model('applications', 'ApplicationSummary')
+    ApplicationDocument = apps.get_model('documents', 'ApplicationDocument')
+    research_models = {
+        key: apps.get_model('applications', name) for key, name in RESEARCH_MODELS.items()
+    }
+
+    rows = Application.objects.annotate(
+        choices_count=_count(apps.get_model('applications', 'ApplicationChoice')),
+        education_records_count=_count(apps.get_model('applications', 'ApplicationEducationRecord')),
+        documents_count=_count(ApplicationDocument),
+        approved_documents_count=_count(ApplicationDocument, Q(status='APPROVED')),
+        rejected_documents_count=_count(ApplicationDocument, Q(status='REJECTED')),
+        has_masters_thesis=Exists(
+            apps.get_model('applications', 'MastersThesis').objects.filter(application=OuterRef('pk'))
+        ),
+        **{f'research_{key}': _count(model) for key, model in research_models.items()},
+    ).values(
+        'id', 'applicant_id', 'tracking_code', 'round__type', 'round__title',
+        'status', 'university_review_status', 'admission_overall_status', 'total_score',
+        'created_at', 'updated_at', 'choices_count', 'education_records_count', 'documents_count',
+        'approved_documents_count', 'rejected_documents_count', 'has_masters_thesis',
+        *(f'research_{key}' for key in RESEARCH_MODELS),
+    ).order_by('id')
+
+    summaries = []
+    for row in rows.iterator():
+        research = {key: row[f'research_{key}'] for key in RESEARCH_MODELS}
+        research['has_masters_thesis'] = row['has_masters_thesis']
+        research['total'] = sum(row[f'research_{key}'] for key in RESEARCH_MODELS)
+        summaries.append(ApplicationSummary(
+            application_id=row['id'],
+            applicant_id=row['applicant_id'],
+            tracking_code=row['tracking_code'],
+            round_type=row['round__type'],
+            round_title=row['round__title'],
+            status=row['status'],
+            university_review_status=row['university_review_status'] or '',
+            admission_overall_status=row['admission_overall_status'] or '',
+            total_score=row['total_score'] or 0,
+            choices_count=row['choices_count'],
+            education_records_count=row['education_records_count'],
+            documents_count=row['documents_count'],
+            approved_documents_count=row['approved_documents_count'],
+            rejected_documents_count=row['rejected_documents_count'],
+            research_summary=research,
+            application_created_at=row['created_at'],
+            application_updated_at=row['updated_at'],
+        ))
+    ApplicationSummary.objects.bulk_create(summaries, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_normalized_name_columns'),
+        ('applications', '0006_export_job'),
+        ('documents', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationSummary',
+            fields=[
+                ('application', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='summary', serialize=False, to='applications.application', verbose_name='درخواست')),
+                ('tracking_code', models.CharField(max_length=20, verbose_name='کد پیگیری')),
+                ('round_type', models.CharField(max_length=20, verbose_name='نوع فراخوان')),
+                ('round_title', models.CharField(max_length=255, verbose_name='عنوان فراخوان')),
+                ('status', models.CharField(choices=[('NEW', 'ثبت\u200cنام اولیه'), ('PROGRAM_SELECTED', 'رشته انتخاب شد'), ('PERSONAL_INFO_COMPLETED', 'اطلاعات شخصی تکمیل شد'), ('IDENTITY_DOCS_UPLOADED', 'مدارک شناسایی آپلود شد'), ('EDU_INFO_COMPLETED', 'اطلاعات تحصیلی تکمیل شد'), ('EDU_DOCS_UPLOADED', 'مدارک تحصیلی آپلود شد'), ('SUBMITTED', 'ارسال شده (منتظر بررسی)'), ('UNDER_UNIVERSITY_REVIEW', 'در حال بررسی توسط مسئول دانشگاه'), ('APPROVED_BY_UNIVERSITY', 'تایید شده توسط مسئول دانشگاه'), ('REJECTED_BY_UNIVERSITY', 'رد شده توسط مسئول دانشگاه'), ('RETURNED_FOR_CORRECTION', 'برگشت برای اصلاح نواقص'), ('UNDER_FACULTY_REVIEW', 'در حال بررسی توسط مسئول دانشکده'), ('FACULTY_REVIEW_COMPLETED', 'بررسی دانشکده تکمیل شد'), ('COMPLETED', 'تکمیل شده'), ('INELIGIBLE', 'فاقد شرایط'), ('DELETED', 'حذف شده')], max_length=50, verbose_name='وضعیت')),
+                ('university_review_status', models.CharField(blank=True, max_length=30, verbose_name='وضعیت بررسی مسئول دانشگاه')),
+                ('admission_overall_status', models.CharField(blank=True, max_length=30, verbose_name='نتیجه نهایی')),
+                ('total_score', models.FloatField(default=0, verbose_name='امتیاز نهایی')),
+                ('choices_count', models.PositiveSmallIntegerField(default=0, verbose_name='تعداد انتخاب\u200cها')),
+                ('education_records_count', models.PositiveSmallIntegerField(default=0, verbose_name='تعداد سوابق تحصیلی')),
+                ('documents_count', models.PositiveSmallIntegerField(default=0, verbose_name='تعداد مدارک')),
+                ('approved_documents_count', models.PositiveSmallIntegerField(default=0, verbose_name='مدارک تایید شده')),
+                ('rejected_documents_count', models.PositiveSmallIntegerField(default=0, verbose_name='مدارک رد شده')),
+                ('research_summary', models.JSONField(blank=True, default=dict, verbose_name='خلاصه سوابق پژوهشی')),
+                ('application_created_at', models.DateTimeField(verbose_name='تاریخ ایجاد پرونده')),
+                ('application_updated_at', models.DateTimeField(verbose_name='تاریخ بروزرسانی پرونده')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='تاریخ بروزرسانی')),
+                ('applicant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='application_summaries', to='accounts.applicantprofile', verbose_name='داوطلب')),
+            ],
+            options={
+                'verbose_name': 'خلاصه پرونده',
+                'verbose_name_plural': 'خلاصه پرونده\u200cها',
+                'indexes': [models.Index(fields=['applicant', '-application_created_at'], name='app_summary_applicant_idx')],
+            },
+        ),
+        migrations.RunPython(fill_application_summaries, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,10 @@
 import random
 import string
+import uuid
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.core.files.storage import FileSystemStorage
 from django.db import models
-from django.utils import timezone
 from apps.core.models import TimeStampedModel, University, UniversityWeight
 from apps.admissions.models import AdmissionRound, Program
 from apps.accounts.models import ApplicantProfile, User
@@ -12,6 +15,80 @@ def generate_tracking_code():
     return ''.join(random.choices(string.ascii_uppercase + string.digits, k=10))
 
 
+# ستون‌های انتخاب اول که با with_first_choice روی پرونده annotate می‌شوند
+FIRST_CHOICE_FIELDS = {
+    'first_choice_priority': 'priority',
+    'first_choice_program_id': 'program_id',
+    'first_choice_program_name': 'program__name',
+    'first_choice_program_code': 'program__code',
+    'first_choice_orientation': 'program__orientation',
+    'first_choice_faculty_id': 'program__faculty_id',
+    'first_choice_faculty_name': 'program__faculty__name',
+    'first_choice_department_id': 'program__department_id',
+    'first_choice_department_name': 'program__department__name',
+}
+
+
+class ApplicationQuerySet(models.QuerySet):
+    def with_first_choice(self):
+        """
+        افزودن مشخصات انتخاب با اولویت اول (برنامه، دانشکده، گروه) به صورت Subquery
+        
+        به جای یک کوئری برای هر پرونده در serializer، همه ستون‌ها در همان کوئری لیست خوانده می‌شوند.
+        """
+        first_choice = ApplicationChoice.objects.filter(
+            application=models.OuterRef('pk')
+        ).order_by('priority')
+        return self.annotate(**{
+            name: models.Subquery(first_choice.values(field)[:1])
+            for name, field in FIRST_CHOICE_FIELDS.items()
+        })
+
+
+    def visible_to(self, user):
+        """
+        پرونده‌هایی که کاربر اجازه مشاهده آن‌ها را دارد (با یک شرط WHERE/EXISTS)
+        
+        - داوطلب: فقط پرونده‌های خودش
+        - ADMIN / SUPERADMIN: همه پرونده‌ها
+        - مسئول دانشگاه/دانشکده: معادل AdminPermission.can_review_application برای همه ردیف‌ها
+        """
+        if user is None or not user.is_authenticated:
+            return self.none()
+        if user.role == 'APPLICANT':
+            return self.filter(applicant__user=user)
+        if user.role in ('ADMIN', 'SUPERADMIN'):
+            return self.all()
+        try:
+            admin_permission = user.admin_permission
+        except ObjectDoesNotExist:
+            return self.none()
+        return self.visible_to_scope(admin_permission.scope)
+
+    def visible_to_scope(self, scope):
+        """فیلتر بر اساس محدوده دسترسی حل‌شده (apps.accounts.permission_scope)"""
+        if scope.has_full_access:
+            return self.all()
+        if not scope.round_types:
+            return self.none()
+
+        queryset = self.filter(round__type__in=scope.allowed_round_types)
+        if scope.is_university_admin():
+            return queryset
+        if not scope.is_faculty_admin():
+            return self.none()
+
+        allowed_faculties = scope.faculty_restriction
+        if allowed_faculties is None:
+            return queryset
+        return queryset.filter(models.Exists(
+            ApplicationChoice.objects.filter(
+                application=models.OuterRef('pk'),
+                program__faculty_id__in=allowed_faculties,
+            )
+        ))
+
+
 class Application(TimeStampedModel):
     """
     پرونده درخواست ثبت‌نام داوطلب
@@ -181,11 +258,22 @@ class Application(TimeStampedModel):
         verbose_name="تاریخ اعلام نتیجه"
     )
     
+    objects = ApplicationQuerySet.as_manager()
+    
     class Meta:
         verbose_name = "درخواست ثبت‌نام"
         verbose_name_plural = "درخواست‌های ثبت‌نام"
         ordering = ['-created_at']
         unique_together = ['applicant', 'round']
+        # ایندکس‌های مرتب‌سازی لیست ادمین (apps.api.sorting)
+        indexes = [
+            models.Index(fields=['round', 'status', 'created_at'], name='app_round_status_created_idx'),
+            models.Index(fields=['round', 'status', 'total_score'], name='app_round_status_score_idx'),
+            models.Index(
+                fields=['round', 'university_review_status', 'created_at'],
+                name='app_round_review_created_idx',
+            ),
+        ]
     
     def __str__(self):
         return f"{self.applicant.user.get_full_name()} - {self.round.title} ({self.tracking_code})"
@@ -207,42 +295,14 @@ class Application(TimeStampedModel):
         منطق: امتیاز نهایی = امتیاز سوابق تحصیلی (EducationScoring) + سوابق پژوهشی + مصاحبه
         
         نکته مهم: امتیاز سوابق تحصیلی فقط از EducationScoring خوانده می‌شود (دستی)
-        """
-        total = 0
-        
-        # 1. امتیاز سوابق تحصیلی (از EducationScoring - دستی توسط کارشناس)
-        if hasattr(self, 'education_scoring'):
-            total += self.education_scoring.total_score
         
-        # 2. امتیاز سوابق پژوهشی (فقط برای دکتری)
-        if self.round.type in ['PHD_TALENT', 'PHD_EXAM']:
-            # مقالات پژوهشی
-            total += sum([article.score for article in self.research_articles.all()])
-            
-            # اختراعات
-            total += sum([patent.score for patent in self.patents.all()])
-            
-            # جوایز جشنواره
-            total += sum([award.score for award in self.festival_awards.all()])
-            
-            # مقالات کنفرانس
-            total += sum([conf.score for conf in self.conference_articles.all()])
-            
-            # کتاب‌ها
-            total += sum([book.score for book in self.books.all()])
-            
-            # پایان‌نامه ارشد
-            if hasattr(self, 'masters_thesis'):
-                total += self.masters_thesis.score
-        
-        # 3. امتیاز مصاحبه (فقط برای دکتری)
-        if self.round.type in ['PHD_TALENT', 'PHD_EXAM'] and hasattr(self, 'interview'):
-            total += self.interview.total_interview_score
+        محاسبه در apps.applications.scoring انجام می‌شود و با تغییر امتیازها
+        به صورت خودکار (پس از commit) تکرار می‌شود.
+        """
+        from apps.applications.scoring import recompute_application_scores
         
-        # ذخیره امتیاز نهایی
-        self.total_score = total
-        self.score_calculated_at = timezone.now()
-        self.save(update_fields=['total_score', 'score_calculated_at'])
+        recompute_application_scores([self.pk])
+        self.refresh_from_db(fields=['total_score', 'score_calculated_at'])
         
         return self.total_score
 
@@ -1502,3 +1562,275 @@ class Interview(TimeStampedModel):
             self.lab_alignment_score
         )
         return self.total_interview_score
+
+
+# ============================================
+# جدول رتبه‌بندی از پیش محاسبه‌شده (گزارش پذیرش)
+# ============================================
+
+class ProgramRanking(models.Model):
+    """
+    رتبه‌بندی از پیش محاسبه‌شده داوطلبان هر برنامه
+
+    برای هر انتخاب رشته یک ردیف نگه‌داری می‌شود (فقط پرونده‌های واجد شرایط تخصیص).
+    این جدول با signal ها و پس از commit به‌روزرسانی می‌شود (apps.applications.rankings)
+    تا گزارش پذیرش بدون کوئری اضافه برای هر داوطلب ساخته شود.
+    """
+    round = models.ForeignKey(
+        AdmissionRound,
+        on_delete=models.CASCADE,
+        related_name='program_rankings',
+        verbose_name="فراخوان"
+    )
+    program = models.ForeignKey(
+        Program,
+        on_delete=models.CASCADE,
+        related_name='rankings',
+        verbose_name="برنامه تحصیلی"
+    )
+    choice = models.OneToOneField(
+        ApplicationChoice,
+        on_delete=models.CASCADE,
+        related_name='ranking',
+        verbose_name="انتخاب رشته"
+    )
+    application = models.ForeignKey(
+        Application,
+        on_delete=models.CASCADE,
+        related_name='program_rankings',
+        verbose_name="درخواست"
+    )
+    
+    # کلید مرتب‌سازی: امتیاز نهایی نزولی، سپس اولویت انتخاب
+    total_score = models.FloatField(default=0, verbose_name="امتیاز نهایی")
+    priority = models.PositiveIntegerField(verbose_name="اولویت انتخاب")
+    
+    education_score = models.FloatField(
+        null=True,
+        blank=True,
+        verbose_name="امتیاز سوابق تحصیلی"
+    )
+    bsc_gpa = models.FloatField(
+        null=True,
+        blank=True,
+        verbose_name="معدل کارشناسی"
+    )
+    top_choices = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name="سه انتخاب اول داوطلب"
+    )
+    
+    refreshed_at = models.DateTimeField(auto_now=True, verbose_name="تاریخ بروزرسانی")
+    
+    class Meta:
+        verbose_name = "رتبه‌بندی برنامه"
+        verbose_name_plural = "رتبه‌بندی برنامه‌ها"
+        ordering = ['program', '-total_score', 'priority', 'application']
+        indexes = [
+            models.Index(
+                fields=['round', 'program', '-total_score', 'priority'],
+                name='ranking_program_order_idx'
+            ),
+        ]
+    
+    def __str__(self):
+        return f"{self.program_id} - {self.application_id}: {self.total_score}"
+
+
+# ============================================
+# سند جستجوی پرونده‌ها (جستجوی ادمین)
+# ============================================
+
+class ApplicationSearchDocument(models.Model):
+    """
+    متن یکسان‌سازی‌شده جستجو برای هر پرونده (نام، نام خانوادگی، کد ملی، کد پیگیری)
+
+    با signal ها و پس از commit به‌روز می‌شود (apps.applications.search).
+    روی PostgreSQL ایندکس trigram (GIN) و روی SQLite جدول FTS5 با tokenizer
+    trigram در مایگریشن ساخته می‌شود.
+    """
+    application = models.OneToOneField(
+        Application,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='search_document',
+        verbose_name="درخواست"
+    )
+    document = models.TextField(verbose_name="متن جستجو")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="تاریخ بروزرسانی")
+    
+    class Meta:
+        verbose_name = "سند جستجوی پرونده"
+        verbose_name_plural = "اسناد جستجوی پرونده‌ها"
+    
+    def __str__(self):
+        return f"{self.application_id}: {self.document}"
+
+
+# ============================================
+# خلاصه پرونده برای داشبورد داوطلب
+# ============================================
+
+class ApplicationSummary(models.Model):
+    """
+    خلاصه فشرده هر پرونده برای لیست پرونده‌های داوطلب (read model)
+
+    وضعیت، نوع فراخوان، تعداد انتخاب‌ها/سوابق/مدارک و خلاصه سوابق پژوهشی را
+    نگه می‌دارد تا لیست پرونده‌ها بدون پیمایش گراف کامل پرونده ساخته شود.
+    با signal ها و پس از commit به‌روز می‌شود (apps.applications.dashboard).
+    """
+    # مراحل ثبت‌نام به ترتیب؛ هر وضعیت بعد از ارسال یعنی تکمیل همه مراحل
+    REGISTRATION_STEPS = [
+        Application.Status.PROGRAM_SELECTED,
+        Application.Status.PERSONAL_INFO_COMPLETED,
+        Application.Status.IDENTITY_DOCS_UPLOADED,
+        Application.Status.EDU_INFO_COMPLETED,
+        Application.Status.EDU_DOCS_UPLOADED,
+        Application.Status.SUBMITTED,
+    ]
+
+    application = models.OneToOneField(
+        Application,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='summary',
+        verbose_name="درخواست"
+    )
+    applicant = models.ForeignKey(
+        ApplicantProfile,
+        on_delete=models.CASCADE,
+        related_name='application_summaries',
+        verbose_name="داوطلب"
+    )
+    tracking_code = models.CharField(max_length=20, verbose_name="کد پیگیری")
+    round_type = models.CharField(max_length=20, verbose_name="نوع فراخوان")
+    round_title = models.CharField(max_length=255, verbose_name="عنوان فراخوان")
+    status = models.CharField(max_length=50, choices=Application.Status.choices, verbose_name="وضعیت")
+    university_review_status = models.CharField(max_length=30, blank=True, verbose_name="وضعیت بررسی مسئول دانشگاه")
+    admission_overall_status = models.CharField(max_length=30, blank=True, verbose_name="نتیجه نهایی")
+    total_score = models.FloatField(default=0, verbose_name="امتیاز نهایی")
+
+    choices_count = models.PositiveSmallIntegerField(default=0, verbose_name="تعداد انتخاب‌ها")
+    education_records_count = models.PositiveSmallIntegerField(default=0, verbose_name="تعداد سوابق تحصیلی")
+    documents_count = models.PositiveSmallIntegerField(default=0, verbose_name="تعداد مدارک")
+    approved_documents_count = models.PositiveSmallIntegerField(default=0, verbose_name="مدارک تایید شده")
+    rejected_documents_count = models.PositiveSmallIntegerField(default=0, verbose_name="مدارک رد شده")
+    research_summary = models.JSONField(default=dict, blank=True, verbose_name="خلاصه سوابق پژوهشی")
+
+    application_created_at = models.DateTimeField(verbose_name="تاریخ ایجاد پرونده")
+    application_updated_at = models.DateTimeField(verbose_name="تاریخ بروزرسانی پرونده")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="تاریخ بروزرسانی")
+
+    class Meta:
+        verbose_name = "خلاصه پرونده"
+        verbose_name_plural = "خلاصه پرونده‌ها"
+        indexes = [
+            models.Index(fields=['applicant', '-application_created_at'], name='app_summary_applicant_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.tracking_code}: {self.get_status_display()}"
+
+    @property
+    def steps(self):
+        """وضعیت تکمیل مراحل ثبت‌نام بر اساس وضعیت پرونده"""
+        if self.status == Application.Status.NEW:
+            completed = 0
+        elif self.status in self.REGISTRATION_STEPS:
+            completed = self.REGISTRATION_STEPS.index(self.status) + 1
+        else:
+            completed = len(self.REGISTRATION_STEPS)
+        return {
+            step.lower(): index < completed
+            for index, step in enumerate(self.REGISTRATION_STEPS)
+        }
+
+
+# ============================================
+# کارهای خروجی پس‌زمینه (CSV / XLSX)
+# ============================================
+
+def export_job_storage():
+    """
+    محل فایل‌های خروجی (EXPORT_JOB_ROOT، خارج از MEDIA_ROOT)
+
+    Nginx این مسیر را سرو نمی‌کند؛ فایل فقط از API دانلود (با احراز هویت) دریافت می‌شود.
+    """
+    return FileSystemStorage(location=settings.EXPORT_JOB_ROOT, base_url=None)
+
+
+class ExportJob(TimeStampedModel):
+    """
+    کار خروجی گرفتن از لیست پرونده‌ها که توسط Celery اجرا می‌شود
+
+    فایل به صورت تکه‌ای زیر EXPORT_JOB_ROOT نوشته می‌شود و پس از هر تکه پیشرفت
+    (تعداد ردیف، cursor آخرین ردیف و حجم نوشته‌شده) ذخیره می‌شود تا پس از قطع شدن
+    worker کار از آخرین تکه ادامه یابد (apps.applications.export_jobs).
+    """
+    class Status(models.TextChoices):
+        PENDING = "PENDING", "در صف"
+        RUNNING = "RUNNING", "در حال اجرا"
+        COMPLETED = "COMPLETED", "تکمیل شده"
+        FAILED = "FAILED", "ناموفق"
+
+    class Output(models.TextChoices):
+        CSV = "csv", "CSV"
+        XLSX = "xlsx", "Excel (XLSX)"
+
+    token = models.UUIDField(
+        default=uuid.uuid4,
+        unique=True,
+        editable=False,
+        verbose_name="شناسه فایل"
+    )
+    created_by = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='export_jobs',
+        verbose_name="درخواست‌دهنده"
+    )
+    output = models.CharField(
+        max_length=10,
+        choices=Output.choices,
+        default=Output.CSV,
+        verbose_name="قالب خروجی"
+    )
+    params = models.JSONField(default=dict, blank=True, verbose_name="فیلترها")
+    sort_by = models.CharField(max_length=30, blank=True, verbose_name="مرتب‌سازی")
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.PENDING,
+        db_index=True,
+        verbose_name="وضعیت"
+    )
+
+    # پیشرفت و نقطه ادامه
+    total_rows = models.PositiveIntegerField(null=True, blank=True, verbose_name="تعداد کل ردیف‌ها")
+    processed_rows = models.PositiveIntegerField(default=0, verbose_name="ردیف‌های نوشته‌شده")
+    cursor = models.JSONField(null=True, blank=True, verbose_name="آخرین ردیف نوشته‌شده")
+    bytes_written = models.PositiveBigIntegerField(default=0, verbose_name="حجم نوشته‌شده")
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name="تعداد اجرا")
+
+    file = models.FileField(storage=export_job_storage, blank=True, verbose_name="فایل")
+    error = models.TextField(blank=True, verbose_name="خطا")
+    started_at = models.DateTimeField(null=True, blank=True, verbose_name="زمان شروع")
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name="زمان پایان")
+
+    class Meta:
+        verbose_name = "خروجی پرونده‌ها"
+        verbose_name_plural = "خروجی‌های پرونده‌ها"
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.get_output_display()} - {self.created_by_id} ({self.get_status_display()})"
+
+    @property
+    def progress(self):
+        """درصد پیشرفت (0 تا 100)"""
+        if self.status == self.Status.COMPLETED:
+            return 100
+        if not self.total_rows:
+            return 0
+        return min(99, int(self.processed_rows * 100 / self.total_rows))
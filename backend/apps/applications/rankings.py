@@ -0,0 +1,113 @@
+"""
+به‌روزرسانی جدول رتبه‌بندی برنامه‌ها (ProgramRanking)
+
+تغییرات امتیاز، انتخاب‌ها، سوابق تحصیلی و وضعیت پرونده از طریق signal ها
+با schedule_ranking_refresh ثبت می‌شوند و پس از commit یک بار برای تمام
+پرونده‌های تغییر کرده اعمال می‌شوند. گزارش‌های ساخته‌شده از این جدول در فضای
+نام rankings از apps.core.cache نگه‌داری می‌شوند و با هر بازسازی باطل می‌شوند.
+"""
+from collections import defaultdict
+
+from django.db import transaction
+
+from apps.core.batching import defer_until_commit
+from apps.core.cache import namespace
+from apps.applications.models import (
+    Application,
+    ApplicationChoice,
+    ApplicationEducationRecord,
+    ProgramRanking,
+)
+
+
+REFRESH_CHUNK_SIZE = 500
+TOP_CHOICES_COUNT = 3
+
+
+def _eligible_statuses():
+    from apps.admissions.allocation import ELIGIBLE_APPLICATION_STATUSES
+    return ELIGIBLE_APPLICATION_STATUSES
+
+
+def _refresh_chunk(application_ids):
+    applications = {
+        row['id']: row
+        for row in Application.objects.filter(
+            id__in=application_ids,
+            status__in=_eligible_statuses(),
+        ).values('id', 'round_id', 'total_score', 'education_scoring__total_score')
+    }
+
+    choices = defaultdict(list)
+    for row in ApplicationChoice.objects.filter(
+        application_id__in=list(applications)
+    ).values(
+        'id', 'application_id', 'program_id', 'priority', 'program__name', 'program__orientation'
+    ).order_by('application_id', 'priority'):
+        choices[row['application_id']].append(row)
+
+    bsc_gpas = {}
+    for application_id, gpa in ApplicationEducationRecord.objects.filter(
+        application_id__in=list(applications),
+        degree_level='BSC',
+    ).order_by('application_id', '-id').values_list('application_id', 'gpa'):
+        bsc_gpas.setdefault(application_id, float(gpa) if gpa is not None else None)
+
+    rows = []
+    for application_id, app in applications.items():
+        application_choices = choices.get(application_id, [])
+        top_choices = [
+            {
+                'priority': choice['priority'],
+                'program_name': choice['program__name'],
+                'orientation': choice['program__orientation'],
+            }
+            for choice in application_choices[:TOP_CHOICES_COUNT]
+        ]
+        for choice in application_choices:
+            rows.append(ProgramRanking(
+                round_id=app['round_id'],
+                program_id=choice['program_id'],
+                choice_id=choice['id'],
+                application_id=application_id,
+                total_score=app['total_score'] or 0,
+                priority=choice['priority'],
+                education_score=app['education_scoring__total_score'],
+                bsc_gpa=bsc_gpas.get(application_id),
+                top_choices=top_choices,
+            ))
+
+    with transaction.atomic():
+        ProgramRanking.objects.filter(application_id__in=application_ids).delete()
+        ProgramRanking.objects.bulk_create(rows, batch_size=REFRESH_CHUNK_SIZE)
+
+    return len(rows)
+
+
+def invalidate_rankings():
+    """باطل کردن گزارش‌های cache شده از رتبه‌بندی"""
+    namespace('rankings').invalidate()
+
+
+def refresh_program_rankings(application_ids):
+    """بازسازی ردیف‌های رتبه‌بندی برای مجموعه‌ای از پرونده‌ها (چهار کوئری برای هر تکه)"""
+    application_ids = sorted(set(application_ids))
+    refreshed = 0
+    for start in range(0, len(application_ids), REFRESH_CHUNK_SIZE):
+        refreshed += _refresh_chunk(application_ids[start:start + REFRESH_CHUNK_SIZE])
+    if application_ids:
+        invalidate_rankings()
+    return refreshed
+
+
+def refresh_round_rankings(round_id):
+    """بازسازی کامل رتبه‌بندی یک فراخوان"""
+    application_ids = list(
+        Application.objects.filter(round_id=round_id).values_list('id', flat=True)
+    )
+    return refresh_program_rankings(application_ids)
+
+
+def schedule_ranking_refresh(application_ids):
+    """ثبت پرونده‌ها برای بازسازی رتبه‌بندی پس از commit تراکنش جاری"""
+    defer_until_commit(refresh_program_rankings, application_ids)
@@ -0,0 +1,179 @@
+"""
+آمادگی پرونده برای ارسال نهایی
+
+داده‌های لازم (تعداد انتخاب‌ها، وجود هر نوع مدرک، وضعیت سوابق تحصیلی و اطلاعات
+شخصی داوطلب) برای هر تعداد پرونده با یک کوئری (زیرکوئری برای هر مورد) خوانده
+می‌شوند و الزامات نوع فراخوان (apps.applications.requirements) در حافظه روی آن‌ها
+اجرا می‌شوند؛ همه موارد ناقص یک‌جا برگردانده می‌شوند.
+
+همین ارزیابی در ارسال نهایی (submit)، GET آمادگی پرونده و گزارش‌های گروهی
+استفاده می‌شود. برای تعداد زیاد پرونده (گزارش کل یک فراخوان) grouped_readiness_counters
+به جای زیرکوئری برای هر ردیف، برای هر تکه از پرونده‌ها سه کوئری گروهی (انتخاب‌ها،
+مدارک و سوابق تحصیلی با شمارش/تجمیع شرطی) اجرا می‌کند.
+"""
+from dataclasses import dataclass, field
+
+from django.db.models import Count, Exists, IntegerField, Max, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from apps.documents.models import ApplicationDocument
+from apps.applications.models import Application, ApplicationChoice, ApplicationEducationRecord
+from apps.applications.requirements import requirements_table
+
+
+@dataclass(frozen=True)
+class Readiness:
+    """نتیجه ارزیابی آمادگی یک پرونده"""
+    application_id: int
+    round_type: str
+    missing: list = field(default_factory=list)
+
+    @property
+    def ready(self):
+        return not self.missing
+
+    @property
+    def errors(self):
+        return [item['message'] for item in self.missing]
+
+    def as_dict(self):
+        return {
+            'application_id': self.application_id,
+            'round_type': self.round_type,
+            'ready': self.ready,
+            'missing': self.missing,
+        }
+
+
+def _choices_count():
+    rows = ApplicationChoice.objects.filter(application=OuterRef('pk')).order_by().values(
+        'application'
+    ).annotate(count=Count('id')).values('count')
+    return Coalesce(Subquery(rows, output_field=IntegerField()), Value(0))
+
+
+def readiness_counters(queryset):
+    """
+    شمارنده‌های آمادگی برای هر پرونده queryset با یک کوئری
+
+    خروجی: iterator از دیکشنری‌هایی با کلیدهای id، round_type، choices_count،
+    documents (مجموعه انواع مدارک بارگذاری‌شده)، records (مقطع -> وضعیت سابقه)
+    و personal_info (فیلد -> مقدار)
+    """
+    table = requirements_table()
+    documents = ApplicationDocument.objects.filter(application=OuterRef('pk'))
+    education = ApplicationEducationRecord.objects.filter(application=OuterRef('pk'))
+    rows = queryset.annotate(
+        choices_count=_choices_count(),
+        **{
+            f'document_{doc_type}': Exists(documents.filter(type=doc_type))
+            for doc_type in table.document_types
+        },
+        **{
+            f'record_{level}': Subquery(education.filter(degree_level=level).values('status')[:1])
+            for level in table.degree_levels
+        },
+    ).values(
+        'id', 'round__type', 'choices_count',
+        *(f'applicant__user__{name}' for name in table.personal_fields),
+        *(f'document_{doc_type}' for doc_type in table.document_types),
+        *(f'record_{level}' for level in table.degree_levels),
+    )
+    for row in rows:
+        yield {
+            'id': row['id'],
+            'round_type': row['round__type'],
+            'choices_count': row['choices_count'],
+            'documents': frozenset(
+                doc_type for doc_type in table.document_types if row[f'document_{doc_type}']
+            ),
+            'records': {level: row[f'record_{level}'] for level in table.degree_levels},
+            'personal_info': {name: row[f'applicant__user__{name}'] for name in table.personal_fields},
+        }
+
+
+def counter_fields():
+    """ستون‌های values() پرونده که grouped_readiness_counters به آن‌ها نیاز دارد"""
+    return ['id', 'round__type', *(f'applicant__user__{name}' for name in requirements_table().personal_fields)]
+
+
+def grouped_readiness_counters(rows):
+    """
+    شمارنده‌های آمادگی برای لیستی از ردیف‌های values() پرونده (شامل counter_fields)
+
+    به جای زیرکوئری برای هر پرونده، سه کوئری GROUP BY application با تجمیع شرطی روی
+    ApplicationChoice، ApplicationDocument.type و ApplicationEducationRecord.degree_level
+    اجرا می‌شود. خروجی: لیست شمارنده‌ها به ترتیب rows (همان ساختار readiness_counters)
+    """
+    table = requirements_table()
+    application_ids = [row['id'] for row in rows]
+
+    choices = dict(ApplicationChoice.objects.filter(application_id__in=application_ids).order_by().values(
+        'application'
+    ).annotate(count=Count('id')).values_list('application', 'count'))
+
+    documents = {
+        row.pop('application'): frozenset(doc_type for doc_type, count in row.items() if count)
+        for row in ApplicationDocument.objects.filter(
+            application_id__in=application_ids, type__in=table.document_types
+        ).order_by().values('application').annotate(**{
+            doc_type: Count('id', filter=Q(type=doc_type)) for doc_type in table.document_types
+        })
+    }
+
+    records = {
+        row.pop('application'): row
+        for row in ApplicationEducationRecord.objects.filter(
+            application_id__in=application_ids, degree_level__in=table.degree_levels
+        ).order_by().values('application').annotate(**{
+            level: Max('status', filter=Q(degree_level=level)) for level in table.degree_levels
+        })
+    }
+
+    empty_records = dict.fromkeys(table.degree_levels)
+    return [
+        {
+            'id': row['id'],
+            'round_type': row['round__type'],
+            'choices_count': choices.get(row['id'], 0),
+            'documents': documents.get(row['id'], frozenset()),
+            'records': records.get(row['id'], empty_records),
+            'personal_info': {name: row[f'applicant__user__{name}'] for name in table.personal_fields},
+        }
+        for row in rows
+    ]
+
+
+def _missing(code, message):
+    return {'code': code, 'message': message}
+
+
+def evaluate_readiness(counters):
+    """اجرای الزامات نوع فراخوان روی شمارنده‌های یک پرونده"""
+    rules = requirements_table().for_round(counters['round_type'])
+    missing = []
+
+    if counters['choices_count'] < rules.min_choices:
+        missing.append(_missing('choices', rules.choices_message))
+    personal_info = counters['personal_info']
+    if not all(personal_info[name] for name in rules.personal_fields):
+        missing.append(_missing('personal_info', rules.personal_message))
+    for code, level, message in rules.records:
+        if counters['records'][level] is None:
+            missing.append(_missing(code, message))
+    for rule in rules.documents:
+        if rule.applies(counters['records']) and not rule.satisfied(counters['documents']):
+            missing.append(_missing(rule.code, rule.message))
+
+    return Readiness(application_id=counters['id'], round_type=counters['round_type'], missing=missing)
+
+
+def iter_readiness(queryset):
+    """آمادگی همه پرونده‌های queryset (یک کوئری + ارزیابی در حافظه)"""
+    for counters in readiness_counters(queryset):
+        yield evaluate_readiness(counters)
+
+
+def get_application_readiness(application):
+    """آمادگی یک پرونده برای ارسال نهایی (یک کوئری)"""
+    return next(iter_readiness(Application.objects.filter(pk=application.pk)))
@@ -0,0 +1,204 @@
+"""
+مدارک و سوابق لازم برای ارسال نهایی پرونده، به تفکیک نوع فراخوان
+
+الزامات به صورت داده تعریف می‌شوند (DEFAULT_REQUIREMENTS و تغییرات هر نوع
+فراخوان در ROUND_REQUIREMENTS) و یک بار هنگام راه‌اندازی (AppConfig.ready) به
+جدول requirements_table تبدیل می‌شوند. ارزیابی (apps.applications.readiness)
+فقط با عملیات مجموعه روی شمارنده‌های از پیش محاسبه‌شده پرونده انجام می‌شود.
+
+ساختار هر بخش:
+- choices: {'min', 'message'}
+- personal_info: {'fields', 'message'} (فیلدهای User داوطلب)
+- records: لیست {'code', 'degree_level', 'message'}
+- documents: لیست {'code', 'all_of' یا 'any_of', 'message', 'when' (اختیاری)}
+  when: {'degree_level', 'status'} یا {'degree_level', 'status_not'}؛ شرط روی
+  وضعیت سابقه تحصیلی (بدون سابقه، شرط برقرار نیست)
+"""
+from dataclasses import dataclass
+
+from django.core.exceptions import ImproperlyConfigured
+
+from apps.admissions.models import AdmissionRound
+from apps.documents.models import ApplicationDocument
+from apps.applications.models import ApplicationEducationRecord
+
+
+DocType = ApplicationDocument.DocType
+
+DEFAULT_REQUIREMENTS = {
+    'choices': {
+        'min': 1,
+        'message': 'حداقل یک رشته باید انتخاب شود',
+    },
+    'personal_info': {
+        'fields': ('first_name', 'last_name', 'father_name', 'gender'),
+        'message': 'اطلاعات شخصی کامل نیست',
+    },
+    'records': [
+        {'code': 'bsc_record', 'degree_level': 'BSC', 'message': 'اطلاعات تحصیلی کارشناسی الزامی است'},
+    ],
+    'documents': [
+        {
+            'code': 'identity_documents',
+            'all_of': (DocType.PERSONAL_PHOTO, DocType.NATIONAL_CARD, DocType.ID_CARD),
+            'message': 'مدارک شناسایی کامل نیست',
+        },
+        {
+            # فارغ‌التحصیل: مدرک + ریزنمرات
+            'code': 'bsc_documents',
+            'all_of': (DocType.BSC_CERT, DocType.BSC_TRANSCRIPT),
+            'when': {'degree_level': 'BSC', 'status': 'GRADUATED'},
+            'message': 'مدارک تحصیلی کارشناسی کامل نیست (مدرک فراغت + ریزنمرات)',
+        },
+        {
+            # درحال تحصیل: ریزنمرات یا گواهی اشتغال به تحصیل
+            'code': 'bsc_documents',
+            'any_of': (DocType.BSC_TRANSCRIPT, DocType.ENROLLMENT_CERT),
+            'when': {'degree_level': 'BSC', 'status_not': 'GRADUATED'},
+            'message': 'مدارک تحصیلی کارشناسی کامل نیست (ریزنمرات)',
+        },
+    ],
+}
+
+# تغییرات هر نوع فراخوان نسبت به DEFAULT_REQUIREMENTS (جایگزینی کامل هر بخش)
+ROUND_REQUIREMENTS = {
+    AdmissionRound.RoundType.PHD_TALENT: {
+        'records': DEFAULT_REQUIREMENTS['records'] + [
+            {'code': 'msc_record', 'degree_level': 'MSC', 'message': 'اطلاعات تحصیلی کارشناسی ارشد الزامی است'},
+        ],
+    },
+}
+
+
+@dataclass(frozen=True)
+class DocumentRule:
+    code: str
+    message: str
+    all_of: frozenset
+    any_of: frozenset
+    when_level: str = None
+    when_status: str = None
+    when_negated: bool = False
+
+    def applies(self, records):
+        if self.when_level is None:
+            return True
+        status = records.get(self.when_level)
+        if status is None:
+            return False
+        return (status != self.when_status) if self.when_negated else (status == self.when_status)
+
+    def satisfied(self, documents):
+        if self.all_of and not self.all_of <= documents:
+            return False
+        if self.any_of and not self.any_of & documents:
+            return False
+        return True
+
+
+@dataclass(frozen=True)
+class RoundRequirements:
+    """الزامات کامپایل‌شده یک نوع فراخوان"""
+    round_type: str
+    min_choices: int
+    choices_message: str
+    personal_fields: tuple
+    personal_message: str
+    records: tuple   # (code, degree_level, message)
+    documents: tuple  # DocumentRule
+
+
+@dataclass(frozen=True)
+class RequirementsTable:
+    """جدول الزامات همه نوع‌های فراخوان و مجموعه داده‌هایی که باید شمرده شوند"""
+    rounds: dict
+    default: RoundRequirements
+    document_types: tuple
+    degree_levels: tuple
+    personal_fields: tuple
+
+    def for_round(self, round_type):
+        return self.rounds.get(round_type, self.default)
+
+
+def _compile_documents(rules, valid_types, valid_levels, round_type):
+    compiled = []
+    for rule in rules:
+        all_of = frozenset(str(doc_type) for doc_type in rule.get('all_of', ()))
+        any_of = frozenset(str(doc_type) for doc_type in rule.get('any_of', ()))
+        unknown = (all_of | any_of) - valid_types
+        if unknown or not (all_of or any_of):
+            raise ImproperlyConfigured(
+                f"Invalid document requirement {rule.get('code')!r} for {round_type}: {sorted(unknown) or 'empty'}"
+            )
+        when = rule.get('when') or {}
+        if when and when.get('degree_level') not in valid_levels:
+            raise ImproperlyConfigured(f"Invalid condition on {rule['code']!r} for {round_type}")
+        compiled.append(DocumentRule(
+            code=rule['code'],
+            message=rule['message'],
+            all_of=all_of,
+            any_of=any_of,
+            when_level=when.get('degree_level'),
+            when_status=when.get('status', when.get('status_not')),
+            when_negated='status_not' in when,
+        ))
+    return tuple(compiled)
+
+
+def _compile_round(round_type, spec, valid_types, valid_levels):
+    for record in spec['records']:
+        if record['degree_level'] not in valid_levels:
+            raise ImproperlyConfigured(f"Invalid record requirement {record['code']!r} for {round_type}")
+    return RoundRequirements(
+        round_type=round_type,
+        min_choices=spec['choices']['min'],
+        choices_message=spec['choices']['message'],
+        personal_fields=tuple(spec['personal_info']['fields']),
+        personal_message=spec['personal_info']['message'],
+        records=tuple((r['code'], r['degree_level'], r['message']) for r in spec['records']),
+        documents=_compile_documents(spec['documents'], valid_types, valid_levels, round_type),
+    )
+
+
+def compile_requirements(default=DEFAULT_REQUIREMENTS, overrides=ROUND_REQUIREMENTS):
+    """تبدیل تعریف داده‌ای الزامات به جدول ارزیابی (با بررسی اعتبار انواع مدارک و مقاطع)"""
+    valid_types = frozenset(DocType.values)
+    valid_levels = frozenset(level for level, _ in ApplicationEducationRecord.DEGREE_LEVEL_CHOICES)
+
+    default_rules = _compile_round(None, default, valid_types, valid_levels)
+    rounds = {
+        round_type: _compile_round(round_type, {**default, **overrides.get(round_type, {})}, valid_types, valid_levels)
+        for round_type in AdmissionRound.RoundType.values
+    }
+
+    every = [default_rules, *rounds.values()]
+    document_types = set()
+    degree_levels = set()
+    personal_fields = {}
+    for rules in every:
+        personal_fields.update(dict.fromkeys(rules.personal_fields))
+        degree_levels.update(level for _, level, _ in rules.records)
+        for rule in rules.documents:
+            document_types |= rule.all_of | rule.any_of
+            if rule.when_level:
+                degree_levels.add(rule.when_level)
+
+    return RequirementsTable(
+        rounds=rounds,
+        default=default_rules,
+        document_types=tuple(sorted(document_types)),
+        degree_levels=tuple(sorted(degree_levels)),
+        personal_fields=tuple(personal_fields),
+    )
+
+
+_table = None
+
+
+def requirements_table():
+    """جدول الزامات (یک بار کامپایل می‌شود)"""
+    global _table
+    if _table is None:
+        _table = compile_requirements()
+    return _table
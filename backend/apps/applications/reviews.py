@@ -0,0 +1,140 @@
+"""
+بررسی پرونده‌ها توسط مسئول دانشگاه (تکی و گروهی)
+
+انتقال وضعیت برای هر نتیجه بررسی در REVIEW_TRANSITIONS تعریف شده است و هر دو
+مسیر از آن استفاده می‌کنند. بررسی گروهی برای هر تعداد پرونده با چند کوئری ثابت
+انجام می‌شود:
+
+1. خواندن وضعیت و دسترسی همه پرونده‌ها (visible_to به صورت EXISTS) با قفل ردیف
+2. یک UPDATE روی همه پرونده‌های معتبر (مقادیر برای همه یکسان است)
+3. یک INSERT گروهی برای لاگ‌های گردش کار (apps.workflow.logs، پس از commit)
+
+چون update و bulk_create سیگنال post_save ندارند، بازسازی رتبه‌بندی و خلاصه
+پرونده‌ها و باطل کردن آمار داشبورد صریحاً پس از commit زمان‌بندی می‌شوند.
+"""
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from apps.applications.dashboard import schedule_summary_refresh
+from apps.applications.models import Application
+from apps.applications.rankings import schedule_ranking_refresh
+from apps.applications.statistics import invalidate_statistics
+from apps.workflow.logs import log_workflow_step, log_workflow_steps, workflow_entries
+from apps.workflow.models import ApplicationWorkflowLog
+
+
+# حداکثر تعداد پرونده در هر درخواست بررسی گروهی
+BULK_REVIEW_MAX_SIZE = 500
+
+REVIEWABLE_STATUSES = (
+    Application.Status.SUBMITTED,
+    Application.Status.UNDER_UNIVERSITY_REVIEW,
+)
+
+# نتیجه بررسی -> (وضعیت جدید پرونده، نوع مرحله در لاگ گردش کار)
+REVIEW_TRANSITIONS = {
+    Application.UniversityReviewStatus.APPROVED: (
+        Application.Status.APPROVED_BY_UNIVERSITY,
+        ApplicationWorkflowLog.StepType.APPROVED,
+    ),
+    Application.UniversityReviewStatus.APPROVED_WITH_DEFECT: (
+        Application.Status.RETURNED_FOR_CORRECTION,
+        ApplicationWorkflowLog.StepType.RETURNED,
+    ),
+    Application.UniversityReviewStatus.REJECTED: (
+        Application.Status.REJECTED_BY_UNIVERSITY,
+        ApplicationWorkflowLog.StepType.REJECTED,
+    ),
+}
+
+
+def review_comment(review_status, comment, defects=None):
+    """متن نظر مسئول دانشگاه (نواقص فقط برای تایید با نقص افزوده می‌شوند)"""
+    comment = comment or ''
+    if review_status == Application.UniversityReviewStatus.APPROVED_WITH_DEFECT and defects:
+        return f"{comment}\n\nنواقص:\n" + "\n".join([f"- {d}" for d in defects])
+    return comment
+
+
+def review_log_description(review_status, comment):
+    """متن لاگ گردش کار برای نتیجه بررسی"""
+    label = Application.UniversityReviewStatus(review_status).label
+    return f"{label}: {comment}" if comment else label
+
+
+def log_university_review(application, user, review_status):
+    """ثبت نتیجه بررسی یک پرونده در تایم‌لاین (پس از commit)"""
+    _, step_type = REVIEW_TRANSITIONS[review_status]
+    log_workflow_step(
+        application,
+        step_type,
+        review_log_description(review_status, application.university_review_comment),
+        created_by=user,
+    )
+
+
+def apply_university_review(application, user, review_status, comment='', defects=None):
+    """اعمال نتیجه بررسی روی یک پرونده (بدون ذخیره)"""
+    new_status, _ = REVIEW_TRANSITIONS[review_status]
+    application.university_review_status = review_status
+    application.university_review_comment = review_comment(review_status, comment, defects)
+    application.university_reviewed_by = user
+    application.university_reviewed_at = timezone.now()
+    application.status = new_status
+    return application
+
+
+def bulk_university_review(user, application_ids, review_status, comment='', defects=None):
+    """
+    بررسی گروهی پرونده‌ها
+
+    خروجی: لیست نتیجه به ترتیب شناسه‌های ورودی؛ هر مورد شامل id، success و
+    در صورت موفقیت status جدید یا در غیر این صورت error است.
+    """
+    new_status, step_type = REVIEW_TRANSITIONS[review_status]
+    application_ids = list(dict.fromkeys(application_ids))
+    results = {}
+
+    with transaction.atomic():
+        rows = Application.objects.filter(id__in=application_ids).select_for_update().annotate(
+            visible=Exists(Application.objects.visible_to(user).filter(pk=OuterRef('pk')))
+        ).values_list('id', 'status', 'visible')
+
+        reviewable = []
+        for application_id, current_status, visible in rows:
+            if not visible:
+                results[application_id] = {'success': False, 'error': 'شما به این پرونده دسترسی ندارید'}
+            elif current_status not in REVIEWABLE_STATUSES:
+                results[application_id] = {'success': False, 'error': 'این پرونده قابل بررسی نیست'}
+            else:
+                reviewable.append(application_id)
+
+        if reviewable:
+            now = timezone.now()
+            description = review_comment(review_status, comment, defects)
+            Application.objects.filter(id__in=reviewable).update(
+                status=new_status,
+                university_review_status=review_status,
+                university_review_comment=description,
+                university_reviewed_by=user,
+                university_reviewed_at=now,
+                updated_at=now,
+            )
+            log_workflow_steps(workflow_entries(
+                reviewable,
+                step_type,
+                review_log_description(review_status, description),
+                created_by=user,
+            ))
+            for application_id in reviewable:
+                results[application_id] = {'success': True, 'status': new_status}
+
+            schedule_ranking_refresh(reviewable)
+            schedule_summary_refresh(reviewable)
+            transaction.on_commit(invalidate_statistics)
+
+    return [
+        {'id': application_id, **results.get(application_id, {'success': False, 'error': 'پرونده یافت نشد'})}
+        for application_id in application_ids
+    ]
@@ -0,0 +1,199 @@
+"""
+محاسبه مجدد امتیاز نهایی پرونده‌ها (Application.total_score)
+
+تغییر امتیاز سوابق پژوهشی، سوابق تحصیلی یا مصاحبه از طریق signal ها با
+schedule_score_recompute ثبت می‌شود و پس از commit یک بار برای تمام پرونده‌های
+تغییر کرده اعمال می‌شود؛ امتیاز دادن به ده مقاله در یک تراکنش فقط یک محاسبه دارد.
+
+محاسبه هر تکه از پرونده‌ها با یک کوئری تجمیعی (Subquery + Sum) انجام و با
+bulk_update نوشته می‌شود.
+
+برای محاسبه کل یک فراخوان (manage.py rescore_round) از rescore_id_range استفاده
+می‌شود که برای هر جدول پژوهشی فقط یک کوئری گروه‌بندی‌شده در کل بازه اجرا می‌کند.
+"""
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import FloatField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from apps.core.batching import defer_until_commit
+from apps.applications.models import (
+    Application,
+    ResearchArticle,
+    Patent,
+    FestivalAward,
+    ConferenceArticle,
+    Book,
+    MastersThesis,
+    EducationScoring,
+    Interview,
+)
+from apps.applications.rankings import refresh_program_rankings
+from apps.applications.dashboard import schedule_summary_refresh
+
+
+RECOMPUTE_CHUNK_SIZE = 500
+
+# فراخوان‌هایی که سوابق پژوهشی و مصاحبه در امتیاز نهایی آن‌ها حساب می‌شود
+RESEARCH_ROUND_TYPES = ['PHD_TALENT', 'PHD_EXAM']
+
+# سوابق پژوهشی چندتایی: نام annotation -> مدل
+RESEARCH_SCORE_MODELS = {
+    'articles_score': ResearchArticle,
+    'patents_score': Patent,
+    'awards_score': FestivalAward,
+    'conferences_score': ConferenceArticle,
+    'books_score': Book,
+}
+
+
+def final_score(round_type, education_score, research_score, thesis_score, interview_score):
+    """
+    امتیاز نهایی = سوابق تحصیلی (EducationScoring) + سوابق پژوهشی + مصاحبه
+
+    سوابق پژوهشی، پایان‌نامه و مصاحبه فقط برای فراخوان‌های دکتری حساب می‌شوند.
+    """
+    total = education_score or 0
+    if round_type in RESEARCH_ROUND_TYPES:
+        total += (research_score or 0) + (thesis_score or 0) + (interview_score or 0)
+    return total
+
+
+def _score_sum(model):
+    """جمع امتیاز رکوردهای یک مدل برای هر پرونده (صفر در صورت نبود رکورد)"""
+    total = (
+        model.objects.filter(application=OuterRef('pk'))
+        .order_by()
+        .values('application')
+        .annotate(total=Sum('score'))
+        .values('total')
+    )
+    return Coalesce(Subquery(total, output_field=FloatField()), Value(0.0))
+
+
+def _compute_chunk(application_ids, calculated_at):
+    rows = Application.objects.filter(id__in=application_ids).annotate(
+        **{name: _score_sum(model) for name, model in RESEARCH_SCORE_MODELS.items()}
+    ).values(
+        'id',
+        'round__type',
+        'education_scoring__total_score',
+        'masters_thesis__score',
+        'interview__total_interview_score',
+        *RESEARCH_SCORE_MODELS,
+    )
+
+    applications = [
+        Application(
+            id=row['id'],
+            total_score=final_score(
+                row['round__type'],
+                row['education_scoring__total_score'],
+                sum(row[name] for name in RESEARCH_SCORE_MODELS),
+                row['masters_thesis__score'],
+                row['interview__total_interview_score'],
+            ),
+            score_calculated_at=calculated_at,
+        )
+        for row in rows
+    ]
+
+    Application.objects.bulk_update(
+        applications,
+        ['total_score', 'score_calculated_at'],
+        batch_size=RECOMPUTE_CHUNK_SIZE,
+    )
+    return {application.id: application.total_score for application in applications}
+
+
+def recompute_application_scores(application_ids):
+    """
+    محاسبه و ذخیره امتیاز نهایی مجموعه‌ای از پرونده‌ها
+
+    خروجی: دیکشنری application_id -> total_score
+    """
+    application_ids = sorted({pk for pk in application_ids if pk is not None})
+    calculated_at = timezone.now()
+    scores = {}
+    with transaction.atomic():
+        for start in range(0, len(application_ids), RECOMPUTE_CHUNK_SIZE):
+            scores.update(_compute_chunk(
+                application_ids[start:start + RECOMPUTE_CHUNK_SIZE],
+                calculated_at,
+            ))
+
+    # bulk_update سیگنال post_save ندارد؛ رتبه‌بندی برنامه‌ها و خلاصه پرونده‌ها مستقیماً به‌روز می‌شوند
+    if scores:
+        refresh_program_rankings(scores)
+        schedule_summary_refresh(scores)
+    return scores
+
+
+def schedule_score_recompute(application_ids):
+    """ثبت پرونده‌ها برای محاسبه مجدد امتیاز پس از commit تراکنش جاری"""
+    defer_until_commit(recompute_application_scores, application_ids)
+
+
+def rescore_id_range(round_id, first_id, last_id, chunk_size=RECOMPUTE_CHUNK_SIZE):
+    """
+    محاسبه مجدد امتیاز پرونده‌های یک فراخوان در بازه شناسه [first_id, last_id]
+
+    برای هر جدول امتیاز یک کوئری Sum گروه‌بندی‌شده بر اساس پرونده اجرا می‌شود،
+    نتایج در حافظه ادغام و به صورت تکه‌ای با bulk_update نوشته می‌شوند.
+    خروجی: تعداد پرونده‌های به‌روزشده
+    """
+    applications = Application.objects.filter(
+        round_id=round_id,
+        id__gte=first_id,
+        id__lte=last_id,
+    )
+    application_ids = list(applications.order_by('id').values_list('id', flat=True))
+    if not application_ids:
+        return 0
+    round_type = applications.values_list('round__type', flat=True).first()
+
+    def grouped(model, field):
+        return dict(
+            model.objects.filter(application__in=applications)
+            .order_by()
+            .values('application_id')
+            .annotate(total=Sum(field))
+            .values_list('application_id', 'total')
+        )
+
+    education = grouped(EducationScoring, 'total_score')
+    research = defaultdict(float)
+    thesis = interview = {}
+    if round_type in RESEARCH_ROUND_TYPES:
+        for model in RESEARCH_SCORE_MODELS.values():
+            for application_id, total in grouped(model, 'score').items():
+                research[application_id] += total or 0
+        thesis = grouped(MastersThesis, 'score')
+        interview = grouped(Interview, 'total_interview_score')
+
+    calculated_at = timezone.now()
+    for start in range(0, len(application_ids), chunk_size):
+        chunk = application_ids[start:start + chunk_size]
+        Application.objects.bulk_update(
+            [
+                Application(
+                    id=application_id,
+                    total_score=final_score(
+                        round_type,
+                        education.get(application_id),
+                        research.get(application_id),
+                        thesis.get(application_id),
+                        interview.get(application_id),
+                    ),
+                    score_calculated_at=calculated_at,
+                )
+                for application_id in chunk
+            ],
+            ['total_score', 'score_calculated_at'],
+        )
+
+    refresh_program_rankings(application_ids)
+    schedule_summary_refresh(application_ids)
+    return len(application_ids)
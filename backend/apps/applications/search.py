@@ -0,0 +1,131 @@
+"""
+جستجوی پرونده‌ها برای لیست‌های ادمین
+
+برای هر پرونده یک سند جستجو (ApplicationSearchDocument) شامل نام، نام خانوادگی،
+کد ملی و کد پیگیری به صورت یکسان‌سازی‌شده (apps.core.text) نگه‌داری می‌شود و با
+signal ها پس از commit به‌روز می‌شود؛ ردیف FTS پرونده حذف‌شده همراه آن حذف می‌شود.
+
+ترتیب جستجو:
+1. کد ملی یا کد پیگیری کامل: تطابق دقیق روی ایندکس یکتا
+2. در غیر این صورت: PostgreSQL با ایندکس trigram (LIKE)، SQLite با جدول FTS5 (trigram)
+"""
+import re
+
+from django.db import connection, transaction
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from apps.core.batching import defer_until_commit
+from apps.core.text import normalize_persian
+from apps.applications.models import Application, ApplicationSearchDocument
+
+
+SEARCH_REFRESH_CHUNK_SIZE = 500
+FTS_TABLE = 'applications_search_fts'
+# حداقل طول هر کلمه برای استفاده از tokenizer trigram در FTS5
+FTS_MIN_TOKEN_LENGTH = 3
+
+NATIONAL_ID_PATTERN = re.compile(r'^\d{10}$')
+TRACKING_CODE_PATTERN = re.compile(r'^[A-Z0-9]{10}$')
+
+_fts_available = None
+
+
+def _use_fts():
+    global _fts_available
+    if connection.vendor != 'sqlite':
+        return False
+    if _fts_available is None:
+        _fts_available = FTS_TABLE in connection.introspection.table_names()
+    return _fts_available
+
+
+def build_document(first_name, last_name, national_id, tracking_code):
+    return normalize_persian(' '.join(filter(None, [first_name, last_name, national_id, tracking_code])))
+
+
+def _refresh_chunk(application_ids):
+    rows = Application.objects.filter(id__in=application_ids).values_list(
+        'id',
+        'applicant__user__first_name',
+        'applicant__user__last_name',
+        'applicant__user__national_id',
+        'tracking_code',
+    )
+    documents = [
+        ApplicationSearchDocument(application_id=row[0], document=build_document(*row[1:]))
+        for row in rows
+    ]
+
+    with transaction.atomic():
+        ApplicationSearchDocument.objects.filter(application_id__in=application_ids).delete()
+        ApplicationSearchDocument.objects.bulk_create(documents)
+        if _use_fts():
+            placeholders = ', '.join(['%s'] * len(application_ids))
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f'DELETE FROM {FTS_TABLE} WHERE rowid IN ({placeholders})',
+                    list(application_ids),
+                )
+                cursor.executemany(
+                    f'INSERT INTO {FTS_TABLE} (rowid, document) VALUES (%s, %s)',
+                    [(doc.application_id, doc.document) for doc in documents],
+                )
+    return len(documents)
+
+
+def refresh_search_documents(application_ids):
+    """بازسازی سند جستجوی مجموعه‌ای از پرونده‌ها"""
+    application_ids = sorted(set(application_ids))
+    refreshed = 0
+    for start in range(0, len(application_ids), SEARCH_REFRESH_CHUNK_SIZE):
+        refreshed += _refresh_chunk(application_ids[start:start + SEARCH_REFRESH_CHUNK_SIZE])
+    return refreshed
+
+
+def remove_search_documents(application_ids):
+    """حذف ردیف‌های FTS پرونده‌های حذف‌شده (ApplicationSearchDocument با CASCADE حذف می‌شود)"""
+    application_ids = list(application_ids)
+    if not application_ids or not _use_fts():
+        return
+    placeholders = ', '.join(['%s'] * len(application_ids))
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {FTS_TABLE} WHERE rowid IN ({placeholders})', application_ids)
+
+
+def schedule_search_refresh(application_ids):
+    """ثبت پرونده‌ها برای بازسازی سند جستجو پس از commit تراکنش جاری"""
+    defer_until_commit(refresh_search_documents, application_ids)
+
+
+def _fts_query(tokens):
+    return ' AND '.join('"{}"'.format(token.replace('"', '""')) for token in tokens)
+
+
+def search_applications(queryset, term):
+    """فیلتر queryset پرونده‌ها بر اساس عبارت جستجو"""
+    term = normalize_persian(term)
+    if not term:
+        return queryset
+
+    compact = term.replace(' ', '')
+    if NATIONAL_ID_PATTERN.match(compact):
+        exact = queryset.filter(applicant__user__national_id=compact)
+        if exact.exists():
+            return exact
+    if TRACKING_CODE_PATTERN.match(compact.upper()):
+        exact = queryset.filter(tracking_code=compact.upper())
+        if exact.exists():
+            return exact
+
+    tokens = term.split(' ')
+    if _use_fts() and all(len(token) >= FTS_MIN_TOKEN_LENGTH for token in tokens):
+        return queryset.filter(id__in=RawSQL(
+            f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s',
+            [_fts_query(tokens)],
+        ))
+
+    condition = Q()
+    for token in tokens:
+        condition &= Q(search_document__document__contains=token)
+    return queryset.filter(condition)
@@ -1,11 +1,40 @@
 """
 Signals for automatic file cleanup when models are deleted or updated
+and for keeping the precomputed program rankings, final scores,
+dashboard statistics, search documents and applicant summaries in sync
 """
 import os
-from django.db.models.signals import pre_delete, pre_save
+from django.db.models.signals import pre_delete, pre_save, post_save, post_delete
+from django.db import transaction
 from django.dispatch import receiver
 from apps.documents.models import ApplicationDocument
-from apps.applications.models import OlympiadRecord, LanguageCertificate, ResearchArticle, Patent, Book, MastersThesis
+from apps.accounts.models import ApplicantProfile, User
+from apps.admissions.models import AdmissionRound, Program
+from apps.applications.models import (
+    Application,
+    ApplicationChoice,
+    ApplicationEducationRecord,
+    EducationScoring,
+    OlympiadRecord,
+    LanguageCertificate,
+    ResearchArticle,
+    Patent,
+    Book,
+    MastersThesis,
+    FestivalAward,
+    ConferenceArticle,
+    Interview,
+    ApplicationSummary,
+)
+from apps.applications.rankings import invalidate_rankings, schedule_ranking_refresh
+from apps.applications.scoring import schedule_score_recompute
+from apps.applications.statistics import STATISTICS_FIELDS, invalidate_statistics
+from apps.applications.search import remove_search_documents, schedule_search_refresh
+from apps.applications.dashboard import (
+    invalidate_applicant_dashboard,
+    invalidate_applicant_dashboards,
+    schedule_summary_refresh,
+)
 
 
 def delete_file_if_exists(file_field):
@@ -106,3 +135,163 @@ def auto_delete_book_file_on_delete(sender, instance, **kwargs):
 def auto_delete_thesis_file_on_delete(sender, instance, **kwargs):
     """حذف خودکار فایل پایان‌نامه"""
     delete_file_if_exists(instance.defense_minutes_file)
+
+
+# ============================================
+# همگام‌سازی جدول رتبه‌بندی برنامه‌ها
+# ============================================
+
+@receiver(post_save, sender=Application)
+def refresh_ranking_on_application_save(sender, instance, **kwargs):
+    """تغییر وضعیت یا امتیاز نهایی پرونده"""
+    schedule_ranking_refresh([instance.pk])
+
+
+@receiver(post_save, sender=ApplicationChoice)
+@receiver(post_delete, sender=ApplicationChoice)
+@receiver(post_save, sender=EducationScoring)
+@receiver(post_delete, sender=EducationScoring)
+@receiver(post_save, sender=ApplicationEducationRecord)
+@receiver(post_delete, sender=ApplicationEducationRecord)
+def refresh_ranking_on_related_change(sender, instance, **kwargs):
+    """تغییر انتخاب‌ها، امتیاز سوابق تحصیلی یا معدل کارشناسی"""
+    schedule_ranking_refresh([instance.application_id])
+
+
+@receiver(post_save, sender=Program)
+def refresh_ranking_on_program_change(sender, instance, created, **kwargs):
+    """تغییر نام/گرایش برنامه در سه انتخاب اول داوطلبان (و ظرفیت در گزارش پذیرش)"""
+    if created:
+        return
+    transaction.on_commit(invalidate_rankings)
+    schedule_ranking_refresh(
+        instance.application_choices.values_list('application_id', flat=True)
+    )
+
+
+# ============================================
+# محاسبه مجدد امتیاز نهایی پرونده
+# ============================================
+
+@receiver(post_save, sender=ResearchArticle)
+@receiver(post_delete, sender=ResearchArticle)
+@receiver(post_save, sender=Patent)
+@receiver(post_delete, sender=Patent)
+@receiver(post_save, sender=FestivalAward)
+@receiver(post_delete, sender=FestivalAward)
+@receiver(post_save, sender=ConferenceArticle)
+@receiver(post_delete, sender=ConferenceArticle)
+@receiver(post_save, sender=Book)
+@receiver(post_delete, sender=Book)
+@receiver(post_save, sender=MastersThesis)
+@receiver(post_delete, sender=MastersThesis)
+@receiver(post_save, sender=EducationScoring)
+@receiver(post_delete, sender=EducationScoring)
+@receiver(post_save, sender=Interview)
+@receiver(post_delete, sender=Interview)
+def recompute_score_on_change(sender, instance, **kwargs):
+    """تغییر امتیاز سوابق پژوهشی، سوابق تحصیلی یا مصاحبه"""
+    schedule_score_recompute([instance.application_id])
+
+
+# ============================================
+# باطل کردن آمار داشبورد
+# ============================================
+
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Application)
+def invalidate_statistics_on_status_change(sender, instance, update_fields=None, **kwargs):
+    """تغییر وضعیت پرونده (ذخیره با update_fields بدون فیلد وضعیت نادیده گرفته می‌شود)"""
+    if update_fields is not None and not STATISTICS_FIELDS.intersection(update_fields):
+        return
+    transaction.on_commit(invalidate_statistics)
+
+
+# ============================================
+# همگام‌سازی سند جستجوی پرونده‌ها
+# ============================================
+
+@receiver(post_save, sender=Application)
+def refresh_search_on_application_save(sender, instance, created, update_fields=None, **kwargs):
+    """ایجاد پرونده یا تغییر کد پیگیری"""
+    if update_fields is not None and 'tracking_code' not in update_fields:
+        return
+    schedule_search_refresh([instance.pk])
+
+
+@receiver(post_delete, sender=Application)
+def remove_search_on_application_delete(sender, instance, **kwargs):
+    """حذف پرونده (ردیف FTS با CASCADE حذف نمی‌شود)"""
+    remove_search_documents([instance.pk])
+
+
+SEARCH_USER_FIELDS = {'first_name', 'last_name', 'national_id'}
+
+
+@receiver(post_save, sender=User)
+def refresh_search_on_user_save(sender, instance, created, update_fields=None, **kwargs):
+    """تغییر نام یا کد ملی داوطلب (ذخیره last_login یا رمز عبور نادیده گرفته می‌شود)"""
+    if created:
+        return
+    if update_fields is not None and not SEARCH_USER_FIELDS.intersection(update_fields):
+        return
+    schedule_search_refresh(
+        Application.objects.filter(applicant__user=instance).values_list('id', flat=True)
+    )
+
+
+# ============================================
+# همگام‌سازی خلاصه پرونده‌ها (داشبورد داوطلب)
+# ============================================
+
+@receiver(post_save, sender=Application)
+def refresh_summary_on_application_save(sender, instance, **kwargs):
+    """تغییر وضعیت، امتیاز یا نتیجه پرونده"""
+    schedule_summary_refresh([instance.pk])
+
+
+@receiver(post_delete, sender=Application)
+def invalidate_dashboard_on_application_delete(sender, instance, **kwargs):
+    """حذف پرونده (خلاصه با CASCADE حذف می‌شود)"""
+    user_id = ApplicantProfile.objects.filter(pk=instance.applicant_id).values_list('user_id', flat=True).first()
+    if user_id is not None:
+        transaction.on_commit(lambda: invalidate_applicant_dashboard(user_id))
+
+
+@receiver(post_save, sender=ApplicationChoice)
+@receiver(post_delete, sender=ApplicationChoice)
+@receiver(post_save, sender=ApplicationEducationRecord)
+@receiver(post_delete, sender=ApplicationEducationRecord)
+@receiver(post_save, sender=ApplicationDocument)
+@receiver(post_delete, sender=ApplicationDocument)
+@receiver(post_save, sender=ResearchArticle)
+@receiver(post_delete, sender=ResearchArticle)
+@receiver(post_save, sender=Patent)
+@receiver(post_delete, sender=Patent)
+@receiver(post_save, sender=FestivalAward)
+@receiver(post_delete, sender=FestivalAward)
+@receiver(post_save, sender=ConferenceArticle)
+@receiver(post_delete, sender=ConferenceArticle)
+@receiver(post_save, sender=Book)
+@receiver(post_delete, sender=Book)
+@receiver(post_save, sender=MastersThesis)
+@receiver(post_delete, sender=MastersThesis)
+@receiver(post_save, sender=OlympiadRecord)
+@receiver(post_delete, sender=OlympiadRecord)
+@receiver(post_save, sender=LanguageCertificate)
+@receiver(post_delete, sender=LanguageCertificate)
+def refresh_summary_on_related_change(sender, instance, **kwargs):
+    """تغییر انتخاب‌ها، سوابق تحصیلی، مدارک یا سوابق پژوهشی"""
+    schedule_summary_refresh([instance.application_id])
+
+
+@receiver(post_save, sender=AdmissionRound)
+def refresh_summary_on_round_change(sender, instance, created, **kwargs):
+    """تغییر عنوان یا نوع فراخوان"""
+    if created:
+        return
+    ApplicationSummary.objects.filter(application__round=instance).update(
+        round_type=instance.type,
+        round_title=instance.title,
+    )
+    transaction.on_commit(invalidate_applicant_dashboards)
@@ -0,0 +1,120 @@
+"""
+آمار پرونده‌ها برای داشبورد مسئولین
+
+تمام شمارنده‌ها با یک کوئری (Count با filter) و گروه‌بندی بر اساس نوع فراخوان و
+دانشکده انتخاب اول محاسبه می‌شوند؛ جمع کل، تفکیک نوع فراخوان و تفکیک دانشکده
+در حافظه از همان نتیجه ساخته می‌شوند.
+
+نتیجه برای هر (نوع فراخوان، محدوده دسترسی) مدت کوتاهی در فضای نام stats از
+apps.core.cache نگه‌داری می‌شود و با تغییر وضعیت هر پرونده باطل می‌شود.
+"""
+from django.db.models import Count, OuterRef, Q, Subquery
+
+from apps.core.cache import namespace
+from apps.applications.models import Application, ApplicationChoice
+
+
+# شمارنده‌های داشبورد: نام -> شرط
+STATISTICS_BUCKETS = {
+    'submitted': Q(status=Application.Status.SUBMITTED),
+    'under_review': Q(status=Application.Status.UNDER_UNIVERSITY_REVIEW),
+    'approved': Q(university_review_status=Application.UniversityReviewStatus.APPROVED),
+    'returned_for_correction': Q(status=Application.Status.RETURNED_FOR_CORRECTION),
+    'rejected': Q(university_review_status=Application.UniversityReviewStatus.REJECTED),
+    'corrected_and_resubmitted': Q(
+        status=Application.Status.SUBMITTED,
+        university_reviewed_at__isnull=False,
+    ),
+}
+
+# فیلدهایی از پرونده که تغییرشان آمار را عوض می‌کند
+STATISTICS_FIELDS = {'status', 'university_review_status', 'university_reviewed_at'}
+
+
+def _empty_counts():
+    return dict.fromkeys(['total', *STATISTICS_BUCKETS], 0)
+
+
+def _add_counts(target, row):
+    for key in ('total', *STATISTICS_BUCKETS):
+        target[key] += row[key]
+
+
+def invalidate_statistics():
+    """باطل کردن تمام آمارهای cache شده"""
+    namespace('stats').invalidate()
+
+
+def permission_scope(admin_permission):
+    """
+    کلید محدوده دسترسی ادمین برای cache
+
+    تفکیک دانشکده فقط شامل دانشکده‌های مجاز مسئول دانشکده است؛
+    None یعنی دسترسی به همه دانشکده‌ها.
+    """
+    scope = admin_permission.scope
+    if scope.is_university_admin():
+        return None
+    return sorted(scope.faculty_ids) or None
+
+
+def compute_statistics(round_type=None, faculty_ids=None, scope=None):
+    """
+    محاسبه آمار با یک کوئری
+
+    با scope (PermissionScope) فقط پرونده‌های قابل مشاهده ادمین شمرده می‌شوند
+    (Application.objects.visible_to_scope). خروجی شامل شمارنده‌های کل (سازگار با
+    پاسخ قبلی)، by_round_type و by_faculty است.
+    """
+    first_choice = ApplicationChoice.objects.filter(
+        application=OuterRef('pk'),
+        priority=1,
+    )
+
+    queryset = Application.objects.all()
+    if scope is not None:
+        queryset = queryset.visible_to_scope(scope)
+    if round_type:
+        queryset = queryset.filter(round__type=round_type)
+
+    rows = queryset.annotate(
+        faculty_id=Subquery(first_choice.values('program__faculty_id')[:1]),
+        faculty_name=Subquery(first_choice.values('program__faculty__name')[:1]),
+    ).order_by().values('round__type', 'faculty_id', 'faculty_name').annotate(
+        total=Count('id'),
+        **{name: Count('id', filter=condition) for name, condition in STATISTICS_BUCKETS.items()}
+    )
+
+    stats = _empty_counts()
+    by_round_type = {}
+    by_faculty = {}
+    allowed_faculties = set(faculty_ids) if faculty_ids is not None else None
+    for row in rows:
+        _add_counts(stats, row)
+        _add_counts(by_round_type.setdefault(row['round__type'], _empty_counts()), row)
+        faculty_id = row['faculty_id']
+        if faculty_id is None:
+            continue
+        if allowed_faculties is not None and faculty_id not in allowed_faculties:
+            continue
+        counts = by_faculty.setdefault(faculty_id, {'faculty_name': row['faculty_name'], **_empty_counts()})
+        _add_counts(counts, row)
+
+    stats['by_round_type'] = by_round_type
+    stats['by_faculty'] = [
+        {'faculty_id': faculty_id, **counts}
+        for faculty_id, counts in sorted(by_faculty.items())
+    ]
+    return stats
+
+
+def get_dashboard_statistics(admin_permission, round_type=None):
+    """آمار داشبورد از cache (یا محاسبه و ذخیره در cache)"""
+    scope = admin_permission.scope
+    faculty_ids = permission_scope(admin_permission)
+    round_types_key = 'all' if scope.has_full_access else ','.join(scope.allowed_round_types)
+    faculties_key = 'all' if faculty_ids is None else ','.join(map(str, faculty_ids))
+    return namespace('stats').get_or_compute(
+        ('dashboard', round_type or 'all', round_types_key, faculties_key),
+        lambda: compute_statistics(round_type=round_type, faculty_ids=faculty_ids, scope=scope),
+    )
@@ -0,0 +1,39 @@
+"""
+Celery tasks for applications app
+"""
+from celery import shared_task
+
+from apps.applications.export_jobs import mark_export_job_failed, run_export_job
+
+
+EXPORT_JOB_MAX_RETRIES = 3
+
+
+@shared_task(bind=True, acks_late=True, reject_on_worker_lost=True, max_retries=EXPORT_JOB_MAX_RETRIES)
+def run_export_job_task(self, job_id):
+    """
+    اجرای کار خروجی پرونده‌ها
+
+    با acks_late پیام تا پایان کار در صف می‌ماند و با از کار افتادن worker دوباره
+    تحویل داده می‌شود؛ هر اجرای مجدد از آخرین تکه ذخیره‌شده ادامه می‌دهد.
+    """
+    try:
+        run_export_job(job_id)
+    except Exception as exc:
+        if self.request.retries >= self.max_retries:
+            mark_export_job_failed(job_id, str(exc))
+            raise
+        raise self.retry(exc=exc, countdown=30 * (self.request.retries + 1))
+
+
+def enqueue_export_job(job_id):
+    """
+    ثبت کار خروجی در صف Celery
+
+    اگر broker در دسترس نباشد کار در وضعیت «در صف» نمی‌ماند و ناموفق علامت می‌خورد
+    تا کاربر خطا را ببیند و بعداً آن را دوباره اجرا کند.
+    """
+    try:
+        run_export_job_task.delay(job_id)
+    except Exception as exc:
+        mark_export_job_failed(job_id, f'ثبت خروجی در صف ممکن نشد: {exc}')
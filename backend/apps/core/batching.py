@@ -0,0 +1,65 @@
+"""
+جمع‌آوری کارهای تکراری در طول یک تراکنش و اجرای یک‌باره آن‌ها پس از commit
+
+مثال: اگر در یک تراکنش ده مقاله یک پرونده امتیازدهی شود، handler فقط یک بار
+با مجموعه شناسه‌ها صدا زده می‌شود. خارج از تراکنش، handler بلافاصله اجرا می‌شود.
+"""
+import threading
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+
+_state = threading.local()
+
+
+def _pending():
+    pending = getattr(_state, 'pending', None)
+    if pending is None:
+        pending = _state.pending = {}
+    return pending
+
+
+def _is_registered(flush, using):
+    """آیا callback هنوز در صف on_commit اتصال فعلی است؟ (پس از rollback حذف می‌شود)"""
+    return any(entry[1] is flush for entry in connections[using].run_on_commit)
+
+
+def _defer(handler, items, using, collection, add):
+    pending = _pending()
+    key = (handler, using)
+    entry = pending.get(key)
+    if entry is not None and _is_registered(entry[1], using):
+        add(entry[0], items)
+        return
+
+    collected = collection(items)
+
+    def flush():
+        if pending.get(key, (None, None))[1] is flush:
+            del pending[key]
+        handler(collected)
+
+    pending[key] = (collected, flush)
+    transaction.on_commit(flush, using=using)
+
+
+def defer_until_commit(handler, items, using=DEFAULT_DB_ALIAS):
+    """
+    افزودن آیتم‌ها به صف handler؛ handler پس از commit یک بار با مجموعه کل آیتم‌ها صدا زده می‌شود
+    """
+    items = {item for item in items if item is not None}
+    if not items:
+        return
+    _defer(handler, items, using, set, set.update)
+
+
+def buffer_until_commit(handler, items, using=DEFAULT_DB_ALIAS):
+    """
+    مانند defer_until_commit ولی با حفظ ترتیب و تکرار آیتم‌ها (لیست به جای مجموعه)
+    
+    برای رکوردهایی که باید همه با یک INSERT گروهی نوشته شوند (مثل لاگ گردش کار).
+    """
+    items = list(items)
+    if not items:
+        return
+    _defer(handler, items, using, list, list.extend)
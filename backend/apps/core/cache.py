@@ -0,0 +1,233 @@
+"""
+cache دو سطحی با فضای نام (namespace)
+
+- L1: حافظه محلی هر پروسه (LocMemCache) با عمر کوتاه (CACHE_L1_TTL)
+- L2: cache مشترک (CACHES['default']؛ Redis در production، LocMemCache در توسعه و تست)
+
+هر فضای نام (catalog، stats، permissions، rankings، ...) نسخه مخصوص به خود را در
+L2 دارد و invalidate() با افزایش نسخه تمام کلیدهای آن را باطل می‌کند. نسخه نیز
+به اندازه CACHE_L1_TTL در L1 نگه‌داری می‌شود؛ پس باطل شدن در پروسه‌های دیگر حداکثر
+با همین تأخیر دیده می‌شود.
+
+get_or_compute در صورت نبود مقدار فقط به یک پروسه اجازه محاسبه می‌دهد (قفل با
+cache.add)؛ بقیه تا آماده شدن مقدار منتظر می‌مانند (single-flight).
+
+تعداد hit/miss هر فضای نام در حافظه پروسه جمع و هر چند ثانیه یک بار به L2
+منتقل می‌شود؛ cache_statistics() مجموع تمام پروسه‌ها را برمی‌گرداند.
+
+تنظیمات (settings.CACHE_NAMESPACES):
+    CACHE_NAMESPACES = {'catalog': {'ttl': 3600}, 'stats': {'ttl': 30}}
+"""
+import hashlib
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+
+
+_MISSING = object()
+
+COUNTERS = ('l1_hits', 'hits', 'misses', 'waits')
+COUNTER_FLUSH_INTERVAL = 10
+LOCK_POLL_INTERVAL = 0.05
+# حداکثر طول کلید قبل از تبدیل به hash (محدودیت memcached/خوانایی در Redis)
+MAX_KEY_LENGTH = 200
+_SAFE_KEY = re.compile(r'^[\w:,.\-]*$', re.ASCII)
+
+_l1 = LocMemCache('talent-cache-l1', {
+    'TIMEOUT': 5,
+    'OPTIONS': {'MAX_ENTRIES': 5000, 'CULL_FREQUENCY': 4},
+})
+_namespaces = {}
+_namespaces_lock = threading.Lock()
+
+
+def _l1_ttl():
+    return getattr(settings, 'CACHE_L1_TTL', 5)
+
+
+class CacheNamespace:
+    """فضای نام cache با کلیدهای نسخه‌دار، L1 محلی و محاسبه single-flight"""
+
+    def __init__(self, name, ttl=300, l1_ttl=None, alias='default', lock_timeout=30):
+        self.name = name
+        self.ttl = ttl
+        self.l1_ttl = _l1_ttl() if l1_ttl is None else l1_ttl
+        self.alias = alias
+        self.lock_timeout = lock_timeout
+        self._counters = Counter()
+        self._counters_lock = threading.Lock()
+        self._flushed_at = time.monotonic()
+
+    @property
+    def shared(self):
+        return caches[self.alias]
+
+    # --------------------------------------------
+    # نسخه و کلیدها
+    # --------------------------------------------
+
+    @property
+    def version_key(self):
+        return f'{self.name}:version'
+
+    def version(self):
+        version = _l1.get(self.version_key)
+        if version is None:
+            version = self.shared.get_or_set(self.version_key, 1, timeout=None)
+            if self.l1_ttl:
+                _l1.set(self.version_key, version, timeout=self.l1_ttl)
+        return version
+
+    def invalidate(self):
+        """باطل کردن تمام کلیدهای فضای نام (افزایش نسخه)"""
+        try:
+            self.shared.incr(self.version_key)
+        except ValueError:
+            self.shared.set(self.version_key, 1, timeout=None)
+        _l1.delete(self.version_key)
+
+    def make_key(self, key):
+        if isinstance(key, (tuple, list)):
+            key = ':'.join('' if part is None else str(part) for part in key)
+        if len(key) > MAX_KEY_LENGTH or not _SAFE_KEY.match(key):
+            key = hashlib.md5(key.encode('utf-8')).hexdigest()
+        return f'{self.name}:{self.version()}:{key}'
+
+    # --------------------------------------------
+    # خواندن و نوشتن
+    # --------------------------------------------
+
+    def _get(self, full_key):
+        if self.l1_ttl:
+            value = _l1.get(full_key, _MISSING)
+            if value is not _MISSING:
+                self._count('l1_hits')
+                return value
+        value = self.shared.get(full_key, _MISSING)
+        if value is not _MISSING:
+            self._count('hits')
+            if self.l1_ttl:
+                _l1.set(full_key, value, timeout=self.l1_ttl)
+        return value
+
+    def _set(self, full_key, value, ttl):
+        self.shared.set(full_key, value, timeout=self.ttl if ttl is None else ttl)
+        if self.l1_ttl:
+            _l1.set(full_key, value, timeout=self.l1_ttl)
+
+    def get(self, key, default=None):
+        value = self._get(self.make_key(key))
+        if value is _MISSING:
+            self._count('misses')
+            return default
+        return value
+
+    def set(self, key, value, ttl=None):
+        self._set(self.make_key(key), value, ttl)
+
+    def delete(self, key):
+        full_key = self.make_key(key)
+        self.shared.delete(full_key)
+        _l1.delete(full_key)
+
+    def get_or_compute(self, key, compute, ttl=None):
+        """
+        مقدار کلید از cache، یا محاسبه با compute() و ذخیره آن
+
+        هنگام نبود مقدار فقط پروسه‌ای که قفل را بگیرد compute را اجرا می‌کند؛ بقیه
+        حداکثر به اندازه lock_timeout منتظر مقدار می‌مانند و در غیر این صورت خودشان
+        محاسبه می‌کنند.
+        """
+        full_key = self.make_key(key)
+        value = self._get(full_key)
+        if value is not _MISSING:
+            return value
+
+        self._count('misses')
+        lock_key = f'{full_key}:lock'
+        # مقدار یکتای قفل: فقط صاحب قفل (و نه پروسه‌ای که پس از انقضای قفل
+        # بدون آن محاسبه کرده) آن را حذف می‌کند
+        lock_token = uuid.uuid4().hex
+        owns_lock = self.shared.add(lock_key, lock_token, timeout=self.lock_timeout)
+        if not owns_lock:
+            self._count('waits')
+            deadline = time.monotonic() + self.lock_timeout
+            while time.monotonic() < deadline:
+                time.sleep(LOCK_POLL_INTERVAL)
+                value = self.shared.get(full_key, _MISSING)
+                if value is not _MISSING:
+                    if self.l1_ttl:
+                        _l1.set(full_key, value, timeout=self.l1_ttl)
+                    return value
+                if self.shared.add(lock_key, lock_token, timeout=self.lock_timeout):
+                    owns_lock = True
+                    break
+
+        try:
+            value = compute()
+            self._set(full_key, value, ttl)
+        finally:
+            if owns_lock and self.shared.get(lock_key) == lock_token:
+                self.shared.delete(lock_key)
+        return value
+
+    # --------------------------------------------
+    # شمارنده‌ها
+    # --------------------------------------------
+
+    def _counter_key(self, counter):
+        return f'cache_stats:{self.name}:{counter}'
+
+    def _count(self, counter):
+        with self._counters_lock:
+            self._counters[counter] += 1
+        if time.monotonic() - self._flushed_at >= COUNTER_FLUSH_INTERVAL:
+            self.flush_counters()
+
+    def flush_counters(self):
+        """انتقال شمارنده‌های پروسه به cache مشترک"""
+        with self._counters_lock:
+            pending, self._counters = self._counters, Counter()
+            self._flushed_at = time.monotonic()
+        for counter, amount in pending.items():
+            key = self._counter_key(counter)
+            self.shared.add(key, 0, timeout=None)
+            try:
+                self.shared.incr(key, amount)
+            except ValueError:
+                self.shared.set(key, amount, timeout=None)
+
+    def statistics(self):
+        """شمارنده‌های تجمیعی تمام پروسه‌ها"""
+        self.flush_counters()
+        keys = {counter: self._counter_key(counter) for counter in COUNTERS}
+        values = self.shared.get_many(keys.values())
+        stats = {counter: values.get(key, 0) for counter, key in keys.items()}
+        lookups = stats['l1_hits'] + stats['hits'] + stats['misses']
+        stats['hit_ratio'] = round((stats['l1_hits'] + stats['hits']) / lookups, 4) if lookups else None
+        stats['version'] = self.version()
+        return stats
+
+
+def namespace(name):
+    """فضای نام cache با تنظیمات settings.CACHE_NAMESPACES[name]"""
+    cache_namespace = _namespaces.get(name)
+    if cache_namespace is None:
+        with _namespaces_lock:
+            cache_namespace = _namespaces.get(name)
+            if cache_namespace is None:
+                options = getattr(settings, 'CACHE_NAMESPACES', {}).get(name, {})
+                cache_namespace = _namespaces[name] = CacheNamespace(name, **options)
+    return cache_namespace
+
+
+def cache_statistics():
+    """شمارنده‌های hit/miss تمام فضاهای نام تعریف‌شده در تنظیمات"""
+    names = set(getattr(settings, 'CACHE_NAMESPACES', {})) | set(_namespaces)
+    return {name: namespace(name).statistics() for name in sorted(names)}
@@ -0,0 +1,50 @@
+# Generated by Django 5.0 on 2026-10-18 00:17
+
+from django.db import migrations, models
+
+from apps.core.text import normalize_persian
+
+
+def fill_normalized_columns(apps, schema_editor):
+    """پر کردن ستون‌های یکسان‌سازی‌شده برای رکوردهای موجود"""
+    University = apps.get_model('core', 'University')
+    university_rows = list(University.objects.all())
+    for row in university_rows:
+        row.name_normalized = normalize_persian(row.name)
+    University.objects.bulk_update(university_rows, ['name_normalized'], batch_size=500)
+    Faculty = apps.get_model('core', 'Faculty')
+    faculty_rows = list(Faculty.objects.all())
+    for row in faculty_rows:
+        row.name_normalized = normalize_persian(row.name)
+    Faculty.objects.bulk_update(faculty_rows, ['name_normalized'], batch_size=500)
+    Department = apps.get_model('core', 'Department')
+    department_rows = list(Department.objects.all())
+    for row in department_rows:
+        row.name_normalized = normalize_persian(row.name)
+    Department.objects.bulk_update(department_rows, ['name_normalized'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='department',
+            name='name_normalized',
+            field=models.CharField(blank=True, editable=False, max_length=255, verbose_name='نام گروه آموزشی (یکسان\u200cسازی\u200cشده)'),
+        ),
+        migrations.AddField(
+            model_name='faculty',
+            name='name_normalized',
+            field=models.CharField(blank=True, editable=False, max_length=255, verbose_name='نام دانشکده (یکسان\u200cسازی\u200cشده)'),
+        ),
+        migrations.AddField(
+            model_name='university',
+            name='name_normalized',
+            field=models.CharField(blank=True, editable=False, max_length=255, verbose_name='نام دانشگاه (یکسان\u200cسازی\u200cشده)'),
+        ),
+        migrations.RunPython(fill_normalized_columns, migrations.RunPython.noop),
+    ]
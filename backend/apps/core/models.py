@@ -1,5 +1,7 @@
 from django.db import models
 
+from apps.core.text import NormalizedFieldsMixin
+
 
 class TimeStampedModel(models.Model):
     """
@@ -12,14 +14,22 @@ class TimeStampedModel(models.Model):
         abstract = True
 
 
-class University(TimeStampedModel):
+class University(NormalizedFieldsMixin, TimeStampedModel):
     """
     دانشگاه‌ها
     """
     name = models.CharField(max_length=255, unique=True, verbose_name="نام دانشگاه")
+    name_normalized = models.CharField(
+        max_length=255,
+        blank=True,
+        editable=False,
+        verbose_name="نام دانشگاه (یکسان‌سازی‌شده)"
+    )
     code = models.CharField(max_length=50, blank=True, verbose_name="کد دانشگاه")
     is_active = models.BooleanField(default=True, verbose_name="فعال")
     
+    NORMALIZED_FIELDS = {'name_normalized': 'name'}
+    
     class Meta:
         verbose_name = "دانشگاه"
         verbose_name_plural = "دانشگاه‌ها"
@@ -29,14 +39,22 @@ class University(TimeStampedModel):
         return self.name
 
 
-class Faculty(TimeStampedModel):
+class Faculty(NormalizedFieldsMixin, TimeStampedModel):
     """
     دانشکده‌ها
     """
     name = models.CharField(max_length=255, verbose_name="نام دانشکده")
+    name_normalized = models.CharField(
+        max_length=255,
+        blank=True,
+        editable=False,
+        verbose_name="نام دانشکده (یکسان‌سازی‌شده)"
+    )
     code = models.CharField(max_length=50, blank=True, verbose_name="کد دانشکده")
     is_active = models.BooleanField(default=True, verbose_name="فعال")
     
+    NORMALIZED_FIELDS = {'name_normalized': 'name'}
+    
     class Meta:
         verbose_name = "دانشکده"
         verbose_name_plural = "دانشکده‌ها"
@@ -46,7 +64,7 @@ class Faculty(TimeStampedModel):
         return self.name
 
 
-class Department(TimeStampedModel):
+class Department(NormalizedFieldsMixin, TimeStampedModel):
     """
     گروه‌های آموزشی
     """
@@ -57,9 +75,17 @@ class Department(TimeStampedModel):
         verbose_name="دانشکده"
     )
     name = models.CharField(max_length=255, verbose_name="نام گروه آموزشی")
+    name_normalized = models.CharField(
+        max_length=255,
+        blank=True,
+        editable=False,
+        verbose_name="نام گروه آموزشی (یکسان‌سازی‌شده)"
+    )
     code = models.CharField(max_length=50, blank=True, verbose_name="کد گروه")
     is_active = models.BooleanField(default=True, verbose_name="فعال")
     
+    NORMALIZED_FIELDS = {'name_normalized': 'name'}
+    
     class Meta:
         verbose_name = "گروه آموزشی"
         verbose_name_plural = "گروه‌های آموزشی"
@@ -0,0 +1,67 @@
+"""
+یکسان‌سازی متن فارسی برای جستجو
+
+حروف عربی (ي، ك، ة، ...) به معادل فارسی، ارقام فارسی/عربی به لاتین تبدیل
+و اعراب، کشیده و نیم‌فاصله حذف می‌شوند تا «علي» و «علی» یکسان جستجو شوند.
+"""
+import re
+
+
+_CHAR_MAP = str.maketrans({
+    'ي': 'ی',
+    'ى': 'ی',
+    'ئ': 'ی',
+    'ك': 'ک',
+    'ة': 'ه',
+    'ۀ': 'ه',
+    'أ': 'ا',
+    'إ': 'ا',
+    'آ': 'ا',
+    'ؤ': 'و',
+    # ارقام فارسی و عربی
+    **{chr(0x06F0 + i): str(i) for i in range(10)},
+    **{chr(0x0660 + i): str(i) for i in range(10)},
+    # نیم‌فاصله و کشیده
+    '\u200c': ' ',
+    '\u200f': '',
+    '\u200e': '',
+    '\u0640': '',
+})
+
+# اعراب (فتحه، کسره، ضمه، تنوین، تشدید، سکون، ...)
+_DIACRITICS = re.compile('[\u064b-\u065f\u0670]')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_persian(text):
+    """یکسان‌سازی متن برای ذخیره و جستجو (حروف کوچک، بدون فاصله اضافه)"""
+    if not text:
+        return ''
+    text = str(text).translate(_CHAR_MAP)
+    text = _DIACRITICS.sub('', text)
+    return _WHITESPACE.sub(' ', text).strip().lower()
+
+
+class NormalizedFieldsMixin:
+    """
+    پر کردن خودکار ستون‌های سایه یکسان‌سازی‌شده هنگام ذخیره
+
+    مدل‌ها با NORMALIZED_FIELDS = {'name_normalized': 'name'} ستون سایه و فیلد مبدأ را
+    اعلام می‌کنند؛ جستجو و یکتاسازی روی ستون سایه (دارای ایندکس) انجام می‌شود.
+    """
+    NORMALIZED_FIELDS = {}
+
+    def fill_normalized_fields(self):
+        for target, source in self.NORMALIZED_FIELDS.items():
+            setattr(self, target, normalize_persian(getattr(self, source)))
+
+    def save(self, *args, **kwargs):
+        self.fill_normalized_fields()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            extra = [
+                target for target, source in self.NORMALIZED_FIELDS.items()
+                if source in update_fields and target not in update_fields
+            ]
+            kwargs['update_fields'] = list(update_fields) + extra
+        super().save(*args, **kwargs)
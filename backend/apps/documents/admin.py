@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import ApplicationDocument
+from .models import ApplicationDocument, DocumentUploadSession
 
 
 @admin.register(ApplicationDocument)
@@ -35,3 +35,12 @@ class ApplicationDocumentAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         }),
     )
+
+
+@admin.register(DocumentUploadSession)
+class DocumentUploadSessionAdmin(admin.ModelAdmin):
+    list_display = ['application', 'type', 'filename', 'received_size', 'total_size', 'status', 'updated_at']
+    list_filter = ['status', 'type']
+    search_fields = ['token', 'application__tracking_code', 'filename']
+    readonly_fields = ['token', 'received_size', 'checksum', 'created_at', 'updated_at']
+    raw_id_fields = ['application', 'document']
@@ -0,0 +1,25 @@
+"""
+حذف آپلودهای تکه‌ای ناتمام قدیمی (DocumentUploadSession) و فایل‌های موقت آن‌ها
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.documents.uploads import cleanup_stale_uploads
+
+
+class Command(BaseCommand):
+    help = 'Remove unfinished chunked document uploads that have been idle longer than the TTL'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--hours',
+            type=int,
+            default=getattr(settings, 'DOCUMENT_UPLOAD_SESSION_TTL_HOURS', 48),
+            help='Idle time in hours before an upload is removed (default: DOCUMENT_UPLOAD_SESSION_TTL_HOURS)',
+        )
+
+    def handle(self, *args, **options):
+        count = cleanup_stale_uploads(options['hours'])
+        self.stdout.write(
+            self.style.SUCCESS(f'✓ {count} آپلود ناتمام حذف شد')
+        )
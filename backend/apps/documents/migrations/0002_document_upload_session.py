@@ -0,0 +1,38 @@
+# Generated by Django 5.0 on 2026-10-18 01:11
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0007_application_summary'),
+        ('documents', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DocumentUploadSession',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='تاریخ ایجاد')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='تاریخ بروزرسانی')),
+                ('token', models.UUIDField(default=uuid.uuid4, editable=False, unique=True, verbose_name='شناسه آپلود')),
+                ('type', models.CharField(choices=[('PERSONAL_PHOTO', 'عکس پرسنلی'), ('NATIONAL_CARD', 'کارت ملی'), ('ID_CARD', 'شناسنامه'), ('BSC_CERT', 'مدرک کارشناسی'), ('BSC_TRANSCRIPT', 'ریزنمرات کارشناسی'), ('MSC_CERT', 'مدرک کارشناسی ارشد'), ('MSC_TRANSCRIPT', 'ریزنمرات کارشناسی ارشد'), ('MSC_EXCELLENCE_CERT', 'فرم رتبه ممتاز ارشد'), ('EXCELLENCE_CERT', 'گواهی دانشجوی ممتاز'), ('GRADUATION_CERT', 'گواهی فارغ\u200cالتحصیلی'), ('ENROLLMENT_CERT', 'گواهی اشتغال به تحصیل'), ('OLYMPIAD_CERT', 'فرم کسب رتبه در المپیاد علمی'), ('ENGLISH_TEST_CERT', 'فرم کسب امتیاز از آزمون\u200cهای زبان انگلیسی'), ('OTHER', 'سایر')], max_length=30, verbose_name='نوع مدرک')),
+                ('filename', models.CharField(max_length=255, verbose_name='نام فایل')),
+                ('total_size', models.PositiveBigIntegerField(verbose_name='حجم کل')),
+                ('checksum', models.CharField(max_length=64, verbose_name='SHA-256')),
+                ('received_size', models.PositiveBigIntegerField(default=0, verbose_name='حجم دریافت\u200cشده')),
+                ('status', models.CharField(choices=[('UPLOADING', 'در حال آپلود'), ('COMPLETED', 'تکمیل شده')], default='UPLOADING', max_length=20, verbose_name='وضعیت')),
+                ('application', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='document_uploads', to='applications.application', verbose_name='درخواست')),
+                ('document', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='documents.applicationdocument', verbose_name='مدرک')),
+            ],
+            options={
+                'verbose_name': 'آپلود مدرک',
+                'verbose_name_plural': 'آپلودهای مدارک',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
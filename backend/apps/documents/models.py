@@ -1,3 +1,5 @@
+import uuid
+
 from django.db import models
 from django.core.validators import FileExtensionValidator
 from apps.core.models import TimeStampedModel
@@ -110,3 +112,61 @@ class ApplicationDocument(TimeStampedModel):
     
     def __str__(self):
         return f"{self.application.tracking_code} - {self.get_type_display()}"
+
+
+class DocumentUploadSession(TimeStampedModel):
+    """
+    آپلود تکه‌ای و قابل ادامه یک مدرک (apps.documents.uploads)
+
+    تکه‌ها مستقیماً به انتهای فایل موقت کنار محل نهایی مدرک (با همان مسیر
+    application_document_path) نوشته می‌شوند و received_size پس از هر تکه ذخیره
+    می‌شود؛ پس از قطع اتصال، آپلود از received_size ادامه می‌یابد. در پایان
+    checksum (SHA-256) بررسی و فایل بدون کپی به نام نهایی منتقل می‌شود.
+    """
+    class Status(models.TextChoices):
+        UPLOADING = "UPLOADING", "در حال آپلود"
+        COMPLETED = "COMPLETED", "تکمیل شده"
+
+    token = models.UUIDField(
+        default=uuid.uuid4,
+        unique=True,
+        editable=False,
+        verbose_name="شناسه آپلود"
+    )
+    application = models.ForeignKey(
+        Application,
+        on_delete=models.CASCADE,
+        related_name='document_uploads',
+        verbose_name="درخواست"
+    )
+    type = models.CharField(
+        max_length=30,
+        choices=ApplicationDocument.DocType.choices,
+        verbose_name="نوع مدرک"
+    )
+    filename = models.CharField(max_length=255, verbose_name="نام فایل")
+    total_size = models.PositiveBigIntegerField(verbose_name="حجم کل")
+    checksum = models.CharField(max_length=64, verbose_name="SHA-256")
+    received_size = models.PositiveBigIntegerField(default=0, verbose_name="حجم دریافت‌شده")
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.UPLOADING,
+        verbose_name="وضعیت"
+    )
+    document = models.ForeignKey(
+        ApplicationDocument,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='+',
+        verbose_name="مدرک"
+    )
+
+    class Meta:
+        verbose_name = "آپلود مدرک"
+        verbose_name_plural = "آپلودهای مدارک"
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.application.tracking_code} - {self.filename} ({self.received_size}/{self.total_size})"
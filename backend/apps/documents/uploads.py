@@ -0,0 +1,182 @@
+"""
+آپلود تکه‌ای و قابل ادامه مدارک داوطلب (DocumentUploadSession)
+
+1. ایجاد نشست با نوع مدرک، نام فایل، حجم کل و SHA-256 فایل
+2. ارسال تکه‌ها با PUT و offset برابر received_size؛ بدنه درخواست بلوک به بلوک
+   (UPLOAD_BLOCK_SIZE) و بدون تراکنش باز در یک فایل تکه جداگانه روی دیسک نوشته
+   می‌شود، سپس فقط برای بررسی offset، افزودن تکه به انتهای فایل موقت
+   (application_document_path/.<token>.part) و ثبت received_size ردیف نشست قفل
+   می‌شود. مصرف حافظه مستقل از حجم فایل و تکه است؛ پس از قطع اتصال هر چه دریافت
+   شده حفظ می‌شود و کلاینت از received_size ادامه می‌دهد.
+3. تکمیل: بررسی حجم و checksum و انتقال فایل موقت (بدون کپی) به نام نهایی مدرک
+
+فقط با storage فایل‌سیستمی (FileSystemStorage پیش‌فرض) کار می‌کند.
+"""
+import hashlib
+import os
+import shutil
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.http import UnreadablePostError
+from django.utils import timezone
+
+from apps.documents.models import ApplicationDocument, DocumentUploadSession, application_document_path
+
+
+UPLOAD_BLOCK_SIZE = 64 * 1024
+ALLOWED_EXTENSIONS = ('pdf', 'jpg', 'jpeg', 'png')
+
+OFFSET_MISMATCH = 'offset با حجم دریافت‌شده مطابقت ندارد'
+
+
+def max_upload_size():
+    return getattr(settings, 'DOCUMENT_UPLOAD_MAX_SIZE', 20 * 1024 * 1024)
+
+
+def max_chunk_size():
+    return getattr(settings, 'DOCUMENT_UPLOAD_CHUNK_SIZE', 2 * 1024 * 1024)
+
+
+def part_path(session):
+    """مسیر فایل موقت نشست (کنار محل نهایی مدرک تا انتقال آن بدون کپی باشد)"""
+    return default_storage.path(application_document_path(session, f'.{session.token}.part'))
+
+
+def _remove_part(session):
+    try:
+        os.remove(part_path(session))
+    except FileNotFoundError:
+        pass
+
+
+def _locked(session):
+    return DocumentUploadSession.objects.select_for_update().select_related('application').get(pk=session.pk)
+
+
+def _copy_stream(stream, target, length):
+    """کپی حداکثر length بایت از stream؛ با قطع اتصال، بخش دریافت‌شده حفظ می‌شود"""
+    remaining = length
+    while remaining > 0:
+        try:
+            block = stream.read(min(UPLOAD_BLOCK_SIZE, remaining))
+        except (UnreadablePostError, OSError):
+            break
+        if not block:
+            break
+        target.write(block)
+        remaining -= len(block)
+
+
+def _receive_chunk(session, stream, length):
+    """نوشتن بدنه درخواست در یک فایل تکه موقت (خارج از تراکنش)"""
+    path = f'{part_path(session)}.{uuid.uuid4().hex}.chunk'
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as target:
+        _copy_stream(stream, target, length)
+    return path
+
+
+def append_chunk(session, offset, stream, length):
+    """
+    نوشتن یک تکه از offset
+
+    بدنه (که ممکن است از کلاینت کند برسد) بدون قفل دریافت می‌شود؛ ردیف نشست فقط
+    هنگام افزودن تکه دریافت‌شده به فایل موقت قفل می‌شود. فایل موقت پیش از افزودن
+    به received_size کوتاه می‌شود (حذف داده‌های نیمه‌کاره). خروجی: (session, error_message)
+    """
+    if session.status != DocumentUploadSession.Status.UPLOADING:
+        return session, 'این آپلود به پایان رسیده است'
+    if offset != session.received_size:
+        return session, OFFSET_MISMATCH
+    if offset + length > session.total_size:
+        return session, 'حجم تکه از حجم اعلام‌شده فایل بیشتر است'
+
+    chunk_path = _receive_chunk(session, stream, length)
+    try:
+        with transaction.atomic():
+            session = _locked(session)
+            # ممکن است درخواست دیگری هم‌زمان همین offset را نوشته باشد
+            if session.status != DocumentUploadSession.Status.UPLOADING:
+                return session, 'این آپلود به پایان رسیده است'
+            if offset != session.received_size:
+                return session, OFFSET_MISMATCH
+
+            path = part_path(session)
+            with open(path, 'r+b' if os.path.exists(path) else 'wb') as target, open(chunk_path, 'rb') as chunk:
+                target.truncate(offset)
+                target.seek(offset)
+                shutil.copyfileobj(chunk, target, UPLOAD_BLOCK_SIZE)
+                target.flush()
+                os.fsync(target.fileno())
+                session.received_size = target.tell()
+
+            session.save(update_fields=['received_size', 'updated_at'])
+    finally:
+        os.remove(chunk_path)
+    return session, None
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as source:
+        for block in iter(lambda: source.read(UPLOAD_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def complete_upload(session):
+    """
+    بررسی checksum و ساخت ApplicationDocument از فایل دریافت‌شده
+
+    با checksum نامعتبر فایل موقت حذف و نشست از ابتدا قابل ارسال می‌شود.
+    خروجی: (session, error_message)
+    """
+    with transaction.atomic():
+        session = _locked(session)
+        if session.status == DocumentUploadSession.Status.COMPLETED:
+            return session, None
+        if session.received_size != session.total_size:
+            return session, 'فایل به طور کامل دریافت نشده است'
+
+        path = part_path(session)
+        if _sha256(path) != session.checksum:
+            _remove_part(session)
+            session.received_size = 0
+            session.save(update_fields=['received_size', 'updated_at'])
+            return session, 'checksum فایل مطابقت ندارد؛ فایل باید دوباره ارسال شود'
+
+        document = ApplicationDocument(application=session.application, type=session.type)
+        name = default_storage.get_available_name(application_document_path(document, session.filename))
+        os.replace(path, default_storage.path(name))
+        document.file.name = name
+        document.save()
+
+        session.status = DocumentUploadSession.Status.COMPLETED
+        session.document = document
+        session.save(update_fields=['status', 'document', 'updated_at'])
+    return session, None
+
+
+def cancel_upload(session):
+    """حذف نشست و فایل موقت آن"""
+    if session.status == DocumentUploadSession.Status.UPLOADING:
+        _remove_part(session)
+    session.delete()
+
+
+def cleanup_stale_uploads(max_age_hours):
+    """حذف نشست‌های ناتمامی که max_age_hours ساعت تغییری نداشته‌اند"""
+    cutoff = timezone.now() - timedelta(hours=max_age_hours)
+    sessions = DocumentUploadSession.objects.filter(
+        status=DocumentUploadSession.Status.UPLOADING,
+        updated_at__lt=cutoff,
+    ).select_related('application')
+    count = 0
+    for session in sessions.iterator():
+        cancel_upload(session)
+        count += 1
+    return count
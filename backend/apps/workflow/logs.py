@@ -0,0 +1,63 @@
+"""
+ثبت لاگ گردش کار پرونده‌ها
+
+لاگ‌ها به جای INSERT جداگانه در طول تراکنش جمع می‌شوند و پس از commit با یک
+bulk_create نوشته می‌شوند (با rollback تراکنش، لاگ‌ها هم نوشته نمی‌شوند). خارج از
+تراکنش، لاگ بلافاصله نوشته می‌شود.
+
+با WORKFLOW_LOG_ASYNC=True نوشتن به تسک Celery (apps.workflow.tasks) سپرده می‌شود
+و درخواست منتظر INSERT نمی‌ماند.
+"""
+import logging
+
+from django.conf import settings
+
+from apps.core.batching import buffer_until_commit
+from apps.workflow.models import ApplicationWorkflowLog
+
+
+def _entry(application, step_type, description, created_by=None):
+    return {
+        'application_id': getattr(application, 'pk', application),
+        'step_type': step_type,
+        'description': description,
+        'created_by_id': getattr(created_by, 'pk', created_by),
+    }
+
+
+def write_workflow_logs(entries):
+    """نوشتن لاگ‌ها با یک INSERT گروهی"""
+    return ApplicationWorkflowLog.objects.bulk_create(
+        [ApplicationWorkflowLog(**entry) for entry in entries]
+    )
+
+
+def _flush(entries):
+    if getattr(settings, 'WORKFLOW_LOG_ASYNC', False):
+        from apps.workflow.tasks import write_workflow_logs_task
+        try:
+            write_workflow_logs_task.delay(list(entries))
+            return
+        except Exception:
+            # در دسترس نبودن broker نباید لاگ‌ها را از بین ببرد
+            logging.exception("Could not enqueue %d workflow log entries; writing inline", len(entries))
+    write_workflow_logs(entries)
+
+
+def log_workflow_step(application, step_type, description, created_by=None):
+    """
+    ثبت یک مرحله در تایم‌لاین پرونده (پس از commit تراکنش جاری)
+
+    application و created_by می‌توانند نمونه مدل یا شناسه باشند.
+    """
+    log_workflow_steps([_entry(application, step_type, description, created_by)])
+
+
+def log_workflow_steps(entries):
+    """ثبت چند لاگ (دیکشنری‌هایی با کلیدهای application_id، step_type، description، created_by_id)"""
+    buffer_until_commit(_flush, entries)
+
+
+def workflow_entries(application_ids, step_type, description, created_by=None):
+    """لاگ یکسان برای چند پرونده (مثلاً بررسی گروهی)"""
+    return [_entry(application_id, step_type, description, created_by) for application_id in application_ids]
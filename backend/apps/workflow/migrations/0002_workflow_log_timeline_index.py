@@ -0,0 +1,19 @@
+# Generated by Django 5.0 on 2026-10-18 00:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workflow', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='applicationworkflowlog',
+            index=models.Index(fields=['application', 'created_at'], name='workflow_log_app_created_idx'),
+        ),
+    ]
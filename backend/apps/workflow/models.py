@@ -119,6 +119,10 @@ class ApplicationWorkflowLog(TimeStampedModel):
         verbose_name = "لاگ گردش کار"
         verbose_name_plural = "لاگ‌های گردش کار"
         ordering = ['application', '-created_at']
+        indexes = [
+            # خواندن تایم‌لاین یک پرونده به ترتیب زمان
+            models.Index(fields=['application', 'created_at'], name='workflow_log_app_created_idx'),
+        ]
     
     def __str__(self):
         return f"{self.application.tracking_code} - {self.get_step_type_display()}"
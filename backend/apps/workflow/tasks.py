@@ -0,0 +1,12 @@
+"""
+Celery tasks for workflow app
+"""
+from celery import shared_task
+
+from apps.workflow.logs import write_workflow_logs
+
+
+@shared_task(acks_late=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=5)
+def write_workflow_logs_task(entries):
+    """نوشتن لاگ‌های گردش کار جمع‌شده در یک تراکنش (حالت WORKFLOW_LOG_ASYNC)"""
+    write_workflow_logs(entries)
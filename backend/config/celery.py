@@ -0,0 +1,14 @@
+"""
+Celery application for Talent Admission System
+
+worker: celery -A config worker -l info
+"""
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+app = Celery('talent')
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
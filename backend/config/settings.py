@@ -6,6 +6,7 @@ from pathlib import Path
 from datetime import timedelta
 import logging
 from decouple import config
+from django.core.exceptions import ImproperlyConfigured
 import sentry_sdk
 from sentry_sdk.integrations.django import DjangoIntegration
 from sentry_sdk.integrations.celery import CeleryIntegration
@@ -254,6 +255,90 @@ SPECTACULAR_SETTINGS = {
 FILE_UPLOAD_MAX_MEMORY_SIZE = 5242880  # 5 MB
 DATA_UPLOAD_MAX_MEMORY_SIZE = 5242880  # 5 MB
 
+# Chunked / resumable document uploads (apps.documents.uploads): chunks are
+# streamed to disk, so these limits are independent of the in-memory limits above
+DOCUMENT_UPLOAD_MAX_SIZE = config('DOCUMENT_UPLOAD_MAX_SIZE', default=20 * 1024 * 1024, cast=int)
+DOCUMENT_UPLOAD_CHUNK_SIZE = config('DOCUMENT_UPLOAD_CHUNK_SIZE', default=2 * 1024 * 1024, cast=int)
+# Unfinished upload sessions older than this are removed by cleanup_document_uploads
+DOCUMENT_UPLOAD_SESSION_TTL_HOURS = config('DOCUMENT_UPLOAD_SESSION_TTL_HOURS', default=48, cast=int)
+
+# Cache
+# با REDIS_URL (مثلاً redis://localhost:6379/1) cache مشترک بین تمام پروسه‌ها Redis است؛
+# بدون آن (فقط توسعه و تست) از حافظه محلی استفاده می‌شود. apps.core.cache یک L1 محلی
+# جلوی این cache قرار می‌دهد.
+# باطل کردن cache (کاتالوگ، دسترسی‌ها، داشبورد، رتبه‌بندی و آمار) فقط در cache مشترک به
+# همه workerهای gunicorn می‌رسد؛ در production بدون REDIS_URL برنامه اجرا نمی‌شود.
+REDIS_URL = config('REDIS_URL', default='')
+if not DEBUG and not REDIS_URL:
+    raise ImproperlyConfigured(
+        'REDIS_URL must be set when DEBUG is False: a per-process cache would let '
+        'gunicorn workers serve stale data after invalidation'
+    )
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'talent',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'talent-default',
+        }
+    }
+
+# Celery
+# بدون broker (توسعه و تست) با CELERY_TASK_ALWAYS_EAGER=True کارها در همان پروسه اجرا می‌شوند
+CELERY_BROKER_URL = config('CELERY_BROKER_URL', default=REDIS_URL or 'redis://localhost:6379/0')
+CELERY_TASK_ALWAYS_EAGER = config('CELERY_TASK_ALWAYS_EAGER', default=False, cast=bool)
+CELERY_TASK_ACKS_LATE = True
+CELERY_TASK_REJECT_ON_WORKER_LOST = True
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+CELERY_TIMEZONE = TIME_ZONE
+
+# عمر L1 محلی هر پروسه (ثانیه)؛ حداکثر تأخیر دیده شدن invalidate در پروسه‌های دیگر
+CACHE_L1_TTL = config('CACHE_L1_TTL', default=5, cast=int)
+
+# Dashboard statistics cache (seconds)
+DASHBOARD_STATISTICS_CACHE_TTL = config('DASHBOARD_STATISTICS_CACHE_TTL', default=30, cast=int)
+
+# Cached total count for paginated application lists (seconds)
+PAGINATION_COUNT_CACHE_TTL = config('PAGINATION_COUNT_CACHE_TTL', default=60, cast=int)
+
+# Public program catalog cache (seconds); invalidated on program/faculty/round changes
+PROGRAM_CATALOG_CACHE_TTL = config('PROGRAM_CATALOG_CACHE_TTL', default=3600, cast=int)
+
+# Background application exports (rows per chunk written before progress is saved)
+EXPORT_JOB_CHUNK_SIZE = config('EXPORT_JOB_CHUNK_SIZE', default=2000, cast=int)
+
+# Background export files live outside MEDIA_ROOT (not served by Nginx; downloaded
+# only through the authenticated API) and are removed after the retention period
+EXPORT_JOB_ROOT = BASE_DIR / config('EXPORT_JOB_ROOT', default='private/exports')
+EXPORT_JOB_RETENTION_HOURS = config('EXPORT_JOB_RETENTION_HOURS', default=72, cast=int)
+
+# Workflow logs are buffered per transaction and bulk-inserted on commit;
+# True hands each batch to a Celery task instead
+WORKFLOW_LOG_ASYNC = config('WORKFLOW_LOG_ASYNC', default=False, cast=bool)
+
+# Applicant dashboard (ApplicationSummary list per applicant) cache (seconds)
+APPLICANT_DASHBOARD_CACHE_TTL = config('APPLICANT_DASHBOARD_CACHE_TTL', default=600, cast=int)
+
+# Admission report (ProgramRanking) cache (seconds)
+RANKINGS_CACHE_TTL = config('RANKINGS_CACHE_TTL', default=300, cast=int)
+
+# فضاهای نام apps.core.cache
+CACHE_NAMESPACES = {
+    'catalog': {'ttl': PROGRAM_CATALOG_CACHE_TTL},
+    'stats': {'ttl': DASHBOARD_STATISTICS_CACHE_TTL},
+    # بدون L1 محلی: لغو دسترسی بلافاصله در همه workerها دیده می‌شود
+    'permissions': {'ttl': 300, 'l1_ttl': 0},
+    'rankings': {'ttl': RANKINGS_CACHE_TTL},
+    'dashboard': {'ttl': APPLICANT_DASHBOARD_CACHE_TTL},
+}
+
 # Security Settings for Production
 # این تنظیمات در محیط production فعال می‌شوند
 if not DEBUG:
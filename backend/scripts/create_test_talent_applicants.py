@@ -29,6 +29,7 @@ from apps.applications.models import (
     EducationScoring,
 )
 from apps.core.models import Department, University
+from apps.core.text import normalize_persian
 from apps.documents.models import ApplicationDocument
 
 
@@ -64,10 +65,9 @@ def ensure_universities() -> dict[str, University]:
     ]
     created = {}
     for name, code in definitions:
-        university, _ = University.objects.get_or_create(
-            name=name,
-            defaults={'code': code, 'is_active': True}
-        )
+        university = University.objects.filter(name_normalized=normalize_persian(name)).first()
+        if not university:
+            university = University.objects.create(name=name, code=code, is_active=True)
         created[name] = university
     return created
 
@@ -105,7 +105,9 @@ def build_phd_programs(phd_round: AdmissionRound) -> list[Program]:
 
     programs = []
     for template in templates:
-        department = Department.objects.filter(name=template['department_name']).first()
+        department = Department.objects.filter(
+            name_normalized=normalize_persian(template['department_name'])
+        ).first()
         if not department:
             raise ValueError(
                 f"گروه آموزشی '{template['department_name']}' در دیتابیس پیدا نشد."
@@ -12,6 +12,7 @@ from django.db import transaction
 
 from apps.admissions.models import AdmissionRound, Program
 from apps.core.models import Faculty, Department
+from apps.core.text import normalize_persian
 
 
 RAW_PROGRAMS: List[Dict[str, Optional[str]]] = [
@@ -164,6 +165,18 @@ RAW_PROGRAMS: List[Dict[str, Optional[str]]] = [
 ]
 
 
+def _get_or_create_normalized(model, lookup: Dict, defaults: Dict):
+    """
+    یکتاسازی بر اساس ستون‌های یکسان‌سازی‌شده (ی/ک عربی و فارسی یک رکورد حساب می‌شوند)
+
+    اگر از قبل چند رکورد معادل وجود داشته باشد، قدیمی‌ترین برگردانده می‌شود.
+    """
+    obj = model.objects.filter(**lookup).order_by("id").first()
+    if obj:
+        return obj, False
+    return model.objects.create(**lookup, **defaults), True
+
+
 @transaction.atomic
 def run() -> None:
     round_obj = (
@@ -186,26 +199,35 @@ def run() -> None:
         orientation = (row["orientation"] or "").strip()
         bachelor = (row["bachelor"] or "").strip()
 
-        faculty_obj, fac_created = Faculty.objects.get_or_create(name=faculty_name, defaults={"is_active": True})
+        faculty_obj, fac_created = _get_or_create_normalized(
+            Faculty,
+            {"name_normalized": normalize_persian(faculty_name)},
+            {"name": faculty_name, "is_active": True},
+        )
         if fac_created:
             created_faculties += 1
 
-        department_obj, dept_created = Department.objects.get_or_create(
-            faculty=faculty_obj,
-            name=dept_name,
-            defaults={"is_active": True},
+        department_obj, dept_created = _get_or_create_normalized(
+            Department,
+            {"faculty": faculty_obj, "name_normalized": normalize_persian(dept_name)},
+            {"name": dept_name, "is_active": True},
         )
         if dept_created:
             created_departments += 1
 
         code = f"MA-{idx:03d}"
-        program_obj, prog_created = Program.objects.get_or_create(
-            round=round_obj,
-            faculty=faculty_obj,
-            department=department_obj,
-            name=program_name,
-            orientation=orientation,
-            defaults={
+        program_obj, prog_created = _get_or_create_normalized(
+            Program,
+            {
+                "round": round_obj,
+                "faculty": faculty_obj,
+                "department": department_obj,
+                "name_normalized": normalize_persian(program_name),
+                "orientation_normalized": normalize_persian(orientation),
+            },
+            {
+                "name": program_name,
+                "orientation": orientation,
                 "degree_level": Program.DEGREE_MA,
                 "code": code,
                 "bachelor_related_field": bachelor,
@@ -42,7 +42,8 @@ print_success "سیستم به‌روز شد"
 
 # 2. نصب پیش‌نیازهای پایه
 print_info "نصب پیش‌نیازهای پایه..."
-apt install -y software-properties-common curl wget git nano ufw supervisor nginx
+apt install -y software-properties-common curl wget git nano ufw supervisor nginx redis-server
+systemctl enable --now redis-server
 print_success "پیش‌نیازهای پایه نصب شد"
 
 # 3. نصب Python
@@ -116,12 +117,21 @@ DB_NAME=db.sqlite3
 
 # CORS
 CORS_ALLOWED_ORIGINS=http://81.22.134.84
+
+# Cache مشترک بین workerهای gunicorn (الزامی با DEBUG=False)
+REDIS_URL=redis://127.0.0.1:6379/1
 EOF
     print_success "فایل .env ساخته شد"
 else
     print_info "فایل .env از قبل وجود دارد"
 fi
 
+# فایل‌های .env قدیمی: افزودن cache مشترک
+if ! grep -q '^REDIS_URL=' .env; then
+    echo 'REDIS_URL=redis://127.0.0.1:6379/1' >> .env
+    print_success "REDIS_URL به .env اضافه شد"
+fi
+
 # اجرای migrations
 print_info "اجرای migrations..."
 python manage.py makemigrations
@@ -174,11 +184,31 @@ stderr_logfile=/var/log/django-talent.err.log
 stdout_logfile=/var/log/django-talent.out.log
 EOF
 
+# worker Celery برای خروجی‌های پس‌زمینه پرونده‌ها (ExportJob)
+cat > /etc/supervisor/conf.d/celery-talent.conf << EOF
+[program:celery-talent]
+directory=/var/www/talent/backend
+command=/var/www/talent/backend/venv/bin/celery -A config worker -l info --concurrency 2
+user=root
+autostart=true
+autorestart=true
+stopwaitsecs=600
+stderr_logfile=/var/log/celery-talent.err.log
+stdout_logfile=/var/log/celery-talent.out.log
+EOF
+
 supervisorctl reread
 supervisorctl update
-supervisorctl restart django-talent
+supervisorctl restart django-talent celery-talent
 print_success "Supervisor پیکربندی شد"
 
+# حذف هر ساعت خروجی‌های قدیمی (EXPORT_JOB_RETENTION_HOURS) و آپلودهای ناتمام
+# (DOCUMENT_UPLOAD_SESSION_TTL_HOURS) همراه فایل‌های .part آن‌ها
+cat > /etc/cron.d/talent << EOF
+0 * * * * root cd /var/www/talent/backend && venv/bin/python manage.py cleanup_export_jobs >> /var/log/talent-cleanup.log 2>&1
+30 * * * * root cd /var/www/talent/backend && venv/bin/python manage.py cleanup_document_uploads >> /var/log/talent-cleanup.log 2>&1
+EOF
+
 # 11. پیکربندی Nginx
 print_info "پیکربندی Nginx..."
 cat > /etc/nginx/sites-available/talent << 'EOF'
@@ -186,6 +216,10 @@ server {
     listen 80;
     server_name 81.22.134.84;
 
+    # آپلود مدارک: فایل‌های تا ۴ مگابایت یکجا و بزرگ‌ترها در تکه‌های ۲ مگابایتی
+    # (DOCUMENT_UPLOAD_CHUNK_SIZE) ارسال می‌شوند؛ پیش‌فرض Nginx فقط ۱ مگابایت است
+    client_max_body_size 10m;
+
     # فرانت‌اند (React)
     location / {
         root /var/www/talent/frontend/dist;
@@ -244,7 +278,7 @@ print_success "Nginx پیکربندی شد"
 
 # 12. بررسی وضعیت سرویس‌ها
 print_info "بررسی وضعیت سرویس‌ها..."
-supervisorctl status django-talent
+supervisorctl status django-talent celery-talent
 systemctl status nginx --no-pager -l
 
 echo ""
@@ -124,16 +124,16 @@ const Dashboard = () => {
     let completed = 0;
     const total = 5;
 
-    if (application.program_choices && application.program_choices.length > 0) completed++;
+    if (application.choices_count) completed++;
     if (user?.father_name && user?.birth_date && user?.gender) completed++;
-    if (application.education_records && application.education_records.length > 0) completed++;
+    if (application.education_records_count) completed++;
     if (
-      application.research_records &&
-      (application.research_records.length > 0 || ['MA_TALENT', 'OLYMPIAD'].includes(application.round_type))
+      application.research_summary?.total ||
+      ['MA_TALENT', 'OLYMPIAD'].includes(application.round_type)
     ) {
       completed++;
     }
-    if (application.documents && application.documents.length >= 4) completed++;
+    if ((application.documents_count ?? 0) >= 4) completed++;
 
     return Math.round((completed / total) * 100);
   };
@@ -2,7 +2,7 @@ import { useEffect, useState } from 'react';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Alert, AlertDescription } from '@/components/ui/alert';
 import { AlertCircle, CheckCircle, Loader2 } from 'lucide-react';
-import api from '@/services/api';
+import { findMyApplication } from '@/services/applicationService';
 import { toast } from '@/hooks/use-toast';
 
 interface Deficiency {
@@ -23,9 +23,7 @@ const Deficiencies = () => {
 
   const fetchDeficiencies = async () => {
     try {
-      const response = await api.get('/api/applications/');
-      const applications = Array.isArray(response.data) ? response.data : response.data.results || [];
-      const application = applications[0];
+      const application = await findMyApplication();
       
       if (application?.deficiencies) {
         setDeficiencies(application.deficiencies);
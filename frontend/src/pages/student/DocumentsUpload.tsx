@@ -10,6 +10,7 @@ import { toast } from '@/hooks/use-toast';
 import { Upload, FileText, CheckCircle2, X, AlertCircle } from 'lucide-react';
 import { FileUpload } from '@/components/ui/file-upload';
 import api from '@/services/api';
+import { findMyApplication } from '@/services/applicationService';
 
 interface Document {
   id: number;
@@ -55,10 +56,8 @@ const DocumentsUpload = () => {
 
   const fetchApplication = async () => {
     try {
-      const response = await api.get('/api/applications/');
-      const applications = Array.isArray(response.data) ? response.data : response.data.results || [];
-      if (applications.length > 0) {
-        const app = applications[0];
+      const app = await findMyApplication();
+      if (app) {
         setApplicationId(app.id);
         setDocuments(app.documents || []);
       }
@@ -21,6 +21,7 @@ import { toast } from '@/hooks/use-toast';
 import { GraduationCap, Save, Loader2, Check, ChevronsUpDown } from 'lucide-react';
 import { cn } from '@/lib/utils';
 import api from '@/services/api';
+import { findMyApplication } from '@/services/applicationService';
 
 interface University {
   id: number;
@@ -90,13 +91,11 @@ const EducationInfo = () => {
     try {
       setLoading(true);
       
-      const [appResponse, univResponse] = await Promise.all([
-        api.get('/api/applications/'),
+      const [application, univResponse] = await Promise.all([
+        findMyApplication(),
         api.get('/api/public/universities/'),
       ]);
       
-      const applications = Array.isArray(appResponse.data) ? appResponse.data : appResponse.data.results || [];
-      const application = applications[0];
       if (!application) {
         throw new Error('Application not found');
       }
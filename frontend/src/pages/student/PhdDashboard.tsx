@@ -28,6 +28,7 @@ import {
   Languages,
 } from 'lucide-react';
 import api from '@/services/api';
+import { findMyApplication } from '@/services/applicationService';
 import type { Application } from '@/types/models';
 
 interface PhdDashboardStats {
@@ -64,11 +65,8 @@ const PhdDashboard = () => {
   const fetchApplication = async () => {
     setLoading(true);
     try {
-      const response = await api.get<{ results: Application[] }>('/api/applications/');
-      
-      const applications = Array.isArray(response.data) ? response.data : response.data.results || [];
-      if (applications.length > 0) {
-        const app = applications[0];
+      const app = await findMyApplication();
+      if (app) {
         setApplication(app);
         calculateStats(app);
       }
@@ -112,9 +112,11 @@ const ProgramSelection = () => {
       setApplicationId(application.id);
       setRoundType(application.round_type);
       
-      // Get existing choices
-      if (application.choices && application.choices.length > 0) {
-        const existingChoices = application.choices.map((c: any) => ({
+      // Get existing choices (لیست پرونده‌ها فقط خلاصه است؛ انتخاب‌ها از جزئیات پرونده)
+      const detailResponse = await api.get(`/api/applications/${application.id}/`);
+      const choices = detailResponse.data.choices || [];
+      if (choices.length > 0) {
+        const existingChoices = choices.map((c: any) => ({
           id: c.id,
           program_id: c.program.id,
           priority: c.priority,
@@ -1,7 +1,6 @@
 import { useEffect, useState } from 'react';
 import { Navigate } from 'react-router-dom';
-import api from '@/services/api';
-import type { Application } from '@/types/models';
+import { findMyApplication } from '@/services/applicationService';
 import Dashboard from './Dashboard'; // Masters Dashboard
 import PhdDashboard from './PhdDashboard';
 
@@ -20,11 +19,8 @@ const StudentDashboard = () => {
   const detectRoundType = async () => {
     setLoading(true);
     try {
-      const response = await api.get<{ results: Application[] }>('/api/applications/');
-      
-      const applications = Array.isArray(response.data) ? response.data : response.data.results || [];
-      if (applications.length > 0) {
-        const app = applications[0];
+      const app = await findMyApplication();
+      if (app) {
         setRoundType(app.round.type);
       } else {
         // اگر application وجود نداشت، NEW user است
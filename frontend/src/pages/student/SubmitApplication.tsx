@@ -5,6 +5,7 @@ import { Alert, AlertDescription } from '@/components/ui/alert';
 import { Send, CheckCircle, AlertCircle, Loader2 } from 'lucide-react';
 import { useState } from 'react';
 import api from '@/services/api';
+import { getApplicationReadiness } from '@/services/applicationService';
 import { toast } from '@/hooks/use-toast';
 
 const SubmitApplication = () => {
@@ -24,6 +25,17 @@ const SubmitApplication = () => {
         throw new Error('Application not found');
       }
 
+      // بررسی آمادگی پیش از ارسال (همه موارد ناقص یک‌جا)
+      const readiness = await getApplicationReadiness(applicationId);
+      if (!readiness.ready) {
+        toast({
+          title: 'پرونده کامل نیست',
+          description: readiness.missing.map((item) => item.message).join('، '),
+          variant: 'destructive',
+        });
+        return;
+      }
+
       // Submit
       await api.post(`/api/applications/${applicationId}/submit/`);
       
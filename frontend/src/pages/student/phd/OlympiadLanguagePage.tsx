@@ -8,6 +8,7 @@ import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@
 import { toast } from '@/hooks/use-toast';
 import { Trophy, Languages, Plus, Trash2, Upload, Save } from 'lucide-react';
 import api from '@/services/api';
+import { findMyApplication } from '@/services/applicationService';
 import type { Application } from '@/types/models';
 
 interface OlympiadRecord {
@@ -45,10 +46,8 @@ const OlympiadLanguagePage = () => {
 
   const fetchApplication = async () => {
     try {
-      const response = await api.get('/api/applications/');
-      const applications = Array.isArray(response.data) ? response.data : [];
-      if (applications.length > 0) {
-        const app = applications[0];
+      const app = await findMyApplication();
+      if (app) {
         setApplicationId(app.id);
         
         // بارگذاری سوابق المپیاد و زبان اگر موجود باشند
@@ -9,6 +9,7 @@ import { Progress } from '@/components/ui/progress';
 import { toast } from '@/hooks/use-toast';
 import { Upload, FileText, CheckCircle2, X, AlertCircle } from 'lucide-react';
 import api from '@/services/api';
+import { findMyApplication } from '@/services/applicationService';
 
 interface Document {
   id: number;
@@ -46,10 +47,8 @@ const PhdEducationDocuments = () => {
 
   const fetchApplication = async () => {
     try {
-      const response = await api.get('/api/applications/');
-      const applications = Array.isArray(response.data) ? response.data : response.data.results || [];
-      if (applications.length > 0) {
-        const app = applications[0];
+      const app = await findMyApplication();
+      if (app) {
         setApplicationId(app.id);
         setDocuments(app.documents || []);
       }
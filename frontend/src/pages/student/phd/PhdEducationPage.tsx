@@ -11,6 +11,7 @@ import { toast } from '@/hooks/use-toast';
 import { GraduationCap, Upload, Save } from 'lucide-react';
 import { FileUpload } from '@/components/ui/file-upload';
 import api from '@/services/api';
+import { findMyApplication } from '@/services/applicationService';
 
 interface EducationForm {
   // کارشناسی
@@ -59,10 +60,8 @@ const PhdEducationPage = () => {
 
   const fetchApplication = async () => {
     try {
-      const response = await api.get('/api/applications/');
-      const applications = Array.isArray(response.data) ? response.data : response.data.results || [];
-      if (applications.length > 0) {
-        const app = applications[0];
+      const app = await findMyApplication();
+      if (app) {
         setApplicationId(app.id);
         
         // Load existing documents
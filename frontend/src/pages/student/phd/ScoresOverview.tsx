@@ -52,8 +52,9 @@ const ScoresOverview = () => {
       
       const applications = Array.isArray(response.data) ? response.data : response.data.results || [];
       if (applications.length > 0) {
-        const app = applications[0];
-        calculateScores(app);
+        // سوابق تحصیلی فقط در جزئیات پرونده برگردانده می‌شوند
+        const detailResponse = await api.get(`/api/applications/${applications[0].id}/`);
+        calculateScores(detailResponse.data);
       }
     } catch (error) {
       console.error('Error fetching scores:', error);
@@ -16,6 +16,7 @@
  */
 
 import api from './api';
+import { sha256File } from '@/lib/sha256';
 import type {
   Application,
   ApplicationChoice,
@@ -55,6 +56,22 @@ export interface BulkDocumentUploadRequest {
   onProgress?: (progress: DocumentUploadProgress[]) => void;
 }
 
+/**
+ * نشست آپلود تکه‌ای مدرک (received_size نقطه ادامه آپلود است)
+ */
+export interface DocumentUploadSession {
+  token: string;
+  type: DocumentType;
+  filename: string;
+  total_size: number;
+  checksum: string;
+  received_size: number;
+  chunk_size: number;
+  status: 'UPLOADING' | 'COMPLETED';
+  document: ApplicationDocument | null;
+  created_at: string;
+}
+
 /**
  * Application Submission Request
  */
@@ -68,15 +85,30 @@ export interface ApplicationSubmissionRequest {
 // ============================================
 
 /**
- * دریافت پرونده فعلی کاربر
+ * جزئیات کامل آخرین پرونده کاربر (یا null اگر پرونده‌ای ندارد)
+ *
+ * لیست /api/applications/ فقط خلاصه پرونده‌ها را برمی‌گرداند؛ انتخاب‌ها، سوابق،
+ * مدارک و فراخوان از endpoint جزئیات خوانده می‌شوند.
  */
-export const getMyApplication = async (): Promise<Application> => {
+export const findMyApplication = async (): Promise<Application | null> => {
   const response = await api.get('/api/applications/');
   const applications = Array.isArray(response.data) ? response.data : response.data.results || [];
   if (!applications.length) {
+    return null;
+  }
+  const detail = await api.get<Application>(`/api/applications/${applications[0].id}/`);
+  return detail.data;
+};
+
+/**
+ * دریافت پرونده فعلی کاربر (جزئیات کامل)
+ */
+export const getMyApplication = async (): Promise<Application> => {
+  const application = await findMyApplication();
+  if (!application) {
     throw new Error('Application not found');
   }
-  return applications[0];
+  return application;
 };
 
 /**
@@ -125,6 +157,21 @@ export const updateApplication = async (
   return response.data;
 };
 
+export interface ApplicationReadiness {
+  application_id: number;
+  round_type: string;
+  ready: boolean;
+  missing: { code: string; message: string }[];
+}
+
+/**
+ * بررسی آمادگی پرونده برای ارسال نهایی (بدون ارسال)
+ */
+export const getApplicationReadiness = async (id: number): Promise<ApplicationReadiness> => {
+  const response = await api.get<ApplicationReadiness>(`/api/applications/${id}/readiness/`);
+  return response.data;
+};
+
 /**
  * ارسال نهایی پرونده
  */
@@ -355,6 +402,69 @@ export const getDocuments = async (applicationId: number): Promise<ApplicationDo
   return response.data;
 };
 
+// فایل‌های بزرگ‌تر به صورت تکه‌ای و قابل ادامه آپلود می‌شوند
+const CHUNKED_UPLOAD_THRESHOLD = 4 * 1024 * 1024;
+
+/**
+ * آپلود تکه‌ای مدرک با امکان ادامه پس از قطع اتصال
+ *
+ * اگر نشست ناتمامی برای همین فایل (نوع، نام، حجم و checksum) وجود داشته باشد،
+ * آپلود از received_size آن ادامه می‌یابد.
+ */
+export const uploadDocumentResumable = async (
+  applicationId: number,
+  file: File,
+  documentType: DocumentType,
+  onProgress?: (progress: number) => void
+): Promise<ApplicationDocument> => {
+  const baseUrl = `/api/applications/${applicationId}/documents/uploads/`;
+  const checksum = await sha256File(file);
+
+  const pending = await api.get<DocumentUploadSession[]>(baseUrl);
+  let session = pending.data.find(
+    (item) =>
+      item.type === documentType &&
+      item.filename === file.name &&
+      item.total_size === file.size &&
+      item.checksum === checksum
+  );
+  if (!session) {
+    const created = await api.post<DocumentUploadSession>(baseUrl, {
+      type: documentType,
+      filename: file.name,
+      total_size: file.size,
+      checksum,
+    });
+    session = created.data;
+  }
+
+  const sessionUrl = `${baseUrl}${session.token}/`;
+  let offset = session.received_size;
+  while (offset < file.size) {
+    const chunk = file.slice(offset, offset + session.chunk_size);
+    try {
+      const response = await api.put<DocumentUploadSession>(sessionUrl, chunk, {
+        headers: {
+          'Content-Type': 'application/octet-stream',
+          'Upload-Offset': String(offset),
+        },
+      });
+      offset = response.data.received_size;
+    } catch (error: any) {
+      // offset نامطابق (مثلاً پس از قطع اتصال): ادامه از حجم دریافت‌شده در سرور
+      if (error?.response?.status === 409) {
+        offset = error.response.data.received_size;
+        continue;
+      }
+      throw error;
+    }
+    onProgress?.(Math.round((offset * 100) / file.size));
+  }
+
+  const response = await api.post<ApplicationDocument>(`${sessionUrl}complete/`);
+  return response.data;
+};
+
 /**
  * آپلود یک مدرک
  */
@@ -364,6 +474,10 @@ export const uploadDocument = async (
   documentType: DocumentType,
   onProgress?: (progress: number) => void
 ): Promise<ApplicationDocument> => {
+  if (file.size > CHUNKED_UPLOAD_THRESHOLD) {
+    return uploadDocumentResumable(applicationId, file, documentType, onProgress);
+  }
+
   const formData = new FormData();
   formData.append('file', file);
   formData.append('type', documentType);
@@ -769,10 +883,12 @@ export const isApplicationReadyForSubmission = (application: Application): {
 
 const applicationService = {
   // CRUD
+  findMyApplication,
   getMyApplication,
   getApplicationById,
   getApplications,
   updateApplication,
+  getApplicationReadiness,
   submitApplication,
   deleteApplication,
   
@@ -803,6 +919,7 @@ const applicationService = {
   // Documents
   getDocuments,
   uploadDocument,
+  uploadDocumentResumable,
   uploadDocumentsBulk,
   deleteDocument,
   downloadDocument,
@@ -499,6 +499,28 @@ export interface Application {
   // مدارک
   documents?: ApplicationDocument[];
   
+  // ============================================
+  // خلاصه پرونده (لیست /api/applications/)
+  // ============================================
+  round_title?: string;
+  steps?: Record<string, boolean>;
+  choices_count?: number;
+  education_records_count?: number;
+  documents_count?: number;
+  approved_documents_count?: number;
+  rejected_documents_count?: number;
+  research_summary?: {
+    research_articles: number;
+    patents: number;
+    festival_awards: number;
+    conference_articles: number;
+    books: number;
+    olympiad_records: number;
+    language_certificates: number;
+    has_masters_thesis: boolean;
+    total: number;
+  };
+  
   // ============================================
   // فیلدهای امتیازدهی
   // ============================================
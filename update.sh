@@ -28,8 +28,22 @@ print_success "کد به‌روز شد"
 
 # 2. به‌روزرسانی Backend
 print_info "به‌روزرسانی Backend..."
+
+# Redis: cache مشترک بین workerهای gunicorn (الزامی با DEBUG=False)
+if ! command -v redis-server > /dev/null; then
+    apt install -y redis-server
+fi
+systemctl enable --now redis-server
+
 cd backend
 source venv/bin/activate
+
+# فایل‌های .env قدیمی: افزودن cache مشترک
+if ! grep -q '^REDIS_URL=' .env; then
+    echo 'REDIS_URL=redis://127.0.0.1:6379/1' >> .env
+    print_success "REDIS_URL به .env اضافه شد"
+fi
+
 pip install -r requirements.txt
 python manage.py migrate
 python manage.py collectstatic --noinput
@@ -42,9 +56,41 @@ npm install --legacy-peer-deps
 npm run build
 print_success "Frontend به‌روز شد"
 
-# 4. ریستارت سرویس‌ها
+# 4. worker Celery برای خروجی‌های پس‌زمینه پرونده‌ها (ExportJob)
+print_info "پیکربندی worker Celery..."
+cat > /etc/supervisor/conf.d/celery-talent.conf << EOF
+[program:celery-talent]
+directory=/var/www/talent/backend
+command=/var/www/talent/backend/venv/bin/celery -A config worker -l info --concurrency 2
+user=root
+autostart=true
+autorestart=true
+stopwaitsecs=600
+stderr_logfile=/var/log/celery-talent.err.log
+stdout_logfile=/var/log/celery-talent.out.log
+EOF
+supervisorctl reread
+supervisorctl update
+
+# حذف هر ساعت خروجی‌های قدیمی (EXPORT_JOB_RETENTION_HOURS) و آپلودهای ناتمام
+# (DOCUMENT_UPLOAD_SESSION_TTL_HOURS) همراه فایل‌های .part آن‌ها
+cat > /etc/cron.d/talent << EOF
+0 * * * * root cd /var/www/talent/backend && venv/bin/python manage.py cleanup_export_jobs >> /var/log/talent-cleanup.log 2>&1
+30 * * * * root cd /var/www/talent/backend && venv/bin/python manage.py cleanup_document_uploads >> /var/log/talent-cleanup.log 2>&1
+EOF
+print_success "worker Celery پیکربندی شد"
+
+# 5. Nginx: تکه‌های آپلود مدارک (۲ مگابایت) از پیش‌فرض ۱ مگابایتی بزرگ‌ترند
+NGINX_SITE=/etc/nginx/sites-available/talent
+if [ -f "$NGINX_SITE" ] && ! grep -q 'client_max_body_size' "$NGINX_SITE"; then
+    sed -i '0,/server_name .*;/s//&\n    client_max_body_size 10m;/' "$NGINX_SITE"
+    print_success "client_max_body_size به کانفیگ Nginx اضافه شد"
+fi
+nginx -t
+
+# 6. ریستارت سرویس‌ها
 print_info "ریستارت سرویس‌ها..."
-supervisorctl restart django-talent
+supervisorctl restart django-talent celery-talent
 systemctl restart nginx
 print_success "سرویس‌ها ریستارت شدند"
 